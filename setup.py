@@ -38,6 +38,10 @@ setup(
     ],
     extras_require={
         "selenium": ["selenium>=4.0.0"],
+        "xxhash": ["xxhash>=3.0.0"],
+        "lxml": ["lxml>=4.6.0"],
+        "aiohttp": ["aiohttp>=3.8.0"],
+        "orjson": ["orjson>=3.6.0"],
         "dev": [
             "pytest>=6.0.0",
             "flake8>=3.9.0",
@@ -0,0 +1,19 @@
+"""
+Tests for the colors suggested by the contrast criterion.
+"""
+
+import pytest
+
+from wcag22_validator.criteria.criterion_1_4_3 import adjust_color_for_contrast, contrast_ratio
+
+
+@pytest.mark.parametrize("fg_color, bg_color", [
+    ((0x77, 0x77, 0x77), (0x88, 0x88, 0x88)),
+    ((255, 0, 0), (255, 0, 0)),
+    ((100, 100, 100), (30, 30, 30)),
+    ((200, 200, 200), (255, 255, 255)),
+])
+def test_adjusted_color_meets_the_ratio(fg_color, bg_color):
+    adjusted = adjust_color_for_contrast(fg_color, bg_color, 4.5)
+    
+    assert contrast_ratio(adjusted, bg_color) >= 4.5
@@ -0,0 +1,91 @@
+"""
+Tests for URL normalization and link extraction of the website crawler,
+and for finding HTML files in directories.
+"""
+
+import logging
+import os
+
+import pytest
+
+from wcag22_validator.validator import WCAGValidator
+from wcag22_validator.performance import (
+    WebsiteCrawler, compile_url_patterns, iter_html_files, normalize_url
+)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Example.COM:80/a#top", "http://example.com/a"),
+    ("https://example.com:443", "https://example.com/"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("http://user:pw@example.com/a", "http://user:pw@example.com/a"),
+    ("http://[::1]:8000/a", "http://[::1]:8000/a"),
+    ("http://[::1]/a", "http://[::1]/a"),
+    ("http://example.com/a?b=2&a=1", "http://example.com/a?a=1&b=2"),
+    ("http://example.com/a?flag", "http://example.com/a?flag"),
+    ("http://example.com/a?q=a%20b&flag", "http://example.com/a?flag&q=a%20b"),
+    ("http://example.com/a?utm_source=x&UTM_medium=y&id=3", "http://example.com/a?id=3"),
+    ("http://example.com/a?utm_source=x", "http://example.com/a"),
+])
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+@pytest.mark.parametrize("url", [
+    "http://localhost:99999/bad",
+    "http://localhost:abc/bad",
+])
+def test_normalize_url_invalid_port(url):
+    with pytest.raises(ValueError):
+        normalize_url(url)
+
+
+@pytest.fixture
+def crawler():
+    crawler = WebsiteCrawler(WCAGValidator(log_level=logging.WARNING))
+    crawler.domain = "http://example.com"
+    return crawler
+
+
+def test_extract_links(crawler):
+    html = """
+    <a href="/a">A</a>
+    <a href="/a#section">A again</a>
+    <a href="b?utm_source=x">B</a>
+    <a href="#top">Anchor</a>
+    <a href="mailto:someone@example.com">Mail</a>
+    <a href="javascript:void(0)">Script</a>
+    <a href="http://other.example.com/c">Other domain</a>
+    <a href="http://localhost:99999/bad">Bad port</a>
+    <a href="http://[::1/bad">Bad IPv6 host</a>
+    <a href="/d?flag">D</a>
+    """
+    
+    assert crawler._extract_links("http://example.com/index.html", html) == [
+        "http://example.com/a",
+        "http://example.com/b",
+        "http://example.com/d?flag",
+    ]
+    
+    # Links already seen are not returned again
+    assert crawler._extract_links("http://example.com/", html) == []
+
+
+def test_extract_links_patterns(crawler):
+    crawler.include_pattern = compile_url_patterns([r"/docs/"])
+    crawler.exclude_pattern = compile_url_patterns([r"\.pdf$"])
+    html = '<a href="/docs/a">A</a><a href="/docs/b.pdf">B</a><a href="/blog/c">C</a>'
+    
+    assert crawler._extract_links("http://example.com/", html) == ["http://example.com/docs/a"]
+
+
+def test_iter_html_files_enters_directories_named_like_html_files(tmp_path):
+    (tmp_path / "site.html").mkdir()
+    (tmp_path / "site.html" / "a.html").write_text("<p>a</p>")
+    (tmp_path / "site.html" / "b.HTM").write_text("<p>b</p>")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "index.html").write_text("<p>index</p>")
+    
+    found = sorted(os.path.relpath(path, tmp_path) for path in iter_html_files(str(tmp_path)))
+    
+    assert found == ["index.html", os.path.join("site.html", "a.html"), os.path.join("site.html", "b.HTM")]
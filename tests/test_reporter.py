@@ -0,0 +1,70 @@
+"""
+Tests for the issue groupings and JSON output of the reporter.
+"""
+
+from wcag22_validator.reporter import ValidationIssue, WCAGReporter
+
+
+def make_issue(criterion_id="1.1.1", level="A", impact="serious"):
+    return ValidationIssue(
+        criterion_id=criterion_id,
+        criterion_name="Test",
+        level=level,
+        element_path="img",
+        element_html="<img>",
+        impact=impact,
+    )
+
+
+def test_groups_follow_added_and_changed_issues():
+    reporter = WCAGReporter()
+    reporter.add_issue(make_issue(impact="critical"))
+    assert list(reporter.get_issues_by_impact()) == ["critical"]
+    
+    reporter.add_issues([make_issue("2.4.7", "AA", "moderate")])
+    assert reporter.get_issues_by_level() == {"A": [reporter.issues[0]], "AA": [reporter.issues[1]]}
+    
+    reporter.issues[0] = make_issue(impact="minor")
+    reporter.issues[1].impact = "minor"
+    assert reporter.get_issues_by_impact() == {"minor": reporter.issues}
+
+
+def test_changing_groups_does_not_change_reports():
+    reporter = WCAGReporter()
+    reporter.add_issues([make_issue(), make_issue("4.1.2")])
+    summary = reporter.summary()
+    
+    reporter.get_issues_by_impact()["serious"].clear()
+    reporter.get_issues_by_criterion().clear()
+    
+    assert reporter.summary() == summary
+    assert len(reporter.get_issues_by_impact()["serious"]) == 2
+    assert reporter.to_dict()["issues_by_criterion"].keys() == {"1.1.1", "4.1.2"}
+
+
+def test_reports_follow_issues_changed_in_place():
+    reporter = WCAGReporter()
+    reporter.add_issue(make_issue())
+    summary = reporter.summary()
+    assert "- Serious: 1 issues" in summary
+    
+    reporter.issues[0].impact = "critical"
+    
+    assert reporter.summary() != summary
+    assert "- Critical: 1 issues" in reporter.summary()
+    assert "- Serious" not in reporter.summary()
+    report = reporter.to_dict()
+    assert list(report["issues_by_impact"]) == ["critical"]
+    assert report["issues_by_impact"]["critical"][0]["impact"] == "critical"
+
+
+def test_json_writes_non_ascii_as_is():
+    reporter = WCAGReporter()
+    issue = make_issue()
+    issue.element_html = '<img alt="café – 日本">'
+    reporter.add_issue(issue)
+    
+    text = reporter.to_json()
+    assert '<img alt=\\"café – 日本\\">' in text
+    assert "".join(reporter.iter_json()) == text
+    assert b"".join(reporter.iter_json_bytes()) == text.encode("utf-8")
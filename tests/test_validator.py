@@ -0,0 +1,36 @@
+"""
+Tests for the lifetime of documents validated by the validator.
+"""
+
+import gc
+import logging
+
+from bs4 import BeautifulSoup
+
+from wcag22_validator.validator import WCAGValidator
+
+
+def count_parse_trees():
+    gc.collect()
+    return sum(isinstance(obj, BeautifulSoup) for obj in gc.get_objects())
+
+
+def test_issues_do_not_keep_the_document_alive():
+    validator = WCAGValidator(log_level=logging.WARNING)
+    before = count_parse_trees()
+    
+    reporter = validator.validate_html('<html><body><img src="chart.png"><a href="/">x</a></body></html>')
+    
+    assert reporter.issues
+    assert count_parse_trees() == before
+    assert all(isinstance(issue.element_html, str) for issue in reporter.issues)
+
+
+def test_cached_style_checks_do_not_keep_the_document_alive():
+    validator = WCAGValidator(log_level=logging.WARNING)
+    before = count_parse_trees()
+    
+    validator.validate_html('<html><head><style>a:focus { color: red }</style></head>'
+                            '<body><a href="/">x</a></body></html>')
+    
+    assert count_parse_trees() == before
@@ -12,7 +12,18 @@ from typing import Optional, List, Dict
 from urllib.parse import urlparse
 
 from .validator import WCAGValidator
-from .performance import ParallelValidator, WebsiteCrawler, BatchProcessor
+from .reporter import WCAGReporter
+from .performance import (ParallelValidator, WebsiteCrawler, BatchProcessor,
+                          compile_url_patterns, iter_html_files, validate_files_in_processes)
+
+
+# Report format -> function producing the report in chunks
+REPORT_FORMATTERS = {
+    "text": lambda reporter: iter([reporter.summary()]),
+    "json": WCAGReporter.iter_json,
+    "html": WCAGReporter.iter_html,
+    "markdown": WCAGReporter.iter_markdown,
+}
 
 
 def parse_args():
@@ -42,7 +53,7 @@ def parse_args():
     parser.add_argument(
         "--format",
         "-f",
-        choices=["text", "json", "html", "markdown"],
+        choices=list(REPORT_FORMATTERS),
         default="text",
         help="Output format for the report (default: text)",
     )
@@ -87,7 +98,7 @@ def parse_args():
         "-w",
         type=int,
         default=4,
-        help="Number of worker threads for parallel processing (default: 4)",
+        help="Number of worker threads or processes for parallel processing (default: 4)",
     )
     
     parser.add_argument(
@@ -96,6 +107,21 @@ def parse_args():
         help="Disable caching of validation results",
     )
     
+    parser.add_argument(
+        "--parser",
+        choices=["html.parser", "lxml"],
+        default="html.parser",
+        help="HTML parser to use; lxml is faster but line numbers are estimated (default: html.parser)",
+    )
+    
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=0,
+        help="Number of validation results to keep in memory, keyed by HTML content; "
+             "cached results are built in full up front (default: 0, disabled)",
+    )
+    
     parser.add_argument(
         "--batch-size",
         type=int,
@@ -156,6 +182,8 @@ def main():
         criteria_to_include=args.include,
         criteria_to_exclude=args.exclude,
         log_level=log_level,
+        cache_size=0 if args.no_cache else args.cache_size,
+        parser=args.parser,
     )
     
     # Check if input is a URL
@@ -176,23 +204,21 @@ def main():
                 max_pages=args.max_pages,
                 max_depth=args.max_depth,
                 concurrency=args.workers,
-                include_patterns=args.include_urls,
-                exclude_patterns=args.exclude_urls,
-                use_cache=not args.no_cache
+                include_patterns=compile_url_patterns(args.include_urls),
+                exclude_patterns=compile_url_patterns(args.exclude_urls)
             )
             
             results = crawler.crawl(args.input)
             
             # Create an aggregated reporter for all pages
-            from .reporter import WCAGReporter
             reporter = WCAGReporter()
             reporter.url = args.input
             
             # Add issues and errors from all pages
             for url, page_reporter in results.items():
                 for issue in page_reporter.issues:
-                    # Add URL to the description
-                    issue.description = f"[{url}] {issue.description}"
+                    # Record which page the issue was found on
+                    issue.source_url = url
                     reporter.add_issue(issue)
                 for criterion_id, error in page_reporter.errors.items():
                     reporter.add_error(criterion_id, f"[{url}] {error}")
@@ -223,27 +249,18 @@ def main():
                 reporter = processor.aggregate_results(results)
                 logger.info(f"Validated {len(results)} files with {reporter.total_issues} total issues")
             else:
-                # Sequential processing (original implementation)
-                reporter = None
-                html_files = []
+                # Validate each file in a process pool as it is found and merge the results
+                file_reporters = validate_files_in_processes(validator, iter_html_files(args.input),
+                                                             max_workers=args.workers)
                 
-                for root, _, files in os.walk(args.input):
-                    for file in files:
-                        if file.lower().endswith((".html", ".htm")):
-                            html_files.append(os.path.join(root, file))
-                
-                if not html_files:
+                if not file_reporters:
                     logger.error(f"No HTML files found in directory: {args.input}")
                     sys.exit(1)
-                    
-                # Validate first file
-                reporter = validator.validate_file(html_files[0])
                 
-                # Validate other files and aggregate results
-                for file in html_files[1:]:
-                    file_reporter = validator.validate_file(file)
-                    for issue in file_reporter.issues:
-                        reporter.add_issue(issue)
+                # Aggregate results into the first file's reporter
+                reporter = file_reporters[0]
+                for file_reporter in file_reporters[1:]:
+                    reporter.add_issues(file_reporter.issues)
                     for criterion_id, error in file_reporter.errors.items():
                         reporter.add_error(criterion_id, error)
         else:
@@ -253,23 +270,28 @@ def main():
     # Record execution time
     reporter.execution_time = time.time() - start_time
     
-    # Generate report
-    if args.format == "text":
-        report = reporter.summary()
-    elif args.format == "json":
-        report = reporter.to_json()
-    elif args.format == "html":
-        report = reporter.to_html()
-    elif args.format == "markdown":
-        report = reporter.to_markdown()
+    # Generate report in chunks so large reports are not held in memory twice
+    report_chunks = REPORT_FORMATTERS[args.format](reporter)
     
     # Output report
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(report)
+        if args.format == "json":
+            # Write the encoded JSON directly, skipping a str round trip
+            with open(args.output, "wb") as f:
+                f.writelines(reporter.iter_json_bytes())
+        else:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.writelines(report_chunks)
         print(f"Report saved to {args.output}")
+    elif args.format == "json" and hasattr(sys.stdout, "buffer"):
+        # Stream the encoded JSON to the binary stdout so the bytes match -o
+        sys.stdout.flush()
+        sys.stdout.buffer.writelines(reporter.iter_json_bytes())
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
     else:
-        print(report)
+        sys.stdout.writelines(report_chunks)
+        sys.stdout.write("\n")
     
     # Exit with error code if issues were found
     if reporter.has_issues:
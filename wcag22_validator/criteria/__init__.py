@@ -2,4 +2,4 @@
 WCAG 2.2 criteria modules.
 """
 
-from .base import BaseCriterion
\ No newline at end of file
+from .base import BaseCriterion, DocumentCache, document_cache
\ No newline at end of file
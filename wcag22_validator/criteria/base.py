@@ -3,29 +3,199 @@ Base class for WCAG 2.2 criteria.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from contextlib import contextmanager
+from collections import defaultdict
+import functools
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import bisect
+import re
+import threading
+from bs4 import BeautifulSoup, Tag
+import soupsieve
 
 from ..reporter import ValidationIssue
 
 
+# Holds the DocumentCache of the document currently being validated, per thread
+_document_state = threading.local()
+
+
+# Selector made of a tag name with only attribute, pseudo-class, class or id
+# conditions on the same element, e.g. 'input:not([type="hidden"])'
+_SIMPLE_SELECTOR_PATTERN = re.compile(r'([a-zA-Z][\w-]*)(?:[\[:.#][^\s,>+~]*)?$')
+
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(selector: str) -> Tuple[soupsieve.SoupSieve, Optional[str]]:
+    """
+    Compile a CSS selector once per process.
+    
+    Args:
+        selector: CSS selector string.
+        
+    Returns:
+        Tuple of (compiled selector, tag name every match must have or None).
+    """
+    match = _SIMPLE_SELECTOR_PATTERN.match(selector.strip())
+    tag_name = match.group(1).lower() if match else None
+    return soupsieve.compile(selector), tag_name
+
+
+class DocumentCache:
+    """
+    Per-document memo of values derived from parsed elements.
+    
+    Entries are keyed by id(element), so a cache is only valid while the
+    document it was built for is alive. Use document_cache() to scope it.
+    """
+    
+    def __init__(self, document: Optional[BeautifulSoup] = None):
+        """
+        Initialize empty caches.
+        
+        Args:
+            document: Parsed document the cache belongs to, if known.
+        """
+        self.document = document
+        self.element_paths: Dict[int, str] = {}
+        self.element_html: Dict[int, str] = {}
+        # (id(parent), tag name) -> {id(child): (1-based index, has same-type siblings)}
+        self.sibling_indexes: Dict[Tuple[int, str], Dict[int, Tuple[int, bool]]] = {}
+        # All tags of the document in document order, and the same grouped by name
+        self._tags: Optional[List[Tag]] = None
+        self._tags_by_name: Dict[str, List[Tag]] = {}
+        # Source positions for parsers that don't record line numbers, built
+        # on first use: newline offsets, start tag offsets and tag ordinals by name
+        self._line_source: Optional[str] = None
+        self._newline_offsets: List[int] = []
+        self._start_tag_offsets: Dict[str, List[int]] = {}
+        self._tag_ordinals: Dict[str, Dict[int, int]] = {}
+        
+    def get_tags(self, names: Tuple[str, ...] = ()) -> List[Tag]:
+        """
+        Get tags of the document, in document order.
+        
+        The document is walked once, on first use, and the result is shared
+        by all criteria instead of each running its own find_all.
+        
+        Args:
+            names: Tag names to return, or an empty tuple for all tags.
+            
+        Returns:
+            List of matching tags. The list must not be modified.
+        """
+        if self._tags is None:
+            tags = []
+            tags_by_name = defaultdict(list)
+            for element in self.document.descendants:
+                if isinstance(element, Tag):
+                    tags.append(element)
+                    tags_by_name[element.name].append(element)
+            self._tags = tags
+            self._tags_by_name = dict(tags_by_name)
+            
+        if not names:
+            return self._tags
+        if len(names) == 1:
+            return self._tags_by_name.get(names[0], [])
+        
+        wanted = set(names)
+        return [tag for tag in self._tags if tag.name in wanted]
+        
+    def find_source_line(self, element: Tag, html_content: str) -> Optional[int]:
+        """
+        Estimate the line of an element's start tag in the HTML source.
+        
+        The n-th tag with a given name in the document is matched to the n-th
+        start tag with that name in the source, and its line is looked up in
+        an index of newline offsets. Tags inside comments or scripts, or tags
+        added by the parser, can make the result inaccurate.
+        
+        Args:
+            element: Tag of the document.
+            html_content: HTML source the document was parsed from.
+            
+        Returns:
+            1-based line number if found, None otherwise.
+        """
+        if html_content is not self._line_source:
+            self._line_source = html_content
+            self._newline_offsets = [match.start() for match in re.finditer('\n', html_content)]
+            self._start_tag_offsets = {}
+            
+        name = element.name
+        ordinals = self._tag_ordinals.get(name)
+        if ordinals is None:
+            ordinals = {id(tag): i for i, tag in enumerate(self.get_tags((name,)))}
+            self._tag_ordinals[name] = ordinals
+            
+        offsets = self._start_tag_offsets.get(name)
+        if offsets is None:
+            pattern = re.compile(rf'<{re.escape(name)}(?=[\s/>])', re.IGNORECASE)
+            offsets = [match.start() for match in pattern.finditer(html_content)]
+            self._start_tag_offsets[name] = offsets
+            
+        ordinal = ordinals.get(id(element))
+        if ordinal is None or ordinal >= len(offsets):
+            return None
+        return bisect.bisect_left(self._newline_offsets, offsets[ordinal]) + 1
+
+
+@contextmanager
+def document_cache(document: Optional[BeautifulSoup] = None):
+    """
+    Share a fresh DocumentCache between all criteria run on one document.
+    
+    The cache is installed for the current thread only and is discarded
+    when the block exits.
+    
+    Args:
+        document: Parsed document being validated. Needed for find_elements()
+            to use the shared tag index.
+    
+    Yields:
+        The installed DocumentCache.
+    """
+    previous = getattr(_document_state, 'cache', None)
+    cache = DocumentCache(document)
+    _document_state.cache = cache
+    try:
+        yield cache
+    finally:
+        _document_state.cache = previous
+
+
+def get_document_cache() -> Optional[DocumentCache]:
+    """
+    Get the DocumentCache of the document being validated on this thread.
+    
+    Returns:
+        The active DocumentCache, or None outside of document_cache().
+    """
+    return getattr(_document_state, 'cache', None)
+
+
 class BaseCriterion(ABC):
     """
     Base class for all WCAG 2.2 criteria.
     
     Each criterion must implement the validate method to check
-    HTML content against specific WCAG requirements.
+    HTML content against specific WCAG requirements. Criteria must not keep
+    per-document state, as one instance is shared by all validators.
     """
     
-    def __init__(self):
-        """Initialize the criterion."""
-        # These will be set by implementing classes
-        self.id = ""  # e.g., "1.1.1"
-        self.name = ""  # e.g., "Non-text Content"
-        self.level = ""  # "A", "AA", or "AAA"
-        self.description = ""
-        self.url = ""  # Reference URL to WCAG documentation
-        
+    # These are set as class attributes by implementing classes
+    id = ""  # e.g., "1.1.1"
+    name = ""  # e.g., "Non-text Content"
+    level = ""  # "A", "AA", or "AAA"
+    description = ""
+    url = ""  # Reference URL to WCAG documentation
+    
+    # Tag names of which at least one must occur in a page for this criterion
+    # to find anything; pages without any of them skip the criterion.
+    # Empty means the criterion always runs.
+    REQUIRED_TAGS: Tuple[str, ...] = ()
+    
     @abstractmethod
     def validate(self, soup: BeautifulSoup, html_content: str) -> List[ValidationIssue]:
         """
@@ -43,11 +213,11 @@ class BaseCriterion(ABC):
     def create_issue(
         self,
         element_path: str,
-        element_html: str,
+        element_html: Union[str, Callable[[], str]],
         description: str,
         impact: str = "serious",
         how_to_fix: str = "",
-        code_solution: str = "",
+        code_solution: Union[str, Callable[[], str]] = "",
         line_number: Optional[int] = None,
         column_number: Optional[int] = None
     ) -> ValidationIssue:
@@ -56,11 +226,13 @@ class BaseCriterion(ABC):
         
         Args:
             element_path: XPath or CSS selector to identify the element.
-            element_html: HTML snippet of the element.
+            element_html: HTML snippet of the element, or a callable building it
+                when the issue's element_html is first read.
             description: Description of the issue.
             impact: Impact level ('critical', 'serious', 'moderate', or 'minor').
             how_to_fix: Guide on how to fix the issue.
-            code_solution: Example code solution.
+            code_solution: Example code solution, or a callable building it when
+                the issue's code_solution is first read.
             line_number: Line number in the source code.
             column_number: Column number in the source code.
             
@@ -82,10 +254,112 @@ class BaseCriterion(ABC):
             ref_url=self.url
         )
     
+    def create_element_issue(
+        self,
+        element: Tag,
+        html_content: str,
+        description: str,
+        impact: str = "serious",
+        how_to_fix: str = "",
+        code_solution: Union[str, Callable[[], str]] = ""
+    ) -> ValidationIssue:
+        """
+        Create a ValidationIssue for an element of the document.
+        
+        The element's path and line number are only worked out here, so checks
+        don't pay for them on elements without issues. Its HTML, which means
+        serializing its whole subtree, is built when first read, and at the
+        latest before WCAGValidator.validate_html returns.
+        
+        Args:
+            element: BeautifulSoup element the issue is about.
+            html_content: Original HTML content.
+            description: Description of the issue.
+            impact: Impact level ('critical', 'serious', 'moderate', or 'minor').
+            how_to_fix: Guide on how to fix the issue.
+            code_solution: Example code solution, or a callable building it when
+                the issue's code_solution is first read.
+        
+        Returns:
+            ValidationIssue object.
+        """
+        return self.create_issue(
+            element_path=self.get_element_path(element),
+            element_html=functools.partial(self.get_element_html, element, get_document_cache()),
+            description=description,
+            impact=impact,
+            how_to_fix=how_to_fix,
+            code_solution=code_solution,
+            line_number=self.get_line_number(element, html_content)
+        )
+    
+    def find_elements(self, soup: BeautifulSoup, *names: str) -> List[Tag]:
+        """
+        Find all tags with the given names, in document order.
+        
+        Equivalent to soup.find_all(names), but when soup is the document
+        being validated, the tags come from a single walk of the document
+        shared by all criteria.
+        
+        Args:
+            soup: BeautifulSoup object or tag to search in.
+            *names: Tag names to find. All tags are returned if none are given.
+            
+        Returns:
+            List of matching tags. The list must not be modified.
+        """
+        cache = get_document_cache()
+        if cache is not None and cache.document is soup:
+            return cache.get_tags(names)
+        return soup.find_all(list(names) if names else True)
+        
+    def select_elements(self, soup: BeautifulSoup, selector: str) -> List[Tag]:
+        """
+        Find all tags matching a CSS selector, in document order.
+        
+        Equivalent to soup.select(selector), but the selector is compiled
+        only once. When soup is the document being validated and the selector
+        starts with a tag name, only tags of that name from the shared tag
+        index are tested instead of walking the tree.
+        
+        Args:
+            soup: BeautifulSoup object or tag to search in.
+            selector: CSS selector string.
+            
+        Returns:
+            List of matching tags.
+        """
+        compiled, tag_name = compile_selector(selector)
+        cache = get_document_cache()
+        if tag_name is not None and cache is not None and cache.document is soup:
+            # Only tags with the right name can match, test just those
+            return [tag for tag in cache.get_tags((tag_name,)) if compiled.match(tag)]
+        return compiled.select(soup)
+        
+    def has_text(self, element: Tag) -> bool:
+        """
+        Check if an element contains any non-whitespace text.
+        
+        Stops at the first text found instead of joining all of the
+        element's text like element.get_text() does.
+        
+        Args:
+            element: BeautifulSoup tag
+            
+        Returns:
+            True if the element has text content, False otherwise
+        """
+        return next(element.stripped_strings, None) is not None
+    
     def get_element_path(self, element) -> str:
         """
         Generate a CSS selector path for an element.
         
+        The path is built in a single upward walk that stops at the first
+        ancestor with an id or an already cached path. Paths are memoized in
+        the active DocumentCache, so ancestors shared by many elements are
+        only resolved once per document.
+        
         Args:
             element: BeautifulSoup element.
             
@@ -97,50 +371,123 @@ class BaseCriterion(ABC):
             
         if element.name == '[document]':
             return ""
+        
+        cache = get_document_cache()
+        paths = cache.element_paths if cache is not None else {}
+        
+        # Collect the ancestors whose paths still need to be built
+        chain = []
+        node = element
+        while True:
+            path = paths.get(id(node))
+            if path is not None:
+                break
+                
+            if node.get('id'):
+                path = f"#{node['id']}"
+                break
+                
+            parent = node.parent
+            if not parent or parent.name == '[document]':
+                path = node.name
+                break
+                
+            chain.append(node)
+            node = parent
+        
+        paths[id(node)] = path
+        
+        # Extend the path back down to the element
+        for node in reversed(chain):
+            # Get index of element among siblings of same type
+            index, has_siblings = self._get_sibling_index(node, cache)
             
-        if element.get('id'):
-            return f"#{element['id']}"
-            
-        if element.parent:
-            parent_path = self.get_element_path(element.parent)
-            if parent_path:
-                # Get index of element among siblings of same type
-                siblings = element.parent.find_all(element.name, recursive=False)
-                index = siblings.index(element) + 1
+            if has_siblings:
+                path = f"{path} > {node.name}:nth-of-type({index})"
+            else:
+                path = f"{path} > {node.name}"
                 
-                if len(siblings) > 1:
-                    return f"{parent_path} > {element.name}:nth-of-type({index})"
-                else:
-                    return f"{parent_path} > {element.name}"
+            paths[id(node)] = path
+            
+        return path
+    
+    def _get_sibling_index(self, element, cache: Optional[DocumentCache]) -> Tuple[int, bool]:
+        """
+        Get the position of an element among its parent's children of the same type.
+        
+        Args:
+            element: BeautifulSoup element with a parent.
+            cache: Active DocumentCache, or None.
             
-        return element.name
+        Returns:
+            Tuple of (1-based index, whether the parent has other children of the same type).
+        """
+        name = element.name
+        if cache is None:
+            index = 1 + sum(1 for sibling in element.previous_siblings
+                            if getattr(sibling, 'name', None) == name)
+            has_siblings = index > 1 or any(getattr(sibling, 'name', None) == name
+                                            for sibling in element.next_siblings)
+            return index, has_siblings
+        
+        key = (id(element.parent), name)
+        indexes = cache.sibling_indexes.get(key)
+        if indexes is None:
+            sibling_ids = [id(child) for child in element.parent.children
+                           if getattr(child, 'name', None) == name]
+            has_siblings = len(sibling_ids) > 1
+            indexes = {sibling_id: (i, has_siblings) for i, sibling_id in enumerate(sibling_ids, 1)}
+            cache.sibling_indexes[key] = indexes
+            
+        return indexes[id(element)]
+        
+    def get_element_html(self, element, cache: Optional[DocumentCache] = None) -> str:
+        """
+        Get the HTML of an element.
+        
+        Serializing an element walks its whole subtree, so the result is
+        memoized in the DocumentCache for issues and code solutions that
+        show the same element.
+        
+        Args:
+            element: BeautifulSoup element.
+            cache: DocumentCache of the element's document, defaults to the
+                active one. Given when the HTML may be built after the
+                document's cache is no longer active.
+            
+        Returns:
+            HTML string of the element.
+        """
+        if cache is None:
+            cache = get_document_cache()
+        if cache is None:
+            return str(element)
+        
+        html = cache.element_html.get(id(element))
+        if html is None:
+            html = str(element)
+            cache.element_html[id(element)] = html
+        return html
         
     def get_line_number(self, element, html_content: str) -> Optional[int]:
         """
-        Try to find the line number for an element in the HTML content.
+        Get the line number of an element in the HTML content.
+        
+        Line numbers are recorded by the parser while building the tree
+        (BeautifulSoup's sourceline), so no searching of the HTML is needed.
+        Parsers that don't record them (e.g. lxml) fall back to an estimate
+        from the active DocumentCache.
         
         Args:
             element: BeautifulSoup element.
             html_content: Original HTML content.
             
         Returns:
-            Line number if found, None otherwise.
+            Line number if known, None otherwise.
         """
-        try:
-            # This is approximate and may not work perfectly in all cases
-            if hasattr(element, 'sourceline'):
-                return element.sourceline
-                
-            # Alternative approach using string search
-            # This is very basic and won't work well for complex HTML
-            element_str = str(element)
-            pos = html_content.find(element_str)
-            
-            if pos != -1:
-                # Count newlines up to this position
-                return html_content[:pos].count('\n') + 1
-                
-        except Exception:
-            pass
-            
-        return None
\ No newline at end of file
+        line_number = getattr(element, 'sourceline', None)
+        if line_number is None and html_content and isinstance(element, Tag):
+            cache = get_document_cache()
+            if cache is not None and cache.document is not None:
+                return cache.find_source_line(element, html_content)
+        return line_number
@@ -5,7 +5,8 @@ All non-text content that is presented to the user has a text alternative
 that serves the equivalent purpose.
 """
 
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
+import functools
 import re
 from bs4 import BeautifulSoup, Tag
 
@@ -13,6 +14,51 @@ from .base import BaseCriterion
 from ..reporter import ValidationIssue
 
 
+# Alt text that looks like a filename: ends in an image file extension, or is
+# a single word of filename characters containing an underscore or hyphen
+_FILENAME_PATTERN = (
+    r'.*\.(?:jpe?g|png|gif|webp|svg|bmp|tiff?)$'
+    r'|(?-i:(?=[a-zA-Z0-9]*[_-])[a-zA-Z0-9_-]+)$'
+)
+
+
+# Strings int() accepts: optionally signed digits, with single underscores
+# between digits and surrounding whitespace
+_INTEGER_RE = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*\Z')
+
+
+def _format_attributes(attrs: dict, exclude: Tuple[str, ...] = ()) -> str:
+    """
+    Format tag attributes as they would appear in an HTML start tag.
+    
+    Args:
+        attrs: Attribute names and values
+        exclude: Names of attributes to leave out
+        
+    Returns:
+        Space-separated name="value" pairs
+    """
+    return ' '.join(['%s="%s"' % item for item in attrs.items() if item[0] not in exclude])
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """
+    Parse an integer attribute value like int() does.
+    
+    The value is checked before converting it, so values that are not
+    integers don't go through exception handling.
+    
+    Args:
+        value: Attribute value
+        
+    Returns:
+        The integer, or None if the value is not one (e.g. "100%" or "auto")
+    """
+    if value.isdecimal() or _INTEGER_RE.match(value):
+        return int(value)
+    return None
+
+
 class Criterion_1_1_1(BaseCriterion):
     """
     Implements WCAG 2.2 Success Criterion 1.1.1: Non-text Content.
@@ -21,29 +67,38 @@ class Criterion_1_1_1(BaseCriterion):
     has appropriate text alternatives.
     """
     
-    def __init__(self):
-        super().__init__()
-        self.id = "1.1.1"
-        self.name = "Non-text Content"
-        self.level = "A"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/non-text-content.html"
-        self.description = """
-        All non-text content that is presented to the user has a text alternative
-        that serves the equivalent purpose, except for the situations listed in the
-        WCAG documentation.
-        """
-        
-        # Common decorative class names
-        self.decorative_classes = {
-            'decorative', 'decoration', 'ornament', 'bg', 'background',
-            'icon-decorative', 'visual-separator', 'separator',
-        }
-        
-        # Placeholder alt texts that don't provide meaningful alternatives
-        self.placeholder_alt_texts = {
-            'image', 'photo', 'picture', 'pic', 'graphic', 'logo', 'icon',
-            'img', 'photograph', 'photograph of', 'image of', 'picture of',
-        }
+    id = "1.1.1"
+    name = "Non-text Content"
+    level = "A"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/non-text-content.html"
+    description = """
+    All non-text content that is presented to the user has a text alternative
+    that serves the equivalent purpose, except for the situations listed in the
+    WCAG documentation.
+    """
+    
+    REQUIRED_TAGS = ('img', 'svg', 'area', 'input', 'canvas', 'object')
+    
+    # Common decorative class names
+    DECORATIVE_CLASSES = frozenset({
+        'decorative', 'decoration', 'ornament', 'bg', 'background',
+        'icon-decorative', 'visual-separator', 'separator',
+    })
+    
+    # Placeholder alt texts that don't provide meaningful alternatives
+    PLACEHOLDER_ALT_TEXTS = frozenset({
+        'image', 'photo', 'picture', 'pic', 'graphic', 'logo', 'icon',
+        'img', 'photograph', 'photograph of', 'image of', 'picture of',
+    })
+    
+    # Classifies an alt text in one match: the matching group names it as a
+    # 'placeholder' or a 'filename'
+    ALT_TEXT_PATTERN = re.compile(
+        '(?P<placeholder>(?:'
+        + '|'.join(sorted(map(re.escape, PLACEHOLDER_ALT_TEXTS)))
+        + r')\Z)|(?P<filename>' + _FILENAME_PATTERN + ')',
+        re.IGNORECASE | re.DOTALL
+    )
     
     def validate(self, soup: BeautifulSoup, html_content: str) -> List[ValidationIssue]:
         """
@@ -58,218 +113,160 @@ class Criterion_1_1_1(BaseCriterion):
         """
         issues = []
         
-        # Check img elements
-        self._check_img_elements(soup, issues, html_content)
-        
-        # Check svg elements
-        self._check_svg_elements(soup, issues, html_content)
-        
-        # Check area elements (image maps)
-        self._check_area_elements(soup, issues, html_content)
-        
-        # Check input type="image" elements
-        self._check_input_image_elements(soup, issues, html_content)
-        
-        # Check objects, canvas, and other elements that might contain visual content
-        self._check_other_visual_elements(soup, issues, html_content)
+        # One pass over all candidate elements in document order, instead of
+        # one pass per element type
+        for element in self.find_elements(soup, *self.REQUIRED_TAGS):
+            # input elements only need a text alternative as image buttons;
+            # attribute values of type are case-insensitive
+            if element.name == 'input' and element.attrs.get('type', '').lower() != 'image':
+                continue
+            self.ELEMENT_CHECKS[element.name](self, element, issues, html_content)
         
         return issues
     
-    def _check_img_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check img elements for alternative text."""
-        img_elements = soup.find_all('img')
-        
-        for img in img_elements:
-            element_path = self.get_element_path(img)
-            element_html = str(img)
-            line_number = self.get_line_number(img, html_content)
-            
-            # Check if alt attribute exists
-            if not img.has_attr('alt'):
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Image missing alt attribute",
-                    impact="critical",
-                    how_to_fix="Add an alt attribute to the image that describes its content and function.",
-                    code_solution=self._generate_img_alt_solution(img),
-                    line_number=line_number
-                ))
-                continue
-            
-            # Check if alt is empty but image isn't marked as decorative
-            alt_text = img.get('alt', '')
-            
-            if alt_text == '' and not self._is_decorative(img):
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
+    def _check_img_element(self, img: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check an img element for alternative text."""
+        alt_text = img.attrs.get('alt')
+        
+        # Check if alt attribute exists
+        if alt_text is None:
+            issues.append(self.create_element_issue(
+                img, html_content,
+                description="Image missing alt attribute",
+                impact="critical",
+                how_to_fix="Add an alt attribute to the image that describes its content and function.",
+                code_solution=functools.partial(self._generate_img_alt_solution, img)
+            ))
+            return
+        
+        # Check if alt is empty but image isn't marked as decorative. None of
+        # the checks on the alt text below apply to an empty one
+        if alt_text == '':
+            if not self._is_decorative(img):
+                issues.append(self.create_element_issue(
+                    img, html_content,
                     description="Image has empty alt text but doesn't appear to be decorative",
                     impact="moderate",
                     how_to_fix="Either add a descriptive alt text or mark the image as decorative with role='presentation'.",
-                    code_solution=self._generate_img_alt_solution(img, decorative=False),
-                    line_number=line_number
-                ))
-            
-            # Check for placeholder alt text
-            if alt_text.lower() in self.placeholder_alt_texts:
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description=f"Image has placeholder alt text: '{alt_text}'",
-                    impact="serious",
-                    how_to_fix="Replace the generic placeholder with a descriptive alt text that conveys the image's content and function.",
-                    code_solution=self._generate_img_alt_solution(img),
-                    line_number=line_number
-                ))
-            
-            # Check for filename as alt text
-            if self._is_likely_filename(alt_text):
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description=f"Image alt text appears to be a filename: '{alt_text}'",
-                    impact="serious",
-                    how_to_fix="Replace the filename with a descriptive alt text that conveys the image's content and function.",
-                    code_solution=self._generate_img_alt_solution(img),
-                    line_number=line_number
-                ))
-            
-            # Check for very long alt text (possibly too verbose)
-            if len(alt_text) > 100:
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description=f"Image alt text is very long ({len(alt_text)} characters)",
-                    impact="minor",
-                    how_to_fix="Consider using a more concise alt text and potentially use a figure with figcaption or aria-describedby for longer descriptions.",
-                    code_solution=self._generate_longdesc_solution(img),
-                    line_number=line_number
+                    code_solution=functools.partial(self._generate_img_alt_solution, img, decorative=False)
                 ))
+            return
+        
+        match = self.ALT_TEXT_PATTERN.match(alt_text)
+        alt_text_kind = match.lastgroup if match else None
+        
+        # Check for placeholder alt text
+        if alt_text_kind == 'placeholder':
+            issues.append(self.create_element_issue(
+                img, html_content,
+                description=f"Image has placeholder alt text: '{alt_text}'",
+                impact="serious",
+                how_to_fix="Replace the generic placeholder with a descriptive alt text that conveys the image's content and function.",
+                code_solution=functools.partial(self._generate_img_alt_solution, img)
+            ))
+        
+        # Check for filename as alt text
+        elif alt_text_kind == 'filename':
+            issues.append(self.create_element_issue(
+                img, html_content,
+                description=f"Image alt text appears to be a filename: '{alt_text}'",
+                impact="serious",
+                how_to_fix="Replace the filename with a descriptive alt text that conveys the image's content and function.",
+                code_solution=functools.partial(self._generate_img_alt_solution, img)
+            ))
+        
+        # Check for very long alt text (possibly too verbose)
+        if len(alt_text) > 100:
+            issues.append(self.create_element_issue(
+                img, html_content,
+                description=f"Image alt text is very long ({len(alt_text)} characters)",
+                impact="minor",
+                how_to_fix="Consider using a more concise alt text and potentially use a figure with figcaption or aria-describedby for longer descriptions.",
+                code_solution=functools.partial(self._generate_longdesc_solution, img)
+            ))
     
-    def _check_svg_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check SVG elements for alternative text."""
-        svg_elements = soup.find_all('svg')
-        
-        for svg in svg_elements:
-            element_path = self.get_element_path(svg)
-            element_html = str(svg)
-            line_number = self.get_line_number(svg, html_content)
-            
-            # Check if SVG has accessible name
-            has_title = svg.find('title') is not None
-            has_aria_label = svg.has_attr('aria-label')
-            has_aria_labelledby = svg.has_attr('aria-labelledby')
-            has_role = svg.has_attr('role')
-            
-            # Skip if decorative
-            if has_role and svg['role'] in ['presentation', 'none']:
-                continue
-            
-            if not has_title and not has_aria_label and not has_aria_labelledby:
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="SVG element has no accessible name",
-                    impact="serious",
-                    how_to_fix="Add a title element, aria-label, or aria-labelledby attribute to provide an accessible name.",
-                    code_solution=self._generate_svg_solution(svg),
-                    line_number=line_number
-                ))
+    def _check_svg_element(self, svg: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check an SVG element for alternative text."""
+        attrs = svg.attrs
+        
+        # Skip if decorative
+        if attrs.get('role') in ('presentation', 'none'):
+            return
+        
+        # Check if SVG has accessible name, looking for a title element last
+        if 'aria-label' not in attrs and 'aria-labelledby' not in attrs and svg.find('title') is None:
+            issues.append(self.create_element_issue(
+                svg, html_content,
+                description="SVG element has no accessible name",
+                impact="serious",
+                how_to_fix="Add a title element, aria-label, or aria-labelledby attribute to provide an accessible name.",
+                code_solution=functools.partial(self._generate_svg_solution, svg)
+            ))
     
-    def _check_area_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check area elements (in image maps) for alternative text."""
-        area_elements = soup.find_all('area')
-        
-        for area in area_elements:
-            element_path = self.get_element_path(area)
-            element_html = str(area)
-            line_number = self.get_line_number(area, html_content)
+    def _check_area_element(self, area: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check an area element (in an image map) for alternative text."""
+        # Skip if no href (not interactive)
+        attrs = area.attrs
+        if 'href' not in attrs:
+            return
             
-            # Skip if no href (not interactive)
-            if not area.has_attr('href'):
-                continue
-                
-            # Check for alt attribute
-            if not area.has_attr('alt'):
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Area element missing alt attribute",
-                    impact="serious",
-                    how_to_fix="Add an alt attribute that describes the function of this area.",
-                    code_solution=self._generate_area_solution(area),
-                    line_number=line_number
-                ))
+        # Check for alt attribute
+        if 'alt' not in attrs:
+            issues.append(self.create_element_issue(
+                area, html_content,
+                description="Area element missing alt attribute",
+                impact="serious",
+                how_to_fix="Add an alt attribute that describes the function of this area.",
+                code_solution=functools.partial(self._generate_area_solution, area)
+            ))
     
-    def _check_input_image_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check input type="image" elements for alternative text."""
-        input_images = soup.find_all('input', {'type': 'image'})
-        
-        for input_img in input_images:
-            element_path = self.get_element_path(input_img)
-            element_html = str(input_img)
-            line_number = self.get_line_number(input_img, html_content)
-            
-            # Check for alt attribute
-            if not input_img.has_attr('alt'):
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Input image missing alt attribute",
-                    impact="serious",
-                    how_to_fix="Add an alt attribute that describes the function of this image button.",
-                    code_solution=self._generate_input_image_solution(input_img),
-                    line_number=line_number
-                ))
+    def _check_input_image_element(self, input_img: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check an input element of type="image" for alternative text."""
+        # Check for alt attribute
+        if 'alt' not in input_img.attrs:
+            issues.append(self.create_element_issue(
+                input_img, html_content,
+                description="Input image missing alt attribute",
+                impact="serious",
+                how_to_fix="Add an alt attribute that describes the function of this image button.",
+                code_solution=functools.partial(self._generate_input_image_solution, input_img)
+            ))
     
-    def _check_other_visual_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check other elements that might contain visual content (object, canvas, etc.)."""
-        # Check canvas elements
-        canvas_elements = soup.find_all('canvas')
-        
-        for canvas in canvas_elements:
-            element_path = self.get_element_path(canvas)
-            element_html = str(canvas)
-            line_number = self.get_line_number(canvas, html_content)
-            
-            # Check if canvas has fallback content or accessible name
-            fallback_content = canvas.text.strip()
-            has_aria_label = canvas.has_attr('aria-label')
-            has_aria_labelledby = canvas.has_attr('aria-labelledby')
-            
-            if not fallback_content and not has_aria_label and not has_aria_labelledby:
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Canvas element has no fallback content or accessible name",
-                    impact="serious",
-                    how_to_fix="Add fallback content inside the canvas element or provide an aria-label or aria-labelledby attribute.",
-                    code_solution=self._generate_canvas_solution(canvas),
-                    line_number=line_number
-                ))
-        
-        # Check object elements
-        object_elements = soup.find_all('object')
-        
-        for obj in object_elements:
-            element_path = self.get_element_path(obj)
-            element_html = str(obj)
-            line_number = self.get_line_number(obj, html_content)
-            
-            # Check if object has fallback content
-            fallback_content = obj.text.strip()
-            
-            if not fallback_content:
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Object element has no fallback content",
-                    impact="serious",
-                    how_to_fix="Add fallback content inside the object element to provide an alternative for users who cannot access the object.",
-                    code_solution=self._generate_object_solution(obj),
-                    line_number=line_number
-                ))
+    def _check_canvas_element(self, canvas: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check a canvas element for fallback content or an accessible name."""
+        # Check if canvas has an accessible name or fallback content
+        attrs = canvas.attrs
+        
+        if 'aria-label' not in attrs and 'aria-labelledby' not in attrs and not self.has_text(canvas):
+            issues.append(self.create_element_issue(
+                canvas, html_content,
+                description="Canvas element has no fallback content or accessible name",
+                impact="serious",
+                how_to_fix="Add fallback content inside the canvas element or provide an aria-label or aria-labelledby attribute.",
+                code_solution=functools.partial(self._generate_canvas_solution, canvas)
+            ))
+    
+    def _check_object_element(self, obj: Tag, issues: List[ValidationIssue], html_content: str):
+        """Check an object element for fallback content."""
+        # Check if object has fallback content
+        if not self.has_text(obj):
+            issues.append(self.create_element_issue(
+                obj, html_content,
+                description="Object element has no fallback content",
+                impact="serious",
+                how_to_fix="Add fallback content inside the object element to provide an alternative for users who cannot access the object.",
+                code_solution=functools.partial(self._generate_object_solution, obj)
+            ))
+    
+    # Check to run for each element type, keyed by tag name
+    ELEMENT_CHECKS = {
+        'img': _check_img_element,
+        'svg': _check_svg_element,
+        'area': _check_area_element,
+        'input': _check_input_image_element,
+        'canvas': _check_canvas_element,
+        'object': _check_object_element,
+    }
     
     def _is_decorative(self, img: Tag) -> bool:
         """
@@ -281,50 +278,32 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             True if the image is likely decorative, False otherwise
         """
+        attrs = img.attrs
+        
         # Check for role="presentation" or role="none"
-        if img.has_attr('role') and img['role'] in ['presentation', 'none']:
+        if attrs.get('role') in ('presentation', 'none'):
             return True
         
-        # Check for decorative classes
-        if img.has_attr('class'):
-            img_classes = set(img['class'])
-            if img_classes.intersection(self.decorative_classes):
+        # Check for decorative classes. class is a list unless the tree was
+        # built without multi-valued attributes
+        classes = attrs.get('class', ())
+        if isinstance(classes, str):
+            classes = classes.split()
+        for class_name in classes:
+            if class_name in self.DECORATIVE_CLASSES:
                 return True
         
         # Check for aria-hidden="true"
-        if img.has_attr('aria-hidden') and img['aria-hidden'] == 'true':
+        if attrs.get('aria-hidden') == 'true':
             return True
         
         # Check if it might be a spacer image
-        if img.has_attr('width') and img.has_attr('height'):
-            try:
-                width = int(img['width'])
-                height = int(img['height'])
-                if (width <= 1 or height <= 1) and img.get('alt', '') == '':
-                    return True
-            except ValueError:
-                pass
-        
-        return False
-    
-    def _is_likely_filename(self, text: str) -> bool:
-        """
-        Check if a string is likely a filename.
-        
-        Args:
-            text: The string to check
-            
-        Returns:
-            True if the string is likely a filename, False otherwise
-        """
-        # Check for common image file extensions
-        if re.search(r'\.(jpe?g|png|gif|webp|svg|bmp|tiff?)$', text, re.IGNORECASE):
-            return True
+        if 'width' in attrs and 'height' in attrs and attrs.get('alt', '') == '':
+            width = _parse_int(attrs['width'])
+            height = _parse_int(attrs['height'])
+            if width is not None and height is not None and (width <= 1 or height <= 1):
+                return True
         
-        # Check for underscores and hyphens common in filenames
-        if re.search(r'^[a-zA-Z0-9_-]+$', text) and ('_' in text or '-' in text):
-            return True
-            
         return False
     
     def _generate_img_alt_solution(self, img: Tag, decorative: bool = None) -> str:
@@ -341,16 +320,16 @@ class Criterion_1_1_1(BaseCriterion):
         if decorative is None:
             decorative = self._is_decorative(img)
             
-        # Create a copy of the attributes
-        attrs = {key: value for key, value in img.attrs.items() if key != 'alt'}
-        
         if decorative:
+            # Create a copy of the attributes with alt moved to the end
+            attrs = dict(img.attrs)
+            attrs.pop('alt', None)
             attrs['alt'] = ''
             attrs['role'] = 'presentation'
             
-            return f'<img {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} alt="" role="presentation">'
+            return '<img %s alt="" role="presentation">' % _format_attributes(attrs)
         else:
-            return f'<img {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} alt="[Descriptive text about the image]">'
+            return '<img %s alt="[Descriptive text about the image]">' % _format_attributes(img.attrs, ('alt',))
     
     def _generate_longdesc_solution(self, img: Tag) -> str:
         """
@@ -362,13 +341,10 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        # Create a copy of the attributes
-        attrs = {key: value for key, value in img.attrs.items() if key != 'alt' and key != 'aria-describedby'}
-        
-        return f'''<figure>
-  <img {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} alt="[Brief description]" aria-describedby="img-desc">
+        return '''<figure>
+  <img %s alt="[Brief description]" aria-describedby="img-desc">
   <figcaption id="img-desc">[Detailed description of the image]</figcaption>
-</figure>'''
+</figure>''' % _format_attributes(img.attrs, ('alt', 'aria-describedby'))
     
     def _generate_svg_solution(self, svg: Tag) -> str:
         """
@@ -403,10 +379,7 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        # Create a copy of the attributes
-        attrs = {key: value for key, value in area.attrs.items() if key != 'alt'}
-        
-        return f'<area {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} alt="[Descriptive text for this region]">'
+        return '<area %s alt="[Descriptive text for this region]">' % _format_attributes(area.attrs, ('alt',))
     
     def _generate_input_image_solution(self, input_img: Tag) -> str:
         """
@@ -418,10 +391,7 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        # Create a copy of the attributes
-        attrs = {key: value for key, value in input_img.attrs.items() if key != 'alt'}
-        
-        return f'<input {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} alt="[Descriptive text for button function]">'
+        return '<input %s alt="[Descriptive text for button function]">' % _format_attributes(input_img.attrs, ('alt',))
     
     def _generate_canvas_solution(self, canvas: Tag) -> str:
         """
@@ -433,13 +403,10 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        # Get attrs except aria-label
-        attrs = {key: value for key, value in canvas.attrs.items() if key != 'aria-label'}
-        
-        return f'''<canvas {" ".join(f"{k}=\"{v}\"" for k, v in attrs.items())} aria-label="[Descriptive text for canvas content]">
+        return '''<canvas %s aria-label="[Descriptive text for canvas content]">
   Your browser does not support the canvas element.
   [Alternative content or description of what the canvas displays]
-</canvas>'''
+</canvas>''' % _format_attributes(canvas.attrs, ('aria-label',))
     
     def _generate_object_solution(self, obj: Tag) -> str:
         """
@@ -451,7 +418,7 @@ class Criterion_1_1_1(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        attrs_str = " ".join(f"{k}=\"{v}\"" for k, v in obj.attrs.items())
+        attrs_str = _format_attributes(obj.attrs)
         
         return f'''<object {attrs_str}>
   [Alternative content for users who cannot access the object]
@@ -7,8 +7,8 @@ and logotypes.
 """
 
 from typing import List, Tuple, Dict, Optional
+import functools
 import re
-import math
 from bs4 import BeautifulSoup, Tag
 import colorsys
 
@@ -16,6 +16,481 @@ from .base import BaseCriterion
 from ..reporter import ValidationIssue
 
 
+# CSS color formats
+_RGB_RE = re.compile(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+_RGBA_RE = re.compile(r'rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)')
+_HEX_RE = re.compile(r'#([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})', re.IGNORECASE)
+_SHORT_HEX_RE = re.compile(r'#([0-9a-f])([0-9a-f])([0-9a-f])', re.IGNORECASE)
+
+# CSS font size units
+_PX_RE = re.compile(r'([\d.]+)px')
+_PT_RE = re.compile(r'([\d.]+)pt')
+_EM_RE = re.compile(r'([\d.]+)em')
+_REM_RE = re.compile(r'([\d.]+)rem')
+_PERCENT_RE = re.compile(r'([\d.]+)%')
+
+# CSS named colors
+_NAMED_COLORS = {
+    'aliceblue': (240, 248, 255),
+    'antiquewhite': (250, 235, 215),
+    'aqua': (0, 255, 255),
+    'aquamarine': (127, 255, 212),
+    'azure': (240, 255, 255),
+    'beige': (245, 245, 220),
+    'bisque': (255, 228, 196),
+    'black': (0, 0, 0),
+    'blanchedalmond': (255, 235, 205),
+    'blue': (0, 0, 255),
+    'blueviolet': (138, 43, 226),
+    'brown': (165, 42, 42),
+    'burlywood': (222, 184, 135),
+    'cadetblue': (95, 158, 160),
+    'chartreuse': (127, 255, 0),
+    'chocolate': (210, 105, 30),
+    'coral': (255, 127, 80),
+    'cornflowerblue': (100, 149, 237),
+    'cornsilk': (255, 248, 220),
+    'crimson': (220, 20, 60),
+    'cyan': (0, 255, 255),
+    'darkblue': (0, 0, 139),
+    'darkcyan': (0, 139, 139),
+    'darkgoldenrod': (184, 134, 11),
+    'darkgray': (169, 169, 169),
+    'darkgreen': (0, 100, 0),
+    'darkgrey': (169, 169, 169),
+    'darkkhaki': (189, 183, 107),
+    'darkmagenta': (139, 0, 139),
+    'darkolivegreen': (85, 107, 47),
+    'darkorange': (255, 140, 0),
+    'darkorchid': (153, 50, 204),
+    'darkred': (139, 0, 0),
+    'darksalmon': (233, 150, 122),
+    'darkseagreen': (143, 188, 143),
+    'darkslateblue': (72, 61, 139),
+    'darkslategray': (47, 79, 79),
+    'darkslategrey': (47, 79, 79),
+    'darkturquoise': (0, 206, 209),
+    'darkviolet': (148, 0, 211),
+    'deeppink': (255, 20, 147),
+    'deepskyblue': (0, 191, 255),
+    'dimgray': (105, 105, 105),
+    'dimgrey': (105, 105, 105),
+    'dodgerblue': (30, 144, 255),
+    'firebrick': (178, 34, 34),
+    'floralwhite': (255, 250, 240),
+    'forestgreen': (34, 139, 34),
+    'fuchsia': (255, 0, 255),
+    'gainsboro': (220, 220, 220),
+    'ghostwhite': (248, 248, 255),
+    'gold': (255, 215, 0),
+    'goldenrod': (218, 165, 32),
+    'gray': (128, 128, 128),
+    'green': (0, 128, 0),
+    'greenyellow': (173, 255, 47),
+    'grey': (128, 128, 128),
+    'honeydew': (240, 255, 240),
+    'hotpink': (255, 105, 180),
+    'indianred': (205, 92, 92),
+    'indigo': (75, 0, 130),
+    'ivory': (255, 255, 240),
+    'khaki': (240, 230, 140),
+    'lavender': (230, 230, 250),
+    'lavenderblush': (255, 240, 245),
+    'lawngreen': (124, 252, 0),
+    'lemonchiffon': (255, 250, 205),
+    'lightblue': (173, 216, 230),
+    'lightcoral': (240, 128, 128),
+    'lightcyan': (224, 255, 255),
+    'lightgoldenrodyellow': (250, 250, 210),
+    'lightgray': (211, 211, 211),
+    'lightgreen': (144, 238, 144),
+    'lightgrey': (211, 211, 211),
+    'lightpink': (255, 182, 193),
+    'lightsalmon': (255, 160, 122),
+    'lightseagreen': (32, 178, 170),
+    'lightskyblue': (135, 206, 250),
+    'lightslategray': (119, 136, 153),
+    'lightslategrey': (119, 136, 153),
+    'lightsteelblue': (176, 196, 222),
+    'lightyellow': (255, 255, 224),
+    'lime': (0, 255, 0),
+    'limegreen': (50, 205, 50),
+    'linen': (250, 240, 230),
+    'magenta': (255, 0, 255),
+    'maroon': (128, 0, 0),
+    'mediumaquamarine': (102, 205, 170),
+    'mediumblue': (0, 0, 205),
+    'mediumorchid': (186, 85, 211),
+    'mediumpurple': (147, 112, 219),
+    'mediumseagreen': (60, 179, 113),
+    'mediumslateblue': (123, 104, 238),
+    'mediumspringgreen': (0, 250, 154),
+    'mediumturquoise': (72, 209, 204),
+    'mediumvioletred': (199, 21, 133),
+    'midnightblue': (25, 25, 112),
+    'mintcream': (245, 255, 250),
+    'mistyrose': (255, 228, 225),
+    'moccasin': (255, 228, 181),
+    'navajowhite': (255, 222, 173),
+    'navy': (0, 0, 128),
+    'oldlace': (253, 245, 230),
+    'olive': (128, 128, 0),
+    'olivedrab': (107, 142, 35),
+    'orange': (255, 165, 0),
+    'orangered': (255, 69, 0),
+    'orchid': (218, 112, 214),
+    'palegoldenrod': (238, 232, 170),
+    'palegreen': (152, 251, 152),
+    'paleturquoise': (175, 238, 238),
+    'palevioletred': (219, 112, 147),
+    'papayawhip': (255, 239, 213),
+    'peachpuff': (255, 218, 185),
+    'peru': (205, 133, 63),
+    'pink': (255, 192, 203),
+    'plum': (221, 160, 221),
+    'powderblue': (176, 224, 230),
+    'purple': (128, 0, 128),
+    'rebeccapurple': (102, 51, 153),
+    'red': (255, 0, 0),
+    'rosybrown': (188, 143, 143),
+    'royalblue': (65, 105, 225),
+    'saddlebrown': (139, 69, 19),
+    'salmon': (250, 128, 114),
+    'sandybrown': (244, 164, 96),
+    'seagreen': (46, 139, 87),
+    'seashell': (255, 245, 238),
+    'sienna': (160, 82, 45),
+    'silver': (192, 192, 192),
+    'skyblue': (135, 206, 235),
+    'slateblue': (106, 90, 205),
+    'slategray': (112, 128, 144),
+    'slategrey': (112, 128, 144),
+    'snow': (255, 250, 250),
+    'springgreen': (0, 255, 127),
+    'steelblue': (70, 130, 180),
+    'tan': (210, 180, 140),
+    'teal': (0, 128, 128),
+    'thistle': (216, 191, 216),
+    'tomato': (255, 99, 71),
+    'turquoise': (64, 224, 208),
+    'violet': (238, 130, 238),
+    'wheat': (245, 222, 179),
+    'white': (255, 255, 255),
+    'whitesmoke': (245, 245, 245),
+    'yellow': (255, 255, 0),
+    'yellowgreen': (154, 205, 50),
+}
+
+# Two-digit hex form of every 8-bit channel value
+_HEX_BYTE = tuple(f'{value:02x}' for value in range(256))
+
+# Named font sizes, approximately in pixels
+_NAMED_FONT_SIZES = {
+    'xx-small': 9,
+    'x-small': 10,
+    'small': 13,
+    'medium': 16,
+    'large': 18,
+    'x-large': 24,
+    'xx-large': 32,
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_style(style_text: str) -> Dict[str, str]:
+    """
+    Parse the declarations of an inline style attribute.
+    
+    Results are cached, as many elements share the exact same style
+    attribute. The returned dictionary is shared and must not be modified.
+    
+    Args:
+        style_text: Value of a style attribute
+    
+    Returns:
+        Dictionary of lowercased CSS properties to values
+    """
+    # Simple CSS parsing (doesn't handle all cases but works for basic styles)
+    styles = {}
+    for part in style_text.split(';'):
+        prop, sep, value = part.partition(':')
+        if sep:
+            styles[prop.strip().lower()] = value.strip()
+    
+    return styles
+
+
+@functools.lru_cache(maxsize=2048)
+def extract_color(color_value: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Extract RGB color from CSS color value.
+    
+    Results are cached, as pages tend to repeat the same few values.
+    
+    Args:
+        color_value: CSS color value (hex, rgb, or named color)
+    
+    Returns:
+        Tuple of (R, G, B) values or None if extraction fails
+    """
+    if not color_value:
+        return None
+    
+    # Fast path for values that are just a hex color
+    if color_value[0] == '#':
+        digits = color_value[1:]
+        if digits.isascii() and digits.isalnum():
+            try:
+                if len(digits) == 6:
+                    return (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+                if len(digits) == 3:
+                    return (int(digits[0] * 2, 16), int(digits[1] * 2, 16), int(digits[2] * 2, 16))
+            except ValueError:
+                pass
+    
+    # Handle rgb/rgba format
+    if 'rgb' in color_value:
+        rgb_match = _RGB_RE.search(color_value)
+        if rgb_match:
+            r = int(rgb_match.group(1))
+            g = int(rgb_match.group(2))
+            b = int(rgb_match.group(3))
+            return (r, g, b)
+        
+        rgba_match = _RGBA_RE.search(color_value)
+        if rgba_match:
+            r = int(rgba_match.group(1))
+            g = int(rgba_match.group(2))
+            b = int(rgba_match.group(3))
+            return (r, g, b)
+    
+    # Handle hex format
+    hex_match = _HEX_RE.search(color_value)
+    if hex_match:
+        r = int(hex_match.group(1), 16)
+        g = int(hex_match.group(2), 16)
+        b = int(hex_match.group(3), 16)
+        return (r, g, b)
+    
+    # Handle short hex format
+    short_hex_match = _SHORT_HEX_RE.search(color_value)
+    if short_hex_match:
+        r = int(short_hex_match.group(1) + short_hex_match.group(1), 16)
+        g = int(short_hex_match.group(2) + short_hex_match.group(2), 16)
+        b = int(short_hex_match.group(3) + short_hex_match.group(3), 16)
+        return (r, g, b)
+    
+    # Handle named colors
+    return _NAMED_COLORS.get(color_value.lower().strip())
+
+
+@functools.lru_cache(maxsize=2048)
+def extract_font_size(size_value: str) -> Optional[float]:
+    """
+    Extract font size in pixels from CSS font-size value.
+    
+    Results are cached, as pages tend to repeat the same few values.
+    
+    Args:
+        size_value: CSS font-size value
+    
+    Returns:
+        Font size in pixels or None if extraction fails
+    """
+    if not size_value:
+        return None
+    
+    # Handle pixel values
+    px_match = _PX_RE.search(size_value)
+    if px_match:
+        return float(px_match.group(1))
+    
+    # Handle point values (approximate conversion to pixels)
+    pt_match = _PT_RE.search(size_value)
+    if pt_match:
+        return float(pt_match.group(1)) * 1.333  # Approximate pt to px conversion
+    
+    # Handle em values (using a baseline assumption of 16px)
+    em_match = _EM_RE.search(size_value)
+    if em_match:
+        return float(em_match.group(1)) * 16  # Assume 1em = 16px
+    
+    # Handle rem values (using a baseline assumption of 16px)
+    rem_match = _REM_RE.search(size_value)
+    if rem_match:
+        return float(rem_match.group(1)) * 16  # Assume 1rem = 16px
+    
+    # Handle percentage (using a baseline assumption of 16px)
+    percent_match = _PERCENT_RE.search(size_value)
+    if percent_match:
+        return float(percent_match.group(1)) * 0.16  # Assume 100% = 16px
+    
+    # Handle named sizes (approximate conversion to pixels)
+    size_value = size_value.lower().strip()
+    if size_value in _NAMED_FONT_SIZES:
+        return _NAMED_FONT_SIZES[size_value]
+    
+    return None
+
+
+def _srgb_to_linear(value: float) -> float:
+    """
+    Convert an sRGB channel value to linear RGB.
+    
+    Args:
+        value: Channel value (0-255)
+        
+    Returns:
+        Linear channel value (0-1)
+    """
+    value = value / 255.0
+    return value / 12.92 if value <= 0.03928 else ((value + 0.055) / 1.055) ** 2.4
+
+
+# Linear value of every 8-bit sRGB channel value, so luminance needs no powers
+_LINEAR_CHANNEL = {value: _srgb_to_linear(value) for value in range(256)}
+
+
+def relative_luminance(color: Tuple[int, int, int]) -> float:
+    """
+    Calculate relative luminance of a color using WCAG formula.
+    
+    Channels are converted to linear RGB with a lookup table, as this runs
+    for every color pair checked and while searching for a fixed color.
+    
+    Args:
+        color: RGB tuple (R, G, B)
+        
+    Returns:
+        Relative luminance value
+    """
+    table = _LINEAR_CHANNEL
+    try:
+        return 0.2126 * table[color[0]] + 0.7152 * table[color[1]] + 0.0722 * table[color[2]]
+    except KeyError:
+        # Channels outside 0-255, e.g. from rgb(300, 0, 0), are converted directly
+        return (0.2126 * _srgb_to_linear(color[0]) + 0.7152 * _srgb_to_linear(color[1])
+                + 0.0722 * _srgb_to_linear(color[2]))
+
+
+@functools.lru_cache(maxsize=4096)
+def contrast_ratio(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> float:
+    """
+    Calculate contrast ratio between two colors using WCAG formula.
+    
+    Results are cached, as the same color pairs recur across elements
+    sharing styles.
+    
+    Args:
+        color1: RGB tuple (R, G, B)
+        color2: RGB tuple (R, G, B)
+        
+    Returns:
+        Contrast ratio as a float
+    """
+    luminance1 = relative_luminance(color1)
+    luminance2 = relative_luminance(color2)
+    
+    if luminance1 > luminance2:
+        return (luminance1 + 0.05) / (luminance2 + 0.05)
+    return (luminance2 + 0.05) / (luminance1 + 0.05)
+
+
+def adjust_color_for_contrast(fg_color: Tuple[int, int, int],
+                              bg_color: Tuple[int, int, int],
+                              target_ratio: float) -> Tuple[int, int, int]:
+    """
+    Adjust foreground color to achieve target contrast ratio with background.
+    
+    The luminance the foreground needs follows directly from the contrast
+    formula. The lightness of the foreground is then moved away from the
+    background's, keeping its hue and saturation, with a short binary search
+    for the smallest change that reaches that luminance. If that falls short,
+    as on mid-luminance backgrounds, the lightness is moved the other way.
+    
+    Args:
+        fg_color: RGB tuple for foreground color
+        bg_color: RGB tuple for background color
+        target_ratio: Target contrast ratio
+        
+    Returns:
+        Adjusted RGB tuple for foreground color
+    """
+    # Convert RGB to HSL for more intuitive adjustment
+    r, g, b = fg_color
+    h, l, s = colorsys.rgb_to_hls(r/255.0, g/255.0, b/255.0)
+    
+    # Only lightness changes, so the hue branches of colorsys.hls_to_rgb are
+    # resolved once. Each channel is then the light term m2 (weight None) or
+    # m1 + (m2 - m1) * weight * 6, computed in the same order as colorsys
+    def channel_weight(hue: float) -> Optional[float]:
+        hue = hue % 1.0
+        if hue < 1/6:
+            return hue
+        if hue < 0.5:
+            return None
+        if hue < 2/3:
+            return 2/3 - hue
+        return 0.0
+    
+    r_weight = channel_weight(h + 1/3)
+    g_weight = channel_weight(h)
+    b_weight = channel_weight(h - 1/3)
+    
+    def to_rgb(lightness: float) -> Tuple[int, int, int]:
+        if s == 0.0:
+            gray = int(lightness * 255)
+            return (gray, gray, gray)
+        if lightness <= 0.5:
+            m2 = lightness * (1.0 + s)
+        else:
+            m2 = lightness + s - (lightness * s)
+        m1 = 2.0 * lightness - m2
+        return (int((m2 if r_weight is None else m1 + (m2 - m1) * r_weight * 6.0) * 255),
+                int((m2 if g_weight is None else m1 + (m2 - m1) * g_weight * 6.0) * 255),
+                int((m2 if b_weight is None else m1 + (m2 - m1) * b_weight * 6.0) * 255))
+    
+    bg_luminance = relative_luminance(bg_color)
+    
+    def search(adjust_up: bool) -> Tuple[int, int, int]:
+        if adjust_up:
+            target_luminance = target_ratio * (bg_luminance + 0.05) - 0.05
+            low, high = l, 1.0
+        else:
+            target_luminance = (bg_luminance + 0.05) / target_ratio - 0.05
+            low, high = 0.0, l
+        
+        # Luminance grows with lightness, so search for the lightness closest
+        # to the original that still reaches the target. 8 halvings match the
+        # resolution of 8-bit channels
+        for _ in range(8):
+            middle = (low + high) / 2
+            luminance = relative_luminance(to_rgb(middle))
+            if (luminance >= target_luminance) == adjust_up:
+                if adjust_up:
+                    high = middle
+                else:
+                    low = middle
+            elif adjust_up:
+                low = middle
+            else:
+                high = middle
+        
+        # The bound on the far side from the original color reaches the
+        # target, unless even white or black does not
+        return to_rgb(high if adjust_up else low)
+    
+    # Lighten against dark backgrounds and darken against light ones. On
+    # mid-luminance backgrounds the target may only be reachable the other
+    # way, so that direction is tried when the first one falls short
+    adjusted = search(bg_luminance < 0.5)
+    if contrast_ratio(adjusted, bg_color) < target_ratio:
+        other = search(bg_luminance >= 0.5)
+        if contrast_ratio(other, bg_color) > contrast_ratio(adjusted, bg_color):
+            adjusted = other
+    return adjusted
+
+
 class Criterion_1_4_3(BaseCriterion):
     """
     Implements WCAG 2.2 Success Criterion 1.4.3: Contrast (Minimum).
@@ -23,18 +498,18 @@ class Criterion_1_4_3(BaseCriterion):
     This criterion requires sufficient contrast between text and its background.
     """
     
+    id = "1.4.3"
+    name = "Contrast (Minimum)"
+    level = "AA"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/contrast-minimum.html"
+    description = """
+    The visual presentation of text and images of text has a contrast ratio
+    of at least 4.5:1, except for Large Text (at least 3:1), incidental text,
+    and logotypes.
+    """
+    
     def __init__(self):
         super().__init__()
-        self.id = "1.4.3"
-        self.name = "Contrast (Minimum)"
-        self.level = "AA"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/contrast-minimum.html"
-        self.description = """
-        The visual presentation of text and images of text has a contrast ratio
-        of at least 4.5:1, except for Large Text (at least 3:1), incidental text,
-        and logotypes.
-        """
-        
         # CSS properties that may specify colors
         self.color_properties = ['color', 'background-color', 'background']
         
@@ -64,19 +539,15 @@ class Criterion_1_4_3(BaseCriterion):
         issues = []
         
         # Check text elements that commonly have content
-        text_elements = soup.find_all(['p', 'span', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                                     'a', 'button', 'label', 'li', 'td', 'th'])
+        text_elements = self.find_elements(soup, 'p', 'span', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                                           'a', 'button', 'label', 'li', 'td', 'th')
         
         for element in text_elements:
-            # Skip elements with no text content
-            if not element.get_text(strip=True):
+            # Only inline styles are checked, so skip unstyled elements first
+            if not element.has_attr('style'):
                 continue
             
-            element_path = self.get_element_path(element)
-            element_html = str(element)
-            line_number = self.get_line_number(element, html_content)
-            
-            # Extract inline styles if present
+            # Extract inline styles
             inline_styles = self._parse_inline_styles(element)
             
             # Extract foreground color
@@ -90,39 +561,49 @@ class Criterion_1_4_3(BaseCriterion):
                     if bg_color:
                         break
             
-            # If we have both colors, check contrast
-            if fg_color and bg_color:
-                # Determine font size from inline styles
-                font_size = self._extract_font_size(inline_styles.get('font-size', ''))
-                font_weight = inline_styles.get('font-weight', '')
-                is_bold = font_weight in ['bold', 'bolder', '700', '800', '900']
-                
-                # Determine if text is "large" according to WCAG
-                is_large = False
-                if font_size:
-                    if (font_size >= self.large_text_size or 
-                        (font_size >= self.large_bold_text_size and is_bold)):
-                        is_large = True
-                
-                # Calculate contrast ratio
-                contrast_ratio = self._calculate_contrast_ratio(fg_color, bg_color)
-                
-                # Determine minimum required contrast
-                min_contrast = self.min_contrast_large if is_large else self.min_contrast_normal
+            # Contrast can only be checked when both colors are known
+            if not (fg_color and bg_color):
+                continue
+            
+            # Calculate contrast ratio
+            contrast_ratio = self._calculate_contrast_ratio(fg_color, bg_color)
+            
+            # Contrast meeting the normal text minimum is enough at any text
+            # size, so the element's text and font don't need to be looked at
+            if contrast_ratio >= self.min_contrast_normal:
+                continue
+            
+            # Skip elements with no text content
+            if not self.has_text(element):
+                continue
+            
+            # Determine font size from inline styles
+            font_size = self._extract_font_size(inline_styles.get('font-size', ''))
+            font_weight = inline_styles.get('font-weight', '')
+            is_bold = font_weight in ['bold', 'bolder', '700', '800', '900']
+            
+            # Determine if text is "large" according to WCAG
+            is_large = False
+            if font_size:
+                if (font_size >= self.large_text_size or 
+                    (font_size >= self.large_bold_text_size and is_bold)):
+                    is_large = True
+            
+            # Determine minimum required contrast
+            min_contrast = self.min_contrast_large if is_large else self.min_contrast_normal
+            
+            # Check if contrast is sufficient
+            if contrast_ratio < min_contrast:
+                threshold_name = "large text (3:1)" if is_large else "normal text (4.5:1)"
                 
-                # Check if contrast is sufficient
-                if contrast_ratio < min_contrast:
-                    threshold_name = "large text (3:1)" if is_large else "normal text (4.5:1)"
-                    
-                    issues.append(self.create_issue(
-                        element_path=element_path,
-                        element_html=element_html,
-                        description=f"Insufficient contrast ratio of {contrast_ratio:.2f}:1 (minimum should be {min_contrast}:1 for {threshold_name})",
-                        impact="serious",
-                        how_to_fix=f"Increase the contrast between the text ({self._rgb_to_hex(fg_color)}) and background ({self._rgb_to_hex(bg_color)}).",
-                        code_solution=self._generate_contrast_solution(element, fg_color, bg_color, min_contrast),
-                        line_number=line_number
-                    ))
+                issues.append(self.create_element_issue(
+                    element,
+                    html_content,
+                    description=f"Insufficient contrast ratio of {contrast_ratio:.2f}:1 (minimum should be {min_contrast}:1 for {threshold_name})",
+                    impact="serious",
+                    how_to_fix=f"Increase the contrast between the text ({self._rgb_to_hex(fg_color)}) and background ({self._rgb_to_hex(bg_color)}).",
+                    code_solution=self._generate_contrast_solution(element, inline_styles, fg_color, bg_color, min_contrast)
+                ))
         
         return issues
     
@@ -136,20 +617,11 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Dictionary of CSS properties
         """
-        styles = {}
-        
-        if element.has_attr('style'):
-            style_text = element['style']
-            
-            # Simple CSS parsing (doesn't handle all cases but works for basic styles)
-            style_parts = style_text.split(';')
-            
-            for part in style_parts:
-                if ':' in part:
-                    prop, value = part.split(':', 1)
-                    styles[prop.strip().lower()] = value.strip()
+        style_text = element.get('style')
+        if not style_text:
+            return {}
         
-        return styles
+        return parse_style(style_text)
     
     def _extract_color(self, color_value: str) -> Optional[Tuple[int, int, int]]:
         """
@@ -161,62 +633,7 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Tuple of (R, G, B) values or None if extraction fails
         """
-        if not color_value:
-            return None
-            
-        # Handle rgb/rgba format
-        rgb_match = re.search(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', color_value)
-        if rgb_match:
-            r = int(rgb_match.group(1))
-            g = int(rgb_match.group(2))
-            b = int(rgb_match.group(3))
-            return (r, g, b)
-            
-        rgba_match = re.search(r'rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)', color_value)
-        if rgba_match:
-            r = int(rgba_match.group(1))
-            g = int(rgba_match.group(2))
-            b = int(rgba_match.group(3))
-            return (r, g, b)
-        
-        # Handle hex format
-        hex_match = re.search(r'#([0-9a-f]{2})([0-9a-f]{2})([0-9a-f]{2})', color_value, re.IGNORECASE)
-        if hex_match:
-            r = int(hex_match.group(1), 16)
-            g = int(hex_match.group(2), 16)
-            b = int(hex_match.group(3), 16)
-            return (r, g, b)
-            
-        # Handle short hex format
-        short_hex_match = re.search(r'#([0-9a-f])([0-9a-f])([0-9a-f])', color_value, re.IGNORECASE)
-        if short_hex_match:
-            r = int(short_hex_match.group(1) + short_hex_match.group(1), 16)
-            g = int(short_hex_match.group(2) + short_hex_match.group(2), 16)
-            b = int(short_hex_match.group(3) + short_hex_match.group(3), 16)
-            return (r, g, b)
-        
-        # Handle some common named colors
-        named_colors = {
-            'black': (0, 0, 0),
-            'white': (255, 255, 255),
-            'red': (255, 0, 0),
-            'green': (0, 128, 0),
-            'blue': (0, 0, 255),
-            'yellow': (255, 255, 0),
-            'purple': (128, 0, 128),
-            'gray': (128, 128, 128),
-            'grey': (128, 128, 128),
-            'orange': (255, 165, 0),
-            'brown': (165, 42, 42),
-            'cyan': (0, 255, 255),
-            'magenta': (255, 0, 255),
-        }
-        
-        color_value = color_value.lower().strip()
-        if color_value in named_colors:
-            return named_colors[color_value]
-            
-        return None
+        return extract_color(color_value)
     
     def _extract_font_size(self, size_value: str) -> Optional[float]:
         """
@@ -228,50 +645,7 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Font size in pixels or None if extraction fails
         """
-        if not size_value:
-            return None
-            
-        # Handle pixel values
-        px_match = re.search(r'([\d.]+)px', size_value)
-        if px_match:
-            return float(px_match.group(1))
-            
-        # Handle point values (approximate conversion to pixels)
-        pt_match = re.search(r'([\d.]+)pt', size_value)
-        if pt_match:
-            return float(pt_match.group(1)) * 1.333  # Approximate pt to px conversion
-            
-        # Handle em values (using a baseline assumption of 16px)
-        em_match = re.search(r'([\d.]+)em', size_value)
-        if em_match:
-            return float(em_match.group(1)) * 16  # Assume 1em = 16px
-            
-        # Handle rem values (using a baseline assumption of 16px)
-        rem_match = re.search(r'([\d.]+)rem', size_value)
-        if rem_match:
-            return float(rem_match.group(1)) * 16  # Assume 1rem = 16px
-            
-        # Handle percentage (using a baseline assumption of 16px)
-        percent_match = re.search(r'([\d.]+)%', size_value)
-        if percent_match:
-            return float(percent_match.group(1)) * 0.16  # Assume 100% = 16px
-            
-        # Handle named sizes (approximate conversion to pixels)
-        named_sizes = {
-            'xx-small': 9,
-            'x-small': 10,
-            'small': 13,
-            'medium': 16,
-            'large': 18,
-            'x-large': 24,
-            'xx-large': 32,
-        }
-        
-        size_value = size_value.lower().strip()
-        if size_value in named_sizes:
-            return named_sizes[size_value]
-            
-        return None
+        return extract_font_size(size_value)
     
     def _calculate_contrast_ratio(self, color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> float:
         """
@@ -284,15 +658,7 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Contrast ratio as a float
         """
-        # Calculate relative luminance for each color
-        luminance1 = self._relative_luminance(color1)
-        luminance2 = self._relative_luminance(color2)
-        
-        # Calculate contrast ratio
-        if luminance1 > luminance2:
-            return (luminance1 + 0.05) / (luminance2 + 0.05)
-        else:
-            return (luminance2 + 0.05) / (luminance1 + 0.05)
+        return contrast_ratio(color1, color2)
     
     def _relative_luminance(self, color: Tuple[int, int, int]) -> float:
         """
@@ -304,35 +670,7 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Relative luminance value
         """
-        r, g, b = color
-        
-        # Convert RGB values to sRGB
-        r_srgb = r / 255.0
-        g_srgb = g / 255.0
-        b_srgb = b / 255.0
-        
-        # Apply transformation
-        r_linear = self._srgb_to_linear(r_srgb)
-        g_linear = self._srgb_to_linear(g_srgb)
-        b_linear = self._srgb_to_linear(b_srgb)
-        
-        # Calculate luminance
-        return 0.2126 * r_linear + 0.7152 * g_linear + 0.0722 * b_linear
-    
-    def _srgb_to_linear(self, value: float) -> float:
-        """
-        Convert sRGB value to linear RGB value.
-        
-        Args:
-            value: sRGB value (0-1)
-            
-        Returns:
-            Linear RGB value
-        """
-        if value <= 0.03928:
-            return value / 12.92
-        else:
-            return ((value + 0.055) / 1.055) ** 2.4
+        return relative_luminance(color)
     
     def _rgb_to_hex(self, color: Tuple[int, int, int]) -> str:
         """
@@ -345,7 +683,11 @@ class Criterion_1_4_3(BaseCriterion):
             Hex color string
         """
         r, g, b = color
-        return f'#{r:02x}{g:02x}{b:02x}'
+        try:
+            return '#' + _HEX_BYTE[r] + _HEX_BYTE[g] + _HEX_BYTE[b]
+        except IndexError:
+            # Out of range values from rgb() are formatted as they are
+            return f'#{r:02x}{g:02x}{b:02x}'
     
     def _adjust_color_for_contrast(self, 
                                   fg_color: Tuple[int, int, int], 
@@ -362,57 +704,11 @@ class Criterion_1_4_3(BaseCriterion):
         Returns:
             Adjusted RGB tuple for foreground color
         """
-        # Convert RGB to HSL for more intuitive adjustment
-        r, g, b = fg_color
-        h, l, s = colorsys.rgb_to_hls(r/255.0, g/255.0, b/255.0)
-        
-        # Calculate current contrast ratio
-        current_ratio = self._calculate_contrast_ratio(fg_color, bg_color)
-        
-        # Determine if we need to lighten or darken the foreground
-        bg_luminance = self._relative_luminance(bg_color)
-        fg_luminance = self._relative_luminance(fg_color)
-        
-        # Adjust lightness to increase contrast
-        adjust_up = bg_luminance < 0.5
-        
-        # Binary search to find the right lightness value
-        min_l = 0.0
-        max_l = 1.0
-        
-        for _ in range(10):  # 10 iterations should be sufficient
-            if adjust_up:
-                new_l = (max_l + l) / 2
-            else:
-                new_l = (min_l + l) / 2
-                
-            # Convert back to RGB and calculate new contrast
-            r_new, g_new, b_new = colorsys.hls_to_rgb(h, new_l, s)
-            new_fg_color = (int(r_new * 255), int(g_new * 255), int(b_new * 255))
-            new_ratio = self._calculate_contrast_ratio(new_fg_color, bg_color)
-            
-            # Check if we've reached our target
-            if new_ratio >= target_ratio:
-                if adjust_up:
-                    max_l = new_l
-                else:
-                    min_l = new_l
-            else:
-                if adjust_up:
-                    l = new_l
-                else:
-                    l = new_l
-            
-            # If we're close enough, return the result
-            if abs(new_ratio - target_ratio) < 0.1:
-                break
-        
-        # Convert final values to RGB
-        r_final, g_final, b_final = colorsys.hls_to_rgb(h, new_l, s)
-        return (int(r_final * 255), int(g_final * 255), int(b_final * 255))
+        return adjust_color_for_contrast(fg_color, bg_color, target_ratio)
     
     def _generate_contrast_solution(self, 
                                    element: Tag, 
+                                   inline_styles: Dict[str, str],
                                    fg_color: Tuple[int, int, int], 
                                    bg_color: Tuple[int, int, int], 
                                    min_contrast: float) -> str:
@@ -421,6 +717,7 @@ class Criterion_1_4_3(BaseCriterion):
         
         Args:
             element: BeautifulSoup element
+            inline_styles: Parsed inline styles of the element
             fg_color: RGB tuple for foreground color
             bg_color: RGB tuple for background color
             min_contrast: Minimum required contrast ratio
@@ -432,33 +729,13 @@ class Criterion_1_4_3(BaseCriterion):
         adjusted_fg = self._adjust_color_for_contrast(fg_color, bg_color, min_contrast)
         
         # Create the CSS property to update
-        fg_hex = self._rgb_to_hex(fg_color)
         adjusted_fg_hex = self._rgb_to_hex(adjusted_fg)
-        bg_hex = self._rgb_to_hex(bg_color)
         
-        # Create inline style solution
-        if element.has_attr('style'):
-            original_style = element['style']
-            # Replace color property in style
-            new_style = re.sub(r'color\s*:\s*[^;]+', f'color: {adjusted_fg_hex}', original_style)
-            if new_style == original_style:  # Color wasn't in the style attribute
-                new_style = original_style + f'; color: {adjusted_fg_hex}'
-                
-            attributes = ' '.join([f'{k}="{v}"' for k, v in element.attrs.items() if k != 'style'])
-            return f'<{element.name} {attributes} style="{new_style}">{element.get_text()}</{element.name}>'
-        else:
-            # Add new style attribute
-            attributes = ' '.join([f'{k}="{v}"' for k, v in element.attrs.items()])
-            return f'<{element.name} {attributes} style="color: {adjusted_fg_hex}">{element.get_text()}</{element.name}>'
-        
-        # Alternative: provide a CSS class solution
-        css_class_solution = f"""/* Add this to your CSS file */
-.accessible-text {{
-  color: {adjusted_fg_hex};
-  /* Alternatively, you could darken/lighten the background instead */
-}}
-
-/* Then apply the class to your element */
-<{element.name} class="accessible-text">Your text</{element.name}>"""
+        # Create inline style solution, replacing or adding the color property.
+        # The parsed styles are shared, so they are copied before the change
+        new_styles = dict(inline_styles)
+        new_styles['color'] = adjusted_fg_hex
+        new_style = '; '.join([f'{prop}: {value}' for prop, value in new_styles.items()])
         
-        return css_class_solution
\ No newline at end of file
+        attributes = ' '.join([f'{k}="{v}"' for k, v in element.attrs.items() if k != 'style'])
+        return f'<{element.name} {attributes} style="{new_style}">{element.get_text()}</{element.name}>'
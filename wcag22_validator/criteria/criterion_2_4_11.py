@@ -5,14 +5,121 @@ When a user interface component receives keyboard focus, the component is not
 entirely hidden due to author-created content.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+import functools
 import re
 from bs4 import BeautifulSoup, Tag
 
-from .base import BaseCriterion
+from .base import BaseCriterion, get_document_cache
 from ..reporter import ValidationIssue
 
 
+# Elements that are focusable without any attributes
+_FOCUSABLE_TAGS = frozenset(['a', 'button', 'input', 'select', 'textarea'])
+
+# Elements that are commonly fixed or sticky
+_OBSCURING_TAGS = frozenset(['header', 'nav'])
+
+# Roles that imply focusability
+_FOCUSABLE_ROLES = frozenset(['button', 'link', 'checkbox', 'radio', 'menuitem', 'tab'])
+
+# CSS properties that may cause elements to obscure focused elements
+_OBSCURING_PROPERTIES = (
+    'position: fixed',
+    'position: sticky',
+    'position: absolute',
+    'z-index',
+    'transform: translate',
+    'top: 0',
+    'bottom: 0',
+    'left: 0',
+    'right: 0'
+)
+
+# Classes commonly used for fixed position elements
+_OBSCURING_CLASSES = (
+    'header', 'navbar', 'nav-fixed', 'sticky', 'fixed', 'fixed-top',
+    'sticky-top', 'navbar-fixed', 'fixed-bottom', 'modal', 'overlay',
+    'tooltip', 'dropdown', 'popover'
+)
+
+# Any of the properties above, found in a single search of a lowercased style
+_OBSCURING_PROPERTIES_RE = re.compile('|'.join(map(re.escape, _OBSCURING_PROPERTIES)))
+
+# ARIA roles of modal elements
+_MODAL_ROLES = frozenset(['dialog', 'alertdialog', 'tooltip'])
+
+# Terms in lowercased classes and ids that suggest the kind of an obscuring element
+_MODAL_CLASS_RE = re.compile(r'modal|overlay|dialog|popup|tooltip|dropdown')
+_MODAL_ID_RE = re.compile(r'modal|overlay|dialog|popup')
+_HEADER_CLASS_RE = re.compile(r'header|navbar|nav|fixed-top|sticky-top')
+_HEADER_ID_RE = re.compile(r'header|navbar|nav')
+_FOOTER_CLASS_RE = re.compile(r'footer|fixed-bottom')
+
+# Kinds of obscuring elements, combined as bit flags
+_MODAL_OR_OVERLAY = 1
+_FIXED_HEADER = 2
+_FIXED_FOOTER = 4
+
+# Any of the classes above, or ids commonly used for headers, navbars,
+# modals and overlays, matched in a single search each
+_OBSCURING_CLASS_RE = re.compile('|'.join(map(re.escape, _OBSCURING_CLASSES)), re.IGNORECASE)
+_OBSCURING_ID_RE = re.compile(r'header|navbar|nav|modal|overlay|dialog|popup', re.IGNORECASE)
+
+
+# Solution for modals and overlays, filled in with the element paths
+_MODAL_SOLUTION = """// JavaScript solution to prevent the modal/overlay from obscuring focused elements
+document.querySelector('{focusable}').addEventListener('focus', function() {{
+  // Option 1: If the overlay is shown by default but should be hidden on focus
+  document.querySelector('{obscuring}').style.display = 'none';
+  
+  // Option 2: If the overlay is positioned, adjust its position or z-index
+  // document.querySelector('{obscuring}').style.zIndex = '0';
+  
+  // Option 3: Scroll the focused element into view ensuring it's not obscured
+  this.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+}});"""
+
+# Solution for fixed headers and footers, filled in with the element paths
+_FIXED_SOLUTION = """// CSS solution using :focus-within to adjust fixed header/footer when child elements are focused
+{obscuring} {{
+  position: fixed;
+  /* other styles */
+}}
+
+/* When an element within the document receives focus, adjust the fixed element */
+body:focus-within {obscuring} {{
+  /* Option 1: Temporarily make it position:absolute instead of fixed */
+  position: absolute;
+  
+  /* Option 2: Add padding to ensure the focused element is visible */
+  /* padding-top: 40px; */
+  
+  /* Option 3: Adjust z-index to ensure focused elements appear above */
+  /* z-index: 0; */
+}}
+
+// Alternative JavaScript solution
+document.querySelector('{focusable}').addEventListener('focus', function() {{
+  // When this element is focused, adjust the header/footer to ensure it's visible
+  const headerEl = document.querySelector('{obscuring}');
+  
+  // Save original position to restore later
+  const originalPosition = headerEl.style.position;
+  
+  // Temporarily adjust position
+  headerEl.style.position = 'absolute';  // or adjust z-index, opacity, etc.
+  
+  // When focus leaves, restore original position
+  this.addEventListener('blur', function() {{
+    headerEl.style.position = originalPosition;
+  }}, {{ once: true }});  // Use once:true to clean up the event listener
+  
+  // Ensure the focused element is fully visible
+  this.scrollIntoView({{ behavior: 'smooth', block: 'nearest' }});
+}});"""
+
+
 class Criterion_2_4_11(BaseCriterion):
     """
     Implements WCAG 2.2 Success Criterion 2.4.11: Focus Not Obscured (Minimum).
@@ -25,36 +132,14 @@ class Criterion_2_4_11(BaseCriterion):
     provides a best-effort static analysis looking for potential issues.
     """
     
-    def __init__(self):
-        super().__init__()
-        self.id = "2.4.11"
-        self.name = "Focus Not Obscured (Minimum)"
-        self.level = "AA"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/focus-not-obscured-minimum.html"
-        self.description = """
-        When a user interface component receives keyboard focus, the component is not
-        entirely hidden due to author-created content.
-        """
-        
-        # CSS properties that may cause elements to obscure focused elements
-        self.potential_obscuring_properties = [
-            'position: fixed', 
-            'position: sticky',
-            'position: absolute',
-            'z-index',
-            'transform: translate',
-            'top: 0',
-            'bottom: 0',
-            'left: 0',
-            'right: 0'
-        ]
-        
-        # Classes commonly used for fixed position elements
-        self.potential_obscuring_classes = [
-            'header', 'navbar', 'nav-fixed', 'sticky', 'fixed', 'fixed-top',
-            'sticky-top', 'navbar-fixed', 'fixed-bottom', 'modal', 'overlay',
-            'tooltip', 'dropdown', 'popover'
-        ]
+    id = "2.4.11"
+    name = "Focus Not Obscured (Minimum)"
+    level = "AA"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/focus-not-obscured-minimum.html"
+    description = """
+    When a user interface component receives keyboard focus, the component is not
+    entirely hidden due to author-created content.
+    """
     
     def validate(self, soup: BeautifulSoup, html_content: str) -> List[ValidationIssue]:
         """
@@ -70,337 +155,202 @@ class Criterion_2_4_11(BaseCriterion):
         Returns:
             List of ValidationIssue objects
         """
-        issues = []
+        return list(self.validate_iter(soup, html_content))
+    
+    def validate_iter(self, soup: BeautifulSoup, html_content: str) -> Iterator[ValidationIssue]:
+        """
+        Validate HTML content against 2.4.11 criterion, yielding issues as
+        they are found.
         
-        # Find potentially obscuring elements (fixed/sticky positioned)
-        potentially_obscuring_elements = self._find_potentially_obscuring_elements(soup)
+        Pages with many focusable and fixed elements can have a large number
+        of issues; consuming them one at a time avoids holding them all.
         
-        # Find all focusable elements
-        focusable_elements = self._find_focusable_elements(soup)
+        Args:
+            soup: BeautifulSoup object of the HTML content
+            html_content: Original HTML content as string
+            
+        Yields:
+            ValidationIssue objects
+        """
+        # Find potentially obscuring elements (fixed/sticky positioned) and
+        # focusable elements
+        potentially_obscuring_elements, focusable_elements = self._find_elements_to_check(soup)
+        
+        # Classify each potentially obscuring element and find its path once,
+        # rather than for every focusable element it is compared with.
+        # Elements of no known kind can't cause issues and are left out
+        obscuring_kinds = []
+        for obscuring in potentially_obscuring_elements:
+            kind = self._classify_obscuring(obscuring)
+            if kind:
+                obscuring_kinds.append((obscuring, kind, self.get_element_path(obscuring)))
+        
+        # Nothing can obscure focused elements on this page
+        if not obscuring_kinds:
+            return
         
         # Check for potential issues where focusable elements could be obscured
         for focusable in focusable_elements:
-            element_path = self.get_element_path(focusable)
-            element_html = str(focusable)
-            line_number = self.get_line_number(focusable, html_content)
+            # The element's path and line number are worked out with its first
+            # issue, as most focusable elements have none. Its HTML is only
+            # built when an issue's HTML is read, once for all its issues
+            element_path = None
+            
+            # Elements containing the focusable element are less likely to be an issue
+            ancestor_ids = {id(parent) for parent in focusable.parents}
             
             # Check for potentially conflicting elements
-            for obscuring in potentially_obscuring_elements:
-                # Skip self-comparison
-                if obscuring is focusable:
+            for obscuring, kind, obscuring_path in obscuring_kinds:
+                # Skip self-comparison and ancestors
+                if obscuring is focusable or id(obscuring) in ancestor_ids:
                     continue
-                    
-                # Check if this is a potential issue based on element types and positions
-                if self._could_potentially_obscure(obscuring, focusable):
-                    obscuring_path = self.get_element_path(obscuring)
-                    
-                    issues.append(self.create_issue(
-                        element_path=element_path,
-                        element_html=element_html,
-                        description=f"Focusable element could potentially be obscured by fixed/sticky element: {obscuring_path}",
-                        impact="moderate",
-                        how_to_fix="Ensure that when this element receives focus, it is not entirely hidden behind fixed or sticky content. Add code to adjust the position of fixed elements when this element receives focus.",
-                        code_solution=self._generate_focus_solution(focusable, obscuring),
-                        line_number=line_number
-                    ))
-        
-        return issues
+                
+                if element_path is None:
+                    element_path = self.get_element_path(focusable)
+                    element_html = functools.partial(self.get_element_html, focusable, get_document_cache())
+                    line_number = self.get_line_number(focusable, html_content)
+                
+                yield self.create_issue(
+                    element_path=element_path,
+                    element_html=element_html,
+                    description=f"Focusable element could potentially be obscured by fixed/sticky element: {obscuring_path}",
+                    impact="moderate",
+                    how_to_fix="Ensure that when this element receives focus, it is not entirely hidden behind fixed or sticky content. Add code to adjust the position of fixed elements when this element receives focus.",
+                    code_solution=functools.partial(self._generate_focus_solution, element_path, obscuring_path, kind),
+                    line_number=line_number
+                )
     
-    def _find_potentially_obscuring_elements(self, soup: BeautifulSoup) -> List[Tag]:
+    def _find_elements_to_check(self, soup: BeautifulSoup) -> Tuple[List[Tag], List[Tag]]:
         """
-        Find elements that could potentially obscure focused elements.
+        Find elements that could potentially obscure focused elements, and
+        potentially focusable elements, in a single pass over the document.
         
         Args:
             soup: BeautifulSoup object
             
         Returns:
-            List of potentially obscuring elements
+            Tuple of (potentially obscuring elements, focusable elements),
+            each in document order
         """
-        result = []
+        obscuring = []
+        focusable = []
         
-        # Find elements with inline styles that could cause obscuring
-        for element in soup.find_all(lambda tag: tag.has_attr('style')):
-            style = element.get('style', '').lower()
+        for tag in self.find_elements(soup):
+            attrs = tag.attrs
             
-            if any(prop in style for prop in self.potential_obscuring_properties):
-                result.append(element)
-        
-        # Find elements with classes commonly used for fixed/sticky elements
-        for class_name in self.potential_obscuring_classes:
-            elements = soup.find_all(class_=re.compile(class_name, re.IGNORECASE))
-            result.extend(elements)
-        
-        # Find header, footer, navbar elements (commonly fixed or sticky)
-        result.extend(soup.find_all(['header', 'nav']))
-        result.extend(soup.find_all(id=re.compile(r'header|navbar|nav', re.IGNORECASE)))
-        
-        # Find potential modal or overlay elements
-        result.extend(soup.find_all(id=re.compile(r'modal|overlay|dialog|popup', re.IGNORECASE)))
-        
-        return result
-    
-    def _find_focusable_elements(self, soup: BeautifulSoup) -> List[Tag]:
-        """
-        Find all potentially focusable elements.
-        
-        Args:
-            soup: BeautifulSoup object
+            if self._is_potentially_obscuring(tag, attrs):
+                obscuring.append(tag)
             
-        Returns:
-            List of focusable elements
-        """
-        result = []
-        
-        # Naturally focusable elements
-        result.extend(soup.find_all(['a', 'button', 'input', 'select', 'textarea']))
-        
-        # Elements with tabindex
-        result.extend(soup.find_all(lambda tag: tag.has_attr('tabindex') and tag['tabindex'] != '-1'))
-        
-        # Elements with click handlers (might be keyboard focusable)
-        result.extend(soup.find_all(lambda tag: any(attr for attr in tag.attrs if attr.startswith('on'))))
-        
-        # Elements with role that implies focusability
-        focusable_roles = ['button', 'link', 'checkbox', 'radio', 'menuitem', 'tab']
-        result.extend(soup.find_all(lambda tag: tag.has_attr('role') and tag['role'] in focusable_roles))
-        
-        return result
+            # Naturally focusable elements, elements with tabindex, elements
+            # with click handlers (might be keyboard focusable) and elements
+            # with a role that implies focusability
+            if (tag.name in _FOCUSABLE_TAGS or
+                    attrs.get('tabindex', '-1') != '-1' or
+                    any(attr.startswith('on') for attr in attrs) or
+                    attrs.get('role') in _FOCUSABLE_ROLES):
+                focusable.append(tag)
+        
+        return obscuring, focusable
     
-    def _could_potentially_obscure(self, obscuring: Tag, focusable: Tag) -> bool:
+    def _is_potentially_obscuring(self, tag: Tag, attrs: dict) -> bool:
         """
-        Determine if one element could potentially obscure another.
-        
-        This is a heuristic since we can't do real layout calculation
-        in static analysis.
+        Check if an element could potentially obscure focused elements.
         
         Args:
-            obscuring: Potentially obscuring element
-            focusable: Focusable element that might be obscured
+            tag: Element to check
+            attrs: Attributes of the element
             
         Returns:
-            True if there's a potential obscuring issue
+            True if the element could obscure focused elements
         """
-        # If the obscuring element is a parent of the focusable element, it's less likely to be an issue
-        if focusable in obscuring.find_all():
-            return False
-        
-        # Check for modals, tooltips, or overlays that might appear on focus/click
-        if self._is_likely_modal_or_overlay(obscuring):
-            return True
-        
-        # Check for fixed headers or navbars that could obscure elements near the top
-        if self._is_likely_fixed_header(obscuring):
-            # Heuristic: check if focusable element might be near the top
-            return True
-        
-        # Check for fixed footers that could obscure elements near the bottom
-        if self._is_likely_fixed_footer(obscuring):
-            # Heuristic: check if focusable element might be near the bottom
+        # Header and navbar elements (commonly fixed or sticky)
+        if tag.name in _OBSCURING_TAGS:
             return True
         
-        return False
-    
-    def _is_likely_modal_or_overlay(self, element: Tag) -> bool:
-        """
-        Check if an element is likely a modal, tooltip, or overlay.
-        
-        Args:
-            element: Element to check
-            
-        Returns:
-            True if element is likely a modal or overlay
-        """
-        # Check for modal-related properties
-        if element.has_attr('class'):
-            classes = ' '.join(element['class']).lower()
-            if any(term in classes for term in ['modal', 'overlay', 'dialog', 'popup', 'tooltip', 'dropdown']):
-                return True
-        
-        # Check for modal-related IDs
-        if element.has_attr('id'):
-            element_id = element['id'].lower()
-            if any(term in element_id for term in ['modal', 'overlay', 'dialog', 'popup']):
+        # Inline styles that could cause obscuring
+        style = attrs.get('style')
+        if style:
+            style = style.lower()
+            if _OBSCURING_PROPERTIES_RE.search(style):
                 return True
         
-        # Check for ARIA roles
-        if element.has_attr('role') and element['role'] in ['dialog', 'alertdialog', 'tooltip']:
-            return True
-        
-        # Check for common modal style properties
-        if element.has_attr('style'):
-            style = element['style'].lower()
-            if 'position: fixed' in style and ('z-index' in style or 'opacity' in style):
+        # Classes commonly used for fixed/sticky elements
+        classes = attrs.get('class')
+        if classes:
+            if not isinstance(classes, str):
+                classes = ' '.join(classes)
+            if _OBSCURING_CLASS_RE.search(classes):
                 return True
         
-        return False
+        # Header, navbar, modal or overlay ids
+        element_id = attrs.get('id')
+        return bool(element_id and _OBSCURING_ID_RE.search(element_id))
     
-    def _is_likely_fixed_header(self, element: Tag) -> bool:
+    def _classify_obscuring(self, obscuring: Tag) -> int:
         """
-        Check if an element is likely a fixed header or navbar.
-        
-        Args:
-            element: Element to check
-            
-        Returns:
-            True if element is likely a fixed header
-        """
-        # Check element type
-        if element.name in ['header', 'nav']:
-            return True
+        Determine how an element could potentially obscure focused elements.
         
-        # Check for header-related classes
-        if element.has_attr('class'):
-            classes = ' '.join(element['class']).lower()
-            if any(term in classes for term in ['header', 'navbar', 'nav', 'fixed-top', 'sticky-top']):
-                return True
-        
-        # Check for header-related IDs
-        if element.has_attr('id'):
-            element_id = element['id'].lower()
-            if any(term in element_id for term in ['header', 'navbar', 'nav']):
-                return True
-        
-        # Check for fixed position styles
-        if element.has_attr('style'):
-            style = element['style'].lower()
-            if ('position: fixed' in style or 'position: sticky' in style) and ('top: 0' in style or 'top:0' in style):
-                return True
-        
-        return False
-    
-    def _is_likely_fixed_footer(self, element: Tag) -> bool:
-        """
-        Check if an element is likely a fixed footer.
+        This is a heuristic since we can't do real layout calculation
+        in static analysis. Each attribute is read once and shared by the
+        checks for all kinds.
         
         Args:
-            element: Element to check
+            obscuring: Potentially obscuring element
             
         Returns:
-            True if element is likely a fixed footer
+            Bit flags of the kinds of obscuring element it is likely to be,
+            0 if it is not likely to obscure focused elements
         """
-        # Check element type
-        if element.name == 'footer':
-            return True
+        attrs = obscuring.attrs
+        classes = attrs.get('class') or ''
+        if not isinstance(classes, str):
+            classes = ' '.join(classes)
+        classes = classes.lower()
+        element_id = (attrs.get('id') or '').lower()
+        style = (attrs.get('style') or '').lower()
+        
+        is_fixed = 'position: fixed' in style
+        is_fixed_or_sticky = is_fixed or 'position: sticky' in style
+        
+        kind = 0
+        
+        # Check for modals, tooltips, or overlays that might appear on focus/click,
+        # by class, id, ARIA role or common modal style properties
+        if (_MODAL_CLASS_RE.search(classes) or _MODAL_ID_RE.search(element_id) or
+                attrs.get('role') in _MODAL_ROLES or
+                (is_fixed and ('z-index' in style or 'opacity' in style))):
+            kind |= _MODAL_OR_OVERLAY
         
-        # Check for footer-related classes
-        if element.has_attr('class'):
-            classes = ' '.join(element['class']).lower()
-            if any(term in classes for term in ['footer', 'fixed-bottom']):
-                return True
-        
-        # Check for footer-related IDs
-        if element.has_attr('id'):
-            element_id = element['id'].lower()
-            if 'footer' in element_id:
-                return True
+        # Check for fixed headers or navbars that could obscure elements near the top
+        if (obscuring.name in ('header', 'nav') or
+                _HEADER_CLASS_RE.search(classes) or _HEADER_ID_RE.search(element_id) or
+                (is_fixed_or_sticky and ('top: 0' in style or 'top:0' in style))):
+            kind |= _FIXED_HEADER
         
-        # Check for fixed position styles at bottom
-        if element.has_attr('style'):
-            style = element['style'].lower()
-            if ('position: fixed' in style or 'position: sticky' in style) and ('bottom: 0' in style or 'bottom:0' in style):
-                return True
+        # Check for fixed footers that could obscure elements near the bottom
+        if (obscuring.name == 'footer' or
+                _FOOTER_CLASS_RE.search(classes) or 'footer' in element_id or
+                (is_fixed_or_sticky and ('bottom: 0' in style or 'bottom:0' in style))):
+            kind |= _FIXED_FOOTER
         
-        return False
+        return kind
     
-    def _generate_focus_solution(self, focusable: Tag, obscuring: Tag) -> str:
+    def _generate_focus_solution(self, focusable_path: str, obscuring_path: str, kind: int) -> str:
         """
         Generate a solution for focus obscuring issue.
         
         Args:
-            focusable: The focusable element
-            obscuring: The potentially obscuring element
+            focusable_path: Path of the focusable element
+            obscuring_path: Path of the potentially obscuring element
+            kind: Kind flags of the obscuring element
             
         Returns:
             Code solution as string
         """
-        focusable_path = self.get_element_path(focusable)
-        obscuring_path = self.get_element_path(obscuring)
+        # Issues are only reported for modals, overlays and fixed headers or footers
+        if kind & _MODAL_OR_OVERLAY:
+            template = _MODAL_SOLUTION
+        else:
+            template = _FIXED_SOLUTION
         
-        if self._is_likely_modal_or_overlay(obscuring):
-            return f"""// JavaScript solution to prevent the modal/overlay from obscuring focused elements
-document.querySelector('{focusable_path}').addEventListener('focus', function() {{
-  // Option 1: If the overlay is shown by default but should be hidden on focus
-  document.querySelector('{obscuring_path}').style.display = 'none';
-  
-  // Option 2: If the overlay is positioned, adjust its position or z-index
-  // document.querySelector('{obscuring_path}').style.zIndex = '0';
-  
-  // Option 3: Scroll the focused element into view ensuring it's not obscured
-  this.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-}});"""
-        
-        if self._is_likely_fixed_header(obscuring) or self._is_likely_fixed_footer(obscuring):
-            return f"""// CSS solution using :focus-within to adjust fixed header/footer when child elements are focused
-{obscuring_path} {{
-  position: fixed;
-  /* other styles */
-}}
-
-/* When an element within the document receives focus, adjust the fixed element */
-body:focus-within {obscuring_path} {{
-  /* Option 1: Temporarily make it position:absolute instead of fixed */
-  position: absolute;
-  
-  /* Option 2: Add padding to ensure the focused element is visible */
-  /* padding-top: 40px; */
-  
-  /* Option 3: Adjust z-index to ensure focused elements appear above */
-  /* z-index: 0; */
-}}
-
-// Alternative JavaScript solution
-document.querySelector('{focusable_path}').addEventListener('focus', function() {{
-  // When this element is focused, adjust the header/footer to ensure it's visible
-  const headerEl = document.querySelector('{obscuring_path}');
-  
-  // Save original position to restore later
-  const originalPosition = headerEl.style.position;
-  
-  // Temporarily adjust position
-  headerEl.style.position = 'absolute';  // or adjust z-index, opacity, etc.
-  
-  // When focus leaves, restore original position
-  this.addEventListener('blur', function() {{
-    headerEl.style.position = originalPosition;
-  }}, {{ once: true }});  // Use once:true to clean up the event listener
-  
-  // Ensure the focused element is fully visible
-  this.scrollIntoView({{ behavior: 'smooth', block: 'nearest' }});
-}});"""
-        
-        # Generic solution
-        return f"""// Generic solution to prevent elements from being obscured during focus
-// Add this JavaScript to your site
-
-document.querySelector('{focusable_path}').addEventListener('focus', function() {{
-  // Get the potentially obscuring element
-  const obscuringElement = document.querySelector('{obscuring_path}');
-  
-  // Get bounding rectangles to determine if there's overlap
-  const focusedRect = this.getBoundingClientRect();
-  const obscuringRect = obscuringElement.getBoundingClientRect();
-  
-  // Check if the focused element is completely covered
-  const isCompletelyObscured = 
-    focusedRect.top >= obscuringRect.top &&
-    focusedRect.bottom <= obscuringRect.bottom &&
-    focusedRect.left >= obscuringRect.left &&
-    focusedRect.right <= obscuringRect.right;
-  
-  if (isCompletelyObscured) {{
-    // Option 1: Temporarily adjust the obscuring element's styles
-    obscuringElement.style.setProperty('z-index', '-1', 'important');
-    
-    // Option 2: Scroll the focused element into view
-    this.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-    
-    // Option 3: If it's a modal/overlay, temporarily hide it
-    // obscuringElement.style.display = 'none';
-    
-    // Restore original state when focus leaves
-    this.addEventListener('blur', function() {{
-      obscuringElement.style.removeProperty('z-index');
-      // If using option 3: obscuringElement.style.display = '';
-    }}, {{ once: true }});
-  }}
-}});"""
\ No newline at end of file
+        return template.format(focusable=focusable_path, obscuring=obscuring_path)
\ No newline at end of file
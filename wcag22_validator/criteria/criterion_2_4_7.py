@@ -5,7 +5,8 @@ Any keyboard operable user interface has a mode of operation where the
 keyboard focus indicator is visible.
 """
 
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Pattern
+import functools
 import re
 from bs4 import BeautifulSoup, Tag
 
@@ -13,6 +14,116 @@ from .base import BaseCriterion
 from ..reporter import ValidationIssue
 
 
+# Naturally focusable elements that should show focus, matched for
+# a[href], input:not([type="hidden"]) and the tags below
+_FOCUSABLE_TAGS = frozenset(['button', 'select', 'textarea'])
+
+# Ids or class names suggesting an element gets focus styles, in any case
+_FOCUS_NAME_RE = re.compile('focus', re.IGNORECASE)
+
+# Class name fragments of frameworks that could override focus, in any case
+_FRAMEWORK_CLASS_RE = re.compile('btn|button|form-control|input-|select-|custom-', re.IGNORECASE)
+
+# Properties that would make focus visible, in any case
+_VISIBLE_FOCUS_PROPERTIES_RE = re.compile(
+    'outline:|border:|background-color:|background:|box-shadow:|'
+    'text-decoration:|color:|font-weight:|transform:',
+    re.IGNORECASE
+)
+
+
+# Solution for an element missing focus styles, filled in with its path and HTML
+_FOCUS_STYLE_SOLUTION = """/* Add this to your CSS */
+{selector}:focus {{
+  outline: 2px solid #4d90fe;  /* Blue focus ring */
+  outline-offset: 2px;        /* Offset to make it stand out */
+}}
+
+/* If you must remove the default outline, always provide an alternative */
+{selector}:focus {{
+  outline: none;              /* Remove default if needed */
+  box-shadow: 0 0 0 3px rgba(66, 153, 225, 0.5);  /* Alternative visible focus style */
+}}
+
+/* For your HTML element */
+{html}
+"""
+
+# Solutions for a style element hiding focus, filled in with its improved or
+# original CSS
+_STYLE_ELEMENT_SOLUTION = """<style>
+{style}
+</style>"""
+
+_STYLE_ELEMENT_FALLBACK_SOLUTION = """<style>
+/* Original style with problematic focus handling */
+{style}
+
+/* Add these improved focus styles */
+a:focus, button:focus, input:focus, select:focus, textarea:focus, [tabindex]:focus {{
+  outline: 2px solid #4d90fe;
+  outline-offset: 2px;
+}}
+</style>"""
+
+# Solution for an insufficient focus style, filled in with its selector
+_SUFFICIENT_FOCUS_STYLE_SOLUTION = """/* Replace your current {selector} style with this improved version */
+{selector} {{
+  /* Clear visibility enhancements */
+  outline: 2px solid #4d90fe;  /* Blue focus ring */
+  outline-offset: 2px;         /* Offset to make it stand out */
+  
+  /* Optional additional enhancements */
+  box-shadow: 0 0 0 3px rgba(66, 153, 225, 0.5);
+  transition: outline 0.1s ease-in-out;
+}}
+
+/* For high contrast mode support */
+@media screen and (forced-colors: active) {{
+  {selector} {{
+    outline: 2px solid HighlightText;
+    outline-offset: 2px;
+  }}
+}}
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def has_visible_focus_style(style_content: str, selector_re: Pattern) -> bool:
+    """
+    Check if the first rule for a focus selector declares a visible style.
+    
+    Results are cached, as the same style element is often repeated across
+    the pages of a site, and its declaration block is then only searched
+    for once.
+    
+    The declaration block is the first {...} after the first occurrence of
+    the selector. If that occurrence has no complete block after it, no
+    later one does either, so the CSS is scanned at most once.
+    
+    Args:
+        style_content: CSS content as string
+        selector_re: Pattern matching the selector
+    
+    Returns:
+        True if the declarations include a property that makes focus visible
+    """
+    # Try to find the selector and its declaration block
+    match = selector_re.search(style_content)
+    if not match:
+        return False
+    
+    block_start = style_content.find('{', match.end())
+    if block_start < 0:
+        return False
+    
+    block_end = style_content.find('}', block_start + 1)
+    if block_end < 0:
+        return False
+    
+    return _VISIBLE_FOCUS_PROPERTIES_RE.search(style_content, block_start + 1, block_end) is not None
+
+
 class Criterion_2_4_7(BaseCriterion):
     """
     Implements WCAG 2.2 Success Criterion 2.4.7: Focus Visible.
@@ -21,17 +132,17 @@ class Criterion_2_4_7(BaseCriterion):
     interactive elements receive focus.
     """
     
+    id = "2.4.7"
+    name = "Focus Visible"
+    level = "AA"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/focus-visible.html"
+    description = """
+    Any keyboard operable user interface has a mode of operation where the 
+    keyboard focus indicator is visible.
+    """
+    
     def __init__(self):
         super().__init__()
-        self.id = "2.4.7"
-        self.name = "Focus Visible"
-        self.level = "AA"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/focus-visible.html"
-        self.description = """
-        Any keyboard operable user interface has a mode of operation where the 
-        keyboard focus indicator is visible.
-        """
-        
         # CSS properties that might hide focus indicators
         self.focus_hiding_css = [
             'outline: none', 
@@ -53,16 +164,15 @@ class Criterion_2_4_7(BaseCriterion):
             ':focus-visible'
         ]
         
-        # Naturally focusable elements that should show focus
-        self.focusable_elements = [
-            'a[href]',
-            'button',
-            'input:not([type="hidden"])',
-            'select',
-            'textarea',
-            '[tabindex]:not([tabindex="-1"])',
-            '[contenteditable="true"]'
-        ]
+        # Any of the focus hiding CSS above, found in a single search of
+        # lowercased CSS, any of the focus selectors as written, and each
+        # focus selector in any case
+        self._focus_hiding_re = re.compile('|'.join(re.escape(focus_css) for focus_css in self.focus_hiding_css))
+        self._any_focus_selector_re = re.compile('|'.join(re.escape(selector) for selector in self.focus_style_selectors))
+        self._focus_selector_res = {
+            selector: re.compile(re.escape(selector), re.IGNORECASE)
+            for selector in self.focus_style_selectors
+        }
     
     def validate(self, soup: BeautifulSoup, html_content: str) -> List[ValidationIssue]:
         """
@@ -79,132 +189,135 @@ class Criterion_2_4_7(BaseCriterion):
         Returns:
             List of ValidationIssue objects
         """
-        issues = []
-        
-        # Check inline styles that might hide focus
-        self._check_inline_styles(soup, issues, html_content)
-        
-        # Check style elements for focus hiding
-        self._check_style_elements(soup, issues, html_content)
-        
-        # Check for custom focus styles without sufficient visibility
-        self._check_custom_focus_styles(soup, issues, html_content)
-        
-        # Check focusable elements with no apparent focus styles
-        self._check_focusable_without_focus_styles(soup, issues, html_content)
-        
-        return issues
-    
-    def _check_inline_styles(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check inline styles that might hide focus."""
-        elements = soup.find_all(lambda tag: tag.has_attr('style'))
-        
-        for element in elements:
-            style = element.get('style', '').lower()
+        inline_issues = []
+        style_issues = []
+        custom_style_issues = []
+        focusable_issues = []
+        
+        # Run all checks in a single walk of the document, keeping the issues
+        # of each check together
+        for element in self.find_elements(soup):
+            if element.name == 'style':
+                # A plain str, as the text is used as a key of the
+                # has_visible_focus_style cache and the NavigableString
+                # would keep the whole document alive
+                style_content = str(element.string) if element.string else ''
+                
+                # Check style elements for focus hiding
+                self._check_style_element(element, style_content, style_issues, html_content)
+                
+                # Check for custom focus styles without sufficient visibility
+                self._check_custom_focus_styles(element, style_content, custom_style_issues, html_content)
             
-            # Check if the style might be hiding the focus outline
-            if any(focus_css in style for focus_css in self.focus_hiding_css):
-                # Check if it's a focusable element
-                if self._is_focusable(element):
-                    element_path = self.get_element_path(element)
-                    element_html = str(element)
-                    line_number = self.get_line_number(element, html_content)
-                    
-                    issues.append(self.create_issue(
-                        element_path=element_path,
-                        element_html=element_html,
-                        description="Focusable element has inline styles that may hide the focus indicator",
-                        impact="serious",
-                        how_to_fix="Remove the outline:none or outline:0 style, or add a visible alternative focus style.",
-                        code_solution=self._generate_focus_style_solution(element),
-                        line_number=line_number
-                    ))
-    
-    def _check_style_elements(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check style elements for CSS that might hide focus."""
-        style_elements = soup.find_all('style')
-        
-        for style_element in style_elements:
-            style_content = style_element.string if style_element.string else ''
+            # Lowercase the inline style once for the checks that read it
+            style = element['style'].lower() if 'style' in element.attrs else None
             
-            # Check if the style might be hiding the focus outline
-            if any(focus_css in style_content.lower() for focus_css in self.focus_hiding_css):
-                element_path = self.get_element_path(style_element)
-                element_html = str(style_element)
-                line_number = self.get_line_number(style_element, html_content)
-                
-                issues.append(self.create_issue(
-                    element_path=element_path,
-                    element_html=element_html,
-                    description="Style element contains CSS that may hide focus indicators",
+            # Check inline styles that might hide focus
+            if style is not None:
+                self._check_inline_style(element, style, inline_issues, html_content)
+            
+            # Check focusable elements with no apparent focus styles
+            if self._matches_focusable(element):
+                self._check_focusable_without_focus_styles(element, style, focusable_issues, html_content)
+        
+        return inline_issues + style_issues + custom_style_issues + focusable_issues
+    
+    def _check_inline_style(self, element: Tag, style: str, issues: List[ValidationIssue], html_content: str):
+        """Check an element's lowercased inline style for CSS that might hide focus."""
+        # Check if the style might be hiding the focus outline
+        if self._focus_hiding_re.search(style):
+            # Check if it's a focusable element
+            if self._is_focusable(element):
+                issues.append(self.create_element_issue(
+                    element, html_content,
+                    description="Focusable element has inline styles that may hide the focus indicator",
                     impact="serious",
-                    how_to_fix="Ensure that all focusable elements have a visible focus indicator. Replace outline:none with a visible alternative.",
-                    code_solution=self._generate_style_element_solution(style_element),
-                    line_number=line_number
+                    how_to_fix="Remove the outline:none or outline:0 style, or add a visible alternative focus style.",
+                    code_solution=functools.partial(self._generate_focus_style_solution, element)
                 ))
     
-    def _check_custom_focus_styles(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
-        """Check for potentially insufficient custom focus styles."""
-        style_elements = soup.find_all('style')
-        
-        for style_element in style_elements:
-            style_content = style_element.string if style_element.string else ''
-            
-            # Look for focus selectors
-            for selector in self.focus_style_selectors:
-                if selector in style_content:
-                    # Check if the style seems sufficient (very basic check)
-                    if not self._has_sufficient_focus_style(style_content, selector):
-                        element_path = self.get_element_path(style_element)
-                        element_html = str(style_element)
-                        line_number = self.get_line_number(style_element, html_content)
-                        
-                        issues.append(self.create_issue(
-                            element_path=element_path,
-                            element_html=element_html,
-                            description=f"Custom focus style using '{selector}' may not provide sufficient visibility",
-                            impact="moderate",
-                            how_to_fix="Ensure focus styles provide sufficient visibility. Use outline, border, background-color, or other properties to make focus clearly visible.",
-                            code_solution=self._generate_sufficient_focus_style_solution(selector),
-                            line_number=line_number
-                        ))
+    def _check_style_element(self, style_element: Tag, style_content: str, issues: List[ValidationIssue], html_content: str):
+        """Check a style element for CSS that might hide focus."""
+        # Check if the style might be hiding the focus outline
+        if self._focus_hiding_re.search(style_content.lower()):
+            issues.append(self.create_element_issue(
+                style_element, html_content,
+                description="Style element contains CSS that may hide focus indicators",
+                impact="serious",
+                how_to_fix="Ensure that all focusable elements have a visible focus indicator. Replace outline:none with a visible alternative.",
+                code_solution=functools.partial(self._generate_style_element_solution, style_element)
+            ))
     
-    def _check_focusable_without_focus_styles(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
+    def _check_custom_focus_styles(self, style_element: Tag, style_content: str, issues: List[ValidationIssue], html_content: str):
+        """Check a style element for potentially insufficient custom focus styles."""
+        # Most style elements have no focus selectors at all
+        if not self._any_focus_selector_re.search(style_content):
+            return
+        
+        # Look for focus selectors
+        for selector in self.focus_style_selectors:
+            if selector in style_content:
+                # Check if the style seems sufficient (very basic check)
+                if not self._has_sufficient_focus_style(style_content, selector):
+                    issues.append(self.create_element_issue(
+                        style_element, html_content,
+                        description=f"Custom focus style using '{selector}' may not provide sufficient visibility",
+                        impact="moderate",
+                        how_to_fix="Ensure focus styles provide sufficient visibility. Use outline, border, background-color, or other properties to make focus clearly visible.",
+                        code_solution=functools.partial(self._generate_sufficient_focus_style_solution, selector)
+                    ))
+    
+    def _check_focusable_without_focus_styles(self, element: Tag, style: Optional[str], issues: List[ValidationIssue], html_content: str):
         """
-        Check for focusable elements that don't appear to have focus styles.
+        Check a focusable element that doesn't appear to have focus styles.
         This is a heuristic since we can't know for sure without rendering.
         """
-        # Find all focusable elements
-        for selector in self.focusable_elements:
-            elements = soup.select(selector)
+        # Skip if it has an ID or class that suggests it might get focus styles
+        if _FOCUS_NAME_RE.search(element.get('id', '')) or \
+           any(_FOCUS_NAME_RE.search(class_name) for class_name in element.get('class', ())):
+            return
+        
+        # Skip if it's a standard control that browsers style by default
+        if element.name in ['input', 'textarea', 'select'] and not self._has_potential_focus_override(element, style):
+            return
+        
+        # Check for custom elements or roles that may need explicit focus styling
+        if (element.name in ['div', 'span'] or 
+            element.attrs.get('role') in ('button', 'link', 'menuitem', 'tab')):
             
-            for element in elements:
-                # Skip if it has an ID or class that suggests it might get focus styles
-                if (element.has_attr('id') and any('focus' in id_name.lower() for id_name in element['id'].split())) or \
-                   (element.has_attr('class') and any('focus' in class_name.lower() for class_name in element['class'])):
-                    continue
-                
-                # Skip if it's a standard control that browsers style by default
-                if element.name in ['input', 'textarea', 'select'] and not self._has_potential_focus_override(element):
-                    continue
-                
-                # Check for custom elements or roles that may need explicit focus styling
-                if (element.name in ['div', 'span'] or 
-                    (element.has_attr('role') and element['role'] in ['button', 'link', 'menuitem', 'tab'])):
-                    
-                    element_path = self.get_element_path(element)
-                    element_html = str(element)
-                    line_number = self.get_line_number(element, html_content)
-                    
-                    issues.append(self.create_issue(
-                        element_path=element_path,
-                        element_html=element_html,
-                        description="Interactive element may not have visible focus indicator",
-                        impact="moderate",
-                        how_to_fix="Add explicit focus styles to ensure keyboard focus is visible.",
-                        code_solution=self._generate_focus_style_solution(element),
-                        line_number=line_number
-                    ))
+            issues.append(self.create_element_issue(
+                element, html_content,
+                description="Interactive element may not have visible focus indicator",
+                impact="moderate",
+                how_to_fix="Add explicit focus styles to ensure keyboard focus is visible.",
+                code_solution=functools.partial(self._generate_focus_style_solution, element)
+            ))
+    
+    def _matches_focusable(self, element: Tag) -> bool:
+        """
+        Check if an element is one of the naturally focusable elements that
+        should show focus: a[href], button, input other than type hidden,
+        select, textarea, elements with a tabindex other than -1, and
+        contenteditable="true" elements.
+        
+        Args:
+            element: BeautifulSoup element
+            
+        Returns:
+            True if the element should show focus
+        """
+        attrs = element.attrs
+        name = element.name
+        
+        if name in _FOCUSABLE_TAGS or (name == 'a' and 'href' in attrs):
+            return True
+        
+        # Input types are matched case-insensitively, as in CSS selectors
+        if name == 'input' and attrs.get('type', '').lower() != 'hidden':
+            return True
+        
+        return (attrs.get('tabindex', '-1') != '-1' or
+                attrs.get('contenteditable') == 'true')
     
     def _is_focusable(self, element: Tag) -> bool:
         """
@@ -216,50 +329,48 @@ class Criterion_2_4_7(BaseCriterion):
         Returns:
             True if the element is focusable
         """
+        attrs = element.attrs
+        
         # Check if it's a naturally focusable element
-        if element.name in ['a', 'button', 'input', 'select', 'textarea'] and element.name != 'input' and element.get('type') != 'hidden':
+        if element.name in ['a', 'button', 'input', 'select', 'textarea'] and element.name != 'input' and attrs.get('type') != 'hidden':
             return True
         
         # Check for href attribute on anchors
-        if element.name == 'a' and element.has_attr('href'):
+        if element.name == 'a' and 'href' in attrs:
             return True
         
         # Check for tabindex
-        if element.has_attr('tabindex') and element['tabindex'] != '-1':
+        if attrs.get('tabindex', '-1') != '-1':
             return True
         
         # Check for contenteditable
-        if element.has_attr('contenteditable') and element['contenteditable'] != 'false':
+        if attrs.get('contenteditable', 'false') != 'false':
             return True
         
         # Check for WAI-ARIA roles that imply focusability
-        if element.has_attr('role') and element['role'] in ['button', 'link', 'checkbox', 'radio', 'tab', 'menuitem']:
+        if attrs.get('role') in ('button', 'link', 'checkbox', 'radio', 'tab', 'menuitem'):
             return True
         
         return False
     
-    def _has_potential_focus_override(self, element: Tag) -> bool:
+    def _has_potential_focus_override(self, element: Tag, style: Optional[str]) -> bool:
         """
         Check if an element might have styles that override default focus.
         
         Args:
             element: BeautifulSoup element
+            style: Lowercased inline style of the element, or None if it has none
             
         Returns:
             True if the element might override default focus
         """
         # Check for inline styles
-        if element.has_attr('style'):
-            style = element['style'].lower()
-            if any(focus_css in style for focus_css in self.focus_hiding_css):
-                return True
+        if style is not None and self._focus_hiding_re.search(style):
+            return True
         
         # Check for classes that might indicate a framework that could override focus
-        if element.has_attr('class'):
-            class_str = ' '.join(element['class']).lower()
-            framework_classes = ['btn', 'button', 'form-control', 'input-', 'select-', 'custom-']
-            if any(framework_class in class_str for framework_class in framework_classes):
-                return True
+        if any(_FRAMEWORK_CLASS_RE.search(class_name) for class_name in element.get('class', ())):
+            return True
         
         return False
     
@@ -274,29 +385,7 @@ class Criterion_2_4_7(BaseCriterion):
         Returns:
             True if the style seems sufficient
         """
-        # Try to find the full selector and its declaration block
-        pattern = rf'{selector}[^{{]*{{([^}}]*)}}'
-        match = re.search(pattern, style_content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
-            return False
-        
-        declarations = match.group(1).lower()
-        
-        # Check for properties that would make focus visible
-        visible_properties = [
-            'outline:',
-            'border:',
-            'background-color:',
-            'background:',
-            'box-shadow:',
-            'text-decoration:',
-            'color:',
-            'font-weight:',
-            'transform:'
-        ]
-        
-        return any(prop in declarations for prop in visible_properties)
+        return has_visible_focus_style(style_content, self._focus_selector_res[selector])
     
     def _generate_focus_style_solution(self, element: Tag) -> str:
         """
@@ -308,23 +397,10 @@ class Criterion_2_4_7(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        element_selector = self.get_element_path(element)
-        
-        return f"""/* Add this to your CSS */
-{element_selector}:focus {{
-  outline: 2px solid #4d90fe;  /* Blue focus ring */
-  outline-offset: 2px;        /* Offset to make it stand out */
-}}
-
-/* If you must remove the default outline, always provide an alternative */
-{element_selector}:focus {{
-  outline: none;              /* Remove default if needed */
-  box-shadow: 0 0 0 3px rgba(66, 153, 225, 0.5);  /* Alternative visible focus style */
-}}
-
-/* For your HTML element */
-{str(element)}
-"""
+        return _FOCUS_STYLE_SOLUTION.format(
+            selector=self.get_element_path(element),
+            html=self.get_element_html(element)
+        )
     
     def _generate_style_element_solution(self, style_element: Tag) -> str:
         """
@@ -346,21 +422,10 @@ class Criterion_2_4_7(BaseCriterion):
                     '/* Replace outline:none with visible focus styles */\n  outline: 2px solid #4d90fe; outline-offset: 2px;'
                 )
                 
-                return f"""<style>
-{improved_style}
-</style>"""
+                return _STYLE_ELEMENT_SOLUTION.format(style=improved_style)
         
         # Fallback if specific replacement couldn't be made
-        return f"""<style>
-/* Original style with problematic focus handling */
-{style_content}
-
-/* Add these improved focus styles */
-a:focus, button:focus, input:focus, select:focus, textarea:focus, [tabindex]:focus {{
-  outline: 2px solid #4d90fe;
-  outline-offset: 2px;
-}}
-</style>"""
+        return _STYLE_ELEMENT_FALLBACK_SOLUTION.format(style=style_content)
     
     def _generate_sufficient_focus_style_solution(self, selector: str) -> str:
         """
@@ -372,22 +437,4 @@ a:focus, button:focus, input:focus, select:focus, textarea:focus, [tabindex]:foc
         Returns:
             CSS string with solution
         """
-        return f"""/* Replace your current {selector} style with this improved version */
-{selector} {{
-  /* Clear visibility enhancements */
-  outline: 2px solid #4d90fe;  /* Blue focus ring */
-  outline-offset: 2px;         /* Offset to make it stand out */
-  
-  /* Optional additional enhancements */
-  box-shadow: 0 0 0 3px rgba(66, 153, 225, 0.5);
-  transition: outline 0.1s ease-in-out;
-}}
-
-/* For high contrast mode support */
-@media screen and (forced-colors: active) {{
-  {selector} {{
-    outline: 2px solid HighlightText;
-    outline-offset: 2px;
-  }}
-}}
-"""
\ No newline at end of file
+        return _SUFFICIENT_FOCUS_STYLE_SOLUTION.format(selector=selector)
\ No newline at end of file
@@ -5,6 +5,7 @@ The size of the target for pointer inputs is at least 24 by 24 CSS pixels.
 """
 
 from typing import List, Dict, Optional, Set, Tuple
+import functools
 import re
 from bs4 import BeautifulSoup, Tag
 
@@ -12,6 +13,75 @@ from .base import BaseCriterion
 from ..reporter import ValidationIssue
 
 
+# Elements that are interactive without any attributes
+_INTERACTIVE_TAGS = frozenset(['button', 'select'])
+
+# Input types that are interactive targets
+_INTERACTIVE_INPUT_TYPES = frozenset(['button', 'submit', 'reset', 'checkbox', 'radio'])
+
+# Roles of interactive elements
+_INTERACTIVE_ROLES = frozenset(['button', 'link', 'checkbox', 'radio', 'tab', 'menuitem'])
+
+# Class name fragments of icons and small buttons, in any case
+_ICON_CLASS_RE = re.compile('icon|fa-|material-icons|glyphicon|btn-sm|btn-xs|btn-icon', re.IGNORECASE)
+
+# Pixel dimensions in lowercased inline styles
+_WIDTH_RE = re.compile(r'width\s*:\s*(\d+)px')
+_HEIGHT_RE = re.compile(r'height\s*:\s*(\d+)px')
+_MIN_WIDTH_RE = re.compile(r'min-width\s*:\s*(\d+)px')
+_MIN_HEIGHT_RE = re.compile(r'min-height\s*:\s*(\d+)px')
+
+# Solutions for a small target, filled in with its path, HTML, the minimum
+# target size and, when known, its current width and height
+_KNOWN_TARGET_SIZE_SOLUTION = """/* Add this to your CSS */
+{path} {{
+  /* Increase from {width}x{height}px to at least {min_size}x{min_size}px */
+  min-width: {min_size}px;
+  min-height: {min_size}px;
+  
+  /* If it's an inline element, make it block or inline-block */
+  display: inline-block;
+  
+  /* Optional: Add padding to increase the clickable area */
+  padding: 4px;
+  
+  /* Optional: Center contents if needed */
+  text-align: center;
+  line-height: {min_size}px;
+}}
+
+/* Alternative solution: Add sufficient spacing around the element */
+{path} {{
+  margin: 12px;  /* Half of the minimum target size on each side creates sufficient spacing */
+}}
+
+/* For your HTML element */
+{html}
+"""
+
+_TARGET_SIZE_SOLUTION = """/* Add this to your CSS */
+{path} {{
+  /* Ensure minimum target size */
+  min-width: {min_size}px;
+  min-height: {min_size}px;
+  
+  /* If it's an inline element, make it block or inline-block */
+  display: inline-block;
+  
+  /* Optional: Add padding to increase the clickable area */
+  padding: 4px;
+}}
+
+/* Alternative solution: Add sufficient spacing around small targets */
+{path} {{
+  margin: 12px;  /* Half of the minimum target size on each side creates sufficient spacing */
+}}
+
+/* For your HTML element */
+{html}
+"""
+
+
 class Criterion_2_5_8(BaseCriterion):
     """
     Implements WCAG 2.2 Success Criterion 2.5.8: Target Size (Minimum).
@@ -21,44 +91,24 @@ class Criterion_2_5_8(BaseCriterion):
     by users with motor impairments.
     """
     
+    id = "2.5.8"
+    name = "Target Size (Minimum)"
+    level = "AA"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/target-size-minimum.html"
+    description = """
+    The size of the target for pointer inputs is at least 24 by 24 CSS pixels, except where:
+    - Spacing: The target offset is at least 24 CSS pixels to every adjacent target.
+    - Equivalent: The function can be achieved through an equivalent control that meets this criterion.
+    - Inline: The target is in a sentence or its size is otherwise constrained by the line-height.
+    - User Agent Control: The size of the target is determined by the user agent and is not modified by the author.
+    - Essential: A particular presentation of the target is essential or is legally required for the information being conveyed.
+    """
+    
     def __init__(self):
         super().__init__()
-        self.id = "2.5.8"
-        self.name = "Target Size (Minimum)"
-        self.level = "AA"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/target-size-minimum.html"
-        self.description = """
-        The size of the target for pointer inputs is at least 24 by 24 CSS pixels, except where:
-        - Spacing: The target offset is at least 24 CSS pixels to every adjacent target.
-        - Equivalent: The function can be achieved through an equivalent control that meets this criterion.
-        - Inline: The target is in a sentence or its size is otherwise constrained by the line-height.
-        - User Agent Control: The size of the target is determined by the user agent and is not modified by the author.
-        - Essential: A particular presentation of the target is essential or is legally required for the information being conveyed.
-        """
-        
         # Minimum target size per criterion
         self.min_target_size = 24  # 24x24 CSS pixels
         
-        # Elements that are commonly interactive and should meet the target size requirement
-        self.interactive_elements = [
-            'a[href]',
-            'button',
-            'input[type="button"]',
-            'input[type="submit"]',
-            'input[type="reset"]',
-            'input[type="checkbox"]',
-            'input[type="radio"]',
-            'select',
-            '[role="button"]',
-            '[role="link"]',
-            '[role="checkbox"]',
-            '[role="radio"]',
-            '[role="tab"]',
-            '[role="menuitem"]',
-            '[tabindex]:not([tabindex="-1"])',
-            '[onclick]'
-        ]
-        
     def validate(self, soup: BeautifulSoup, html_content: str) -> List[ValidationIssue]:
         """
         Validate HTML content against 2.5.8 criterion.
@@ -77,50 +127,69 @@ class Criterion_2_5_8(BaseCriterion):
         issues = []
         
         # Find all potentially interactive elements
-        for selector in self.interactive_elements:
-            for element in soup.select(selector):
-                # Skip elements that are likely to be exempt
-                if self._is_likely_exempt(element):
-                    continue
-                
-                # Check the element's dimensions from inline styles
-                width, height = self._get_element_dimensions(element)
-                
-                if width is not None and height is not None:
-                    # If we can determine exact dimensions, check if they're too small
-                    if width < self.min_target_size or height < self.min_target_size:
-                        element_path = self.get_element_path(element)
-                        element_html = str(element)
-                        line_number = self.get_line_number(element, html_content)
-                        
-                        issues.append(self.create_issue(
-                            element_path=element_path,
-                            element_html=element_html,
-                            description=f"Interactive element has a target size smaller than {self.min_target_size}x{self.min_target_size} CSS pixels (found {width}x{height})",
-                            impact="moderate",
-                            how_to_fix=f"Increase the size of the interactive element to at least {self.min_target_size}x{self.min_target_size} CSS pixels, or ensure sufficient spacing around it.",
-                            code_solution=self._generate_target_size_solution(element, width, height),
-                            line_number=line_number
-                        ))
-                else:
-                    # If we can't determine dimensions, check for potentially small targets
-                    if self._is_potentially_small_target(element):
-                        element_path = self.get_element_path(element)
-                        element_html = str(element)
-                        line_number = self.get_line_number(element, html_content)
-                        
-                        issues.append(self.create_issue(
-                            element_path=element_path,
-                            element_html=element_html,
-                            description=f"Interactive element may have insufficient target size (cannot determine exact dimensions)",
-                            impact="minor",
-                            how_to_fix=f"Ensure the target size is at least {self.min_target_size}x{self.min_target_size} CSS pixels, or provide sufficient spacing around it.",
-                            code_solution=self._generate_target_size_solution(element),
-                            line_number=line_number
-                        ))
-        
+        for element in self.find_elements(soup):
+            if not self._is_interactive(element):
+                continue
+            
+            # Skip elements that are likely to be exempt
+            if self._is_likely_exempt(element):
+                continue
+            
+            # Check the element's dimensions from inline styles
+            width, height = self._get_element_dimensions(element)
+            
+            if width is not None and height is not None:
+                # If we can determine exact dimensions, check if they're too small
+                if width < self.min_target_size or height < self.min_target_size:
+                    issues.append(self.create_element_issue(
+                        element, html_content,
+                        description=f"Interactive element has a target size smaller than {self.min_target_size}x{self.min_target_size} CSS pixels (found {width}x{height})",
+                        impact="moderate",
+                        how_to_fix=f"Increase the size of the interactive element to at least {self.min_target_size}x{self.min_target_size} CSS pixels, or ensure sufficient spacing around it.",
+                        code_solution=functools.partial(self._generate_target_size_solution, element, width, height)
+                    ))
+            else:
+                # If we can't determine dimensions, check for potentially small targets
+                if self._is_potentially_small_target(element):
+                    issues.append(self.create_element_issue(
+                        element, html_content,
+                        description=f"Interactive element may have insufficient target size (cannot determine exact dimensions)",
+                        impact="minor",
+                        how_to_fix=f"Ensure the target size is at least {self.min_target_size}x{self.min_target_size} CSS pixels, or provide sufficient spacing around it.",
+                        code_solution=functools.partial(self._generate_target_size_solution, element)
+                    ))
+    
         return issues
     
+    def _is_interactive(self, element: Tag) -> bool:
+        """
+        Check if an element is commonly interactive and should meet the target
+        size requirement.
+        
+        Matches a[href], button, select, input of type button, submit, reset,
+        checkbox or radio, elements with an interactive role, and elements with
+        an onclick handler or a tabindex other than -1.
+        
+        Args:
+            element: BeautifulSoup element
+            
+        Returns:
+            True if the element is interactive
+        """
+        attrs = element.attrs
+        name = element.name
+        
+        if name in _INTERACTIVE_TAGS or (name == 'a' and 'href' in attrs):
+            return True
+        
+        # Input types are matched case-insensitively, as in CSS selectors
+        if name == 'input' and attrs.get('type', '').lower() in _INTERACTIVE_INPUT_TYPES:
+            return True
+        
+        return (attrs.get('role') in _INTERACTIVE_ROLES or
+                attrs.get('tabindex', '-1') != '-1' or
+                'onclick' in attrs)
+    
     def _is_likely_exempt(self, element: Tag) -> bool:
         """
         Check if an element is likely exempt from the target size requirement.
@@ -133,16 +202,23 @@ class Criterion_2_5_8(BaseCriterion):
         """
         # Inline exemption: Check if the element is likely inline in text
         if element.parent and element.parent.name in ['p', 'li', 'td', 'span', 'div']:
-            parent_text = element.parent.get_text()
-            if len(parent_text) > len(element.get_text()) * 3:  # Rough heuristic for being in a block of text
-                return True
+            # Rough heuristic for being in a block of text: the parent has more
+            # than 3 times the element's text. Stop counting once it does, so
+            # elements sharing a long parent don't each join all of its text.
+            max_text_length = sum(len(text) for text in element.strings) * 3
+            parent_text_length = 0
+            for text in element.parent.strings:
+                parent_text_length += len(text)
+                if parent_text_length > max_text_length:
+                    return True
         
         # User agent control exemption: Default form controls
-        if element.name in ['input', 'select'] and not element.has_attr('style') and not element.has_attr('class'):
+        attrs = element.attrs
+        if element.name in ['input', 'select'] and 'style' not in attrs and 'class' not in attrs:
             return True
         
         # Check for ARIA attributes that might indicate an essential presentation
-        if element.has_attr('aria-hidden') and element['aria-hidden'] == 'true':
+        if attrs.get('aria-hidden') == 'true':
             return True
             
         return False
@@ -159,36 +235,38 @@ class Criterion_2_5_8(BaseCriterion):
         """
         width = None
         height = None
+        attrs = element.attrs
         
         # Check inline style
-        if element.has_attr('style'):
-            style = element['style'].lower()
+        style = attrs.get('style')
+        if style is not None:
+            style = style.lower()
             
             # Try to extract width from inline style
-            width_match = re.search(r'width\s*:\s*(\d+)px', style)
+            width_match = _WIDTH_RE.search(style)
             if width_match:
                 width = int(width_match.group(1))
             
             # Try to extract height from inline style
-            height_match = re.search(r'height\s*:\s*(\d+)px', style)
+            height_match = _HEIGHT_RE.search(style)
             if height_match:
                 height = int(height_match.group(1))
             
             # If we have min-width/min-height but not width/height
             if width is None:
-                min_width_match = re.search(r'min-width\s*:\s*(\d+)px', style)
+                min_width_match = _MIN_WIDTH_RE.search(style)
                 if min_width_match:
                     width = int(min_width_match.group(1))
             
             if height is None:
-                min_height_match = re.search(r'min-height\s*:\s*(\d+)px', style)
+                min_height_match = _MIN_HEIGHT_RE.search(style)
                 if min_height_match:
                     height = int(min_height_match.group(1))
         
         # Check width/height attributes
-        if width is None and element.has_attr('width'):
+        width_value = attrs.get('width')
+        if width is None and width_value is not None:
             try:
-                width_value = element['width']
                 if width_value.isdigit():
                     width = int(width_value)
                 elif width_value.endswith('px'):
@@ -196,9 +274,9 @@ class Criterion_2_5_8(BaseCriterion):
             except (ValueError, IndexError):
                 pass
         
-        if height is None and element.has_attr('height'):
+        height_value = attrs.get('height')
+        if height is None and height_value is not None:
             try:
-                height_value = element['height']
                 if height_value.isdigit():
                     height = int(height_value)
                 elif height_value.endswith('px'):
@@ -222,27 +300,29 @@ class Criterion_2_5_8(BaseCriterion):
         is_icon_only = False
         
         # Check for common icon classes
-        if element.has_attr('class'):
-            classes = ' '.join(element['class']).lower()
-            icon_class_patterns = ['icon', 'fa-', 'material-icons', 'glyphicon', 'btn-sm', 'btn-xs', 'btn-icon']
-            if any(pattern in classes for pattern in icon_class_patterns):
-                is_icon_only = True
+        if any(_ICON_CLASS_RE.search(class_name) for class_name in element.get('class', ())):
+            is_icon_only = True
         
-        # Check if the content is just a single character or entity
-        element_text = element.get_text(strip=True)
-        if len(element_text) == 1:
+        # Check if the content is just a single character or entity, only
+        # counting the text as far as needed to tell
+        element_text_length = 0
+        for text in element.stripped_strings:
+            element_text_length += len(text)
+            if element_text_length > 1:
+                break
+        if element_text_length == 1:
             is_icon_only = True
         
         # Check if it contains only an image and the image is likely small
         img = element.find('img')
-        if img and not element_text:
+        if img and not element_text_length:
             img_width, img_height = self._get_element_dimensions(img)
             if (img_width and img_width < self.min_target_size) or (img_height and img_height < self.min_target_size):
                 is_icon_only = True
         
         # Check for SVG icon
         svg = element.find('svg')
-        if svg and not element_text:
+        if svg and not element_text_length:
             svg_width, svg_height = self._get_element_dimensions(svg)
             if (svg_width and svg_width < self.min_target_size) or (svg_height and svg_height < self.min_target_size):
                 is_icon_only = True
@@ -261,55 +341,18 @@ class Criterion_2_5_8(BaseCriterion):
         Returns:
             HTML string with solution
         """
-        element_path = self.get_element_path(element)
-        
         if width is not None and height is not None:
             # We know the exact dimensions
-            return f"""/* Add this to your CSS */
-{element_path} {{
-  /* Increase from {width}x{height}px to at least {self.min_target_size}x{self.min_target_size}px */
-  min-width: {self.min_target_size}px;
-  min-height: {self.min_target_size}px;
-  
-  /* If it's an inline element, make it block or inline-block */
-  display: inline-block;
-  
-  /* Optional: Add padding to increase the clickable area */
-  padding: 4px;
-  
-  /* Optional: Center contents if needed */
-  text-align: center;
-  line-height: {self.min_target_size}px;
-}}
-
-/* Alternative solution: Add sufficient spacing around the element */
-{element_path} {{
-  margin: 12px;  /* Half of the minimum target size on each side creates sufficient spacing */
-}}
-
-/* For your HTML element */
-{str(element)}
-"""
+            template = _KNOWN_TARGET_SIZE_SOLUTION
         else:
             # We don't know the exact dimensions
-            return f"""/* Add this to your CSS */
-{element_path} {{
-  /* Ensure minimum target size */
-  min-width: {self.min_target_size}px;
-  min-height: {self.min_target_size}px;
-  
-  /* If it's an inline element, make it block or inline-block */
-  display: inline-block;
-  
-  /* Optional: Add padding to increase the clickable area */
-  padding: 4px;
-}}
-
-/* Alternative solution: Add sufficient spacing around small targets */
-{element_path} {{
-  margin: 12px;  /* Half of the minimum target size on each side creates sufficient spacing */
-}}
+            template = _TARGET_SIZE_SOLUTION
+        
+        return template.format(
+            path=self.get_element_path(element),
+            html=self.get_element_html(element),
+            min_size=self.min_target_size,
+            width=width,
+            height=height
+        )
 
-/* For your HTML element */
-{str(element)}
-"""
\ No newline at end of file
@@ -28,18 +28,20 @@ class Criterion_3_3_7(BaseCriterion):
     static analysis looking for potential issues.
     """
     
+    id = "3.3.7"
+    name = "Redundant Entry"
+    level = "A"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/redundant-entry.html"
+    description = """
+    Information previously entered by or provided to the user that is required
+    to be entered again in the same process is either auto-populated or available
+    for the user to select.
+    """
+    
+    REQUIRED_TAGS = ('form',)
+    
     def __init__(self):
         super().__init__()
-        self.id = "3.3.7"
-        self.name = "Redundant Entry"
-        self.level = "A"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/redundant-entry.html"
-        self.description = """
-        Information previously entered by or provided to the user that is required
-        to be entered again in the same process is either auto-populated or available
-        for the user to select.
-        """
-        
         # Common form field types that should use autocomplete
         self.personal_info_fields = {
             'name', 'fullname', 'firstname', 'lastname', 'fname', 'lname',
@@ -84,7 +86,7 @@ class Criterion_3_3_7(BaseCriterion):
         issues = []
         
         # Check for forms with potential multi-step processes
-        forms = soup.find_all('form')
+        forms = self.find_elements(soup, 'form')
         
         for form in forms:
             # Look for indicators of multi-step forms
@@ -111,7 +113,7 @@ class Criterion_3_3_7(BaseCriterion):
         
         # Check for multi-form processes on the same page
         # This could indicate a multi-step process that shows/hides different forms
-        all_forms = soup.find_all('form')
+        all_forms = self.find_elements(soup, 'form')
         if len(all_forms) > 1:
             all_input_fields = {}
             
@@ -23,18 +23,18 @@ class Criterion_4_1_2(BaseCriterion):
     detected by assistive technologies.
     """
     
+    id = "4.1.2"
+    name = "Name, Role, Value"
+    level = "A"
+    url = "https://www.w3.org/WAI/WCAG22/Understanding/name-role-value.html"
+    description = """
+    For all user interface components, the name and role can be programmatically determined; 
+    states, properties, and values can be programmatically set; and 
+    notification of changes to these items is available to user agents, including assistive technologies.
+    """
+    
     def __init__(self):
         super().__init__()
-        self.id = "4.1.2"
-        self.name = "Name, Role, Value"
-        self.level = "A"
-        self.url = "https://www.w3.org/WAI/WCAG22/Understanding/name-role-value.html"
-        self.description = """
-        For all user interface components, the name and role can be programmatically determined; 
-        states, properties, and values can be programmatically set; and 
-        notification of changes to these items is available to user agents, including assistive technologies.
-        """
-        
         # Interactive elements that need accessible names
         self.interactive_elements = [
             'a[href]',
@@ -175,7 +175,7 @@ class Criterion_4_1_2(BaseCriterion):
     def _check_accessible_names(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
         """Check interactive elements for accessible names."""
         for selector in self.interactive_elements:
-            for element in soup.select(selector):
+            for element in self.select_elements(soup, selector):
                 # Skip elements that shouldn't need names (like decorative elements)
                 if element.has_attr('aria-hidden') and element['aria-hidden'] == 'true':
                     continue
@@ -204,7 +204,7 @@ class Criterion_4_1_2(BaseCriterion):
         """Check elements for proper roles."""
         # Check elements that need explicit roles
         for selector in self.elements_needing_roles:
-            for element in soup.select(selector):
+            for element in self.select_elements(soup, selector):
                 # Skip if it already has a role attribute
                 if element.has_attr('role'):
                     # Check if the role is valid for this element
@@ -243,7 +243,7 @@ class Criterion_4_1_2(BaseCriterion):
                     ))
         
         # Check elements that already have roles
-        for element in soup.find_all(attrs={"role": True}):
+        for element in (tag for tag in self.find_elements(soup) if tag.has_attr('role')):
             role = element['role']
             
             # Check if the role is valid for this element
@@ -265,7 +265,7 @@ class Criterion_4_1_2(BaseCriterion):
     def _check_form_labels(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
         """Check form controls for proper labels."""
         for selector in self.form_controls_needing_labels:
-            for element in soup.select(selector):
+            for element in self.select_elements(soup, selector):
                 # Skip elements with built-in labels (e.g., button with text)
                 if element.name == 'button' and element.get_text(strip=True):
                     continue
@@ -289,7 +289,7 @@ class Criterion_4_1_2(BaseCriterion):
     def _check_custom_controls(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
         """Check custom controls for required ARIA states and properties."""
         for selector in self.custom_controls:
-            for element in soup.select(selector):
+            for element in self.select_elements(soup, selector):
                 role = element.get('role')
                 if not role:
                     continue
@@ -317,7 +317,7 @@ class Criterion_4_1_2(BaseCriterion):
     def _check_invalid_aria(self, soup: BeautifulSoup, issues: List[ValidationIssue], html_content: str):
         """Check for invalid ARIA attributes."""
         # Find all elements with aria attributes
-        for element in soup.find_all(lambda tag: any(attr.startswith('aria-') for attr in tag.attrs)):
+        for element in (tag for tag in self.find_elements(soup) if any(attr.startswith('aria-') for attr in tag.attrs)):
             for attr in list(element.attrs):
                 if attr.startswith('aria-'):
                     # Check for invalid boolean values
@@ -5,21 +5,28 @@ This module provides tools to optimize validation performance for large websites
 including parallel processing, caching, and batch processing.
 """
 
+import asyncio
+import collections
+import dataclasses
 import os
+import re
 import time
 import concurrent.futures
 import hashlib
 import pickle
 import logging
-import queue
-import threading
 import requests
-from typing import List, Dict, Tuple, Optional, Set, Callable, Any
-from urllib.parse import urljoin, urlparse
+from typing import List, Dict, Tuple, Optional, Set, Callable, Any, Iterable, Iterator, Pattern, Union
+from urllib.parse import urljoin, urlparse, urlunparse, unquote_plus
 from bs4 import BeautifulSoup
 
 from .validator import WCAGValidator
-from .reporter import ValidationIssue, WCAGReporter
+from .reporter import WCAGReporter
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, requests is used from threads instead
+    aiohttp = None
 
 
 class ValidationCache:
@@ -177,7 +184,9 @@ class ParallelValidator:
         # Initialize the cache if enabled
         self.cache = ValidationCache(cache_dir, cache_ttl) if use_cache else None
         
-        # Create a base validator instance
+        # Create a base validator instance. Repeated content is served by the
+        # cache above, which pickles results anyway, so the validator keeps no
+        # copies of its own that would build every issue's text up front
         self.validator = WCAGValidator(conformance_level=conformance_level)
         
         # Extract criteria IDs for cache key generation
@@ -187,11 +196,14 @@ class ParallelValidator:
         """
         Validate multiple pages in parallel.
         
+        All threads share one validator; the state of the document being
+        validated is kept per thread, so pages don't interfere.
+        
         Args:
             pages: List of page dictionaries with 'html' and 'url' keys
             
         Returns:
-            Dictionary mapping URLs to WCAGReporter objects
+            Dictionary mapping URLs to WCAGReporter objects, in the order of pages
         """
         results = {}
         
@@ -202,9 +214,8 @@ class ParallelValidator:
                 for i, page in enumerate(pages)
             }
             
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
+            # Collect results in submission order, so reports don't depend on timing
+            for future, url in future_to_url.items():
                 try:
                     reporter = future.result()
                     results[url] = reporter
@@ -251,6 +262,363 @@ class ParallelValidator:
         return reporter
 
 
+# File name extensions recognized as HTML documents
+HTML_EXTENSIONS = ('.html', '.htm')
+
+
+def iter_html_files(directory: str) -> Iterator[str]:
+    """
+    Lazily yield the paths of all HTML files below a directory.
+    
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no stat call is needed to tell files from directories. Symbolic
+    links to directories are not followed and unreadable directories are
+    skipped, as with os.walk.
+    
+    Args:
+        directory: Directory to search recursively
+        
+    Yields:
+        Paths of files ending in .html or .htm (case-insensitive)
+    """
+    stack = [directory]
+    
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+            
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(HTML_EXTENSIONS) and entry.is_file():
+                    yield entry.path
+
+
+# Validator owned by each worker process of validate_files_in_processes
+_process_validator: Optional[WCAGValidator] = None
+
+
+def _init_process_validator(conformance_level: str,
+                            criteria_to_include: Optional[List[str]],
+                            criteria_to_exclude: Optional[List[str]],
+                            log_level: int,
+                            cache_size: int = 0,
+                            parser: str = 'html.parser') -> None:
+    """
+    Create the validator used by a worker process.
+    
+    Args:
+        conformance_level: WCAG conformance level
+        criteria_to_include: Criteria IDs to include
+        criteria_to_exclude: Criteria IDs to exclude
+        log_level: Logging level
+        cache_size: Number of results to keep in the worker's content cache
+        parser: BeautifulSoup parser to use
+    """
+    global _process_validator
+    _process_validator = WCAGValidator(
+        conformance_level=conformance_level,
+        criteria_to_include=criteria_to_include,
+        criteria_to_exclude=criteria_to_exclude,
+        log_level=log_level,
+        cache_size=cache_size,
+        parser=parser
+    )
+
+
+def _validate_html_in_process(html_content: str, url: Optional[str]) -> WCAGReporter:
+    """
+    Validate HTML content with the validator of the current worker process.
+    
+    Args:
+        html_content: HTML content to validate
+        url: URL of the page (for reporting)
+        
+    Returns:
+        WCAGReporter object with validation results
+    """
+    return _process_validator.validate_html(html_content, url)
+
+
+def create_validator_process_pool(validator: WCAGValidator,
+                                  max_workers: Optional[int] = None) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Create a process pool whose workers validate with the given validator's settings.
+    
+    Args:
+        validator: WCAGValidator whose settings the workers copy
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        ProcessPoolExecutor with one validator per worker process
+    """
+    # Workers only log warnings and errors, so messages like the number of
+    # loaded criteria are not repeated once per worker
+    initargs = (
+        validator.conformance_level,
+        validator.criteria_to_include,
+        validator.criteria_to_exclude,
+        max(validator.logger.level, logging.WARNING),
+        validator.cache_size,
+        validator.parser
+    )
+    
+    return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                                  initializer=_init_process_validator,
+                                                  initargs=initargs)
+
+
+def read_html_file(file_path: str) -> str:
+    """
+    Read a UTF-8 HTML file with as few system calls as possible.
+    
+    The file is read with a single read of its stat size instead of the
+    buffered, chunked reads of open().read(). Newlines are translated as
+    in text mode.
+    
+    Args:
+        file_path: Path to HTML file
+        
+    Returns:
+        HTML content of the file
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        
+        # A different length means a short read or a file that changed size, read to the end
+        if len(data) != size:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+    finally:
+        os.close(fd)
+    
+    html_content = data.decode('utf-8')
+    if '\r' in html_content:
+        html_content = html_content.replace('\r\n', '\n').replace('\r', '\n')
+    return html_content
+
+
+def validate_files_in_processes(validator: WCAGValidator,
+                                file_paths: Iterable[str],
+                                max_workers: Optional[int] = None,
+                                read_workers: int = 32) -> List[WCAGReporter]:
+    """
+    Validate HTML files on all CPU cores using a process pool.
+    
+    Parsing and rule checking are CPU-bound, so separate processes scale
+    where threads are held back by the GIL. Each worker builds its own
+    validator with the same settings as the given one. Files are read ahead
+    by a thread pool, so slow disks or network file systems keep the workers
+    busy, and at most two files per worker wait for validation to bound
+    memory use. file_paths may be a lazy iterable such as iter_html_files(),
+    in which case validation starts while the remaining files are still
+    being found.
+    
+    Args:
+        validator: WCAGValidator whose settings the workers copy
+        file_paths: Paths of the HTML files to validate
+        max_workers: Number of worker processes (default: CPU count)
+        read_workers: Number of threads reading files
+        
+    Returns:
+        List of WCAGReporter objects, in the order of file_paths
+    """
+    max_workers = max_workers or os.cpu_count()
+    max_pending = 2 * max_workers
+    
+    results = []
+    reads = collections.deque()  # (file path, future of its content)
+    validations = collections.deque()  # Future or error WCAGReporter, in file order
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=read_workers) as readers, \
+            create_validator_process_pool(validator, max_workers) as executor:
+        
+        def submit_oldest_read() -> None:
+            file_path, read_future = reads.popleft()
+            url = f"file://{os.path.abspath(file_path)}"
+            try:
+                html_content = read_future.result()
+            except (OSError, UnicodeDecodeError) as e:
+                logging.getLogger(__name__).error(f"Error reading file {file_path}: {e}")
+                reporter = WCAGReporter()
+                reporter.url = url
+                reporter.add_error("N/A", f"Error reading file: {e}")
+                validations.append(reporter)
+                return
+            validations.append(executor.submit(_validate_html_in_process, html_content, url))
+        
+        def collect_oldest_validation() -> None:
+            validation = validations.popleft()
+            if isinstance(validation, concurrent.futures.Future):
+                validation = validation.result()
+            results.append(validation)
+        
+        for file_path in file_paths:
+            reads.append((file_path, readers.submit(read_html_file, file_path)))
+            
+            if len(reads) > read_workers:
+                submit_oldest_read()
+            if len(validations) > max_pending:
+                collect_oldest_validation()
+        
+        while reads:
+            submit_oldest_read()
+        while validations:
+            collect_oldest_validation()
+    
+    return results
+
+
+def compile_url_patterns(patterns: Optional[Iterable[str]]) -> Optional[Pattern]:
+    """
+    Combine URL patterns into a single regex so each URL is searched once.
+    
+    Args:
+        patterns: URL patterns (regex strings)
+        
+    Returns:
+        Compiled alternation of the patterns, or None if there are none
+    """
+    patterns = list(patterns or [])
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+async def _fetch_pages_async(urls: List[str], concurrency: int, timeout: int) -> Dict[str, Union[str, Exception]]:
+    """
+    Fetch pages concurrently on one thread with aiohttp.
+    
+    Args:
+        urls: URLs to fetch
+        concurrency: Maximum number of requests in flight
+        timeout: Timeout for each request in seconds
+        
+    Returns:
+        Dictionary mapping URLs to page HTML, or to the exception raised
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=8)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        async def fetch(url: str) -> Union[str, Exception]:
+            async with semaphore:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.text()
+                except Exception as e:
+                    return e
+        
+        pages = await asyncio.gather(*(fetch(url) for url in urls))
+    
+    return dict(zip(urls, pages))
+
+
+def _fetch_page(url: str, timeout: int) -> str:
+    """
+    Fetch a single page with requests.
+    
+    Args:
+        url: URL to fetch
+        timeout: Timeout in seconds
+        
+    Returns:
+        Page HTML
+    """
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def fetch_pages(urls: List[str], concurrency: int = 16, timeout: int = 10) -> Dict[str, Union[str, Exception]]:
+    """
+    Fetch pages concurrently.
+    
+    Uses asyncio with aiohttp when it is installed, so many requests overlap
+    on a single thread; otherwise falls back to requests in a thread pool.
+    
+    Args:
+        urls: URLs to fetch
+        concurrency: Maximum number of requests in flight
+        timeout: Timeout for each request in seconds
+        
+    Returns:
+        Dictionary mapping URLs to page HTML, or to the exception raised
+    """
+    if not urls:
+        return {}
+    
+    if aiohttp is not None:
+        return asyncio.run(_fetch_pages_async(urls, concurrency, timeout))
+    
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        future_to_url = {executor.submit(_fetch_page, url, timeout): url for url in urls}
+        for future in concurrent.futures.as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                results[url] = e
+    
+    return results
+
+
+# Ports implied by the URL scheme, dropped when normalizing URLs
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent links map to the same crawl entry.
+    
+    The scheme and host are lowercased, default ports, fragments and utm_*
+    tracking parameters are dropped, and query parameters are sorted.
+    Parameters are kept as written, so e.g. "?flag" stays "?flag".
+    
+    Args:
+        url: Absolute URL
+        
+    Returns:
+        Normalized URL
+        
+    Raises:
+        ValueError: If the URL has an invalid port or IPv6 host
+    """
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    
+    netloc = (parsed.hostname or '').lower()
+    if ':' in netloc:
+        # IPv6 hosts keep their brackets
+        netloc = f"[{netloc}]"
+    port = parsed.port
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    if parsed.username:
+        userinfo = parsed.username if parsed.password is None else f"{parsed.username}:{parsed.password}"
+        netloc = f"{userinfo}@{netloc}"
+    
+    # Only parameters that are dropped get decoded, the others are sorted as is
+    params = [param for param in parsed.query.split('&')
+              if param and not unquote_plus(param.partition('=')[0]).lower().startswith('utm_')]
+    query = '&'.join(sorted(params))
+    
+    return urlunparse((scheme, netloc, parsed.path or '/', parsed.params, query, ''))
+
+
 class WebsiteCrawler:
     """
     Crawler for validating an entire website.
@@ -261,47 +629,46 @@ class WebsiteCrawler:
                  max_pages: int = 100,
                  max_depth: int = 3,
                  concurrency: int = 4,
-                 include_patterns: Optional[List[str]] = None,
-                 exclude_patterns: Optional[List[str]] = None,
-                 use_cache: bool = True):
+                 include_patterns: Optional[Union[List[str], Pattern]] = None,
+                 exclude_patterns: Optional[Union[List[str], Pattern]] = None):
         """
         Initialize the website crawler.
         
+        Pages are validated in worker processes with the validator's
+        settings, so results are cached according to its cache_size.
+        
         Args:
             validator: WCAGValidator instance
             max_pages: Maximum number of pages to crawl
             max_depth: Maximum crawl depth
             concurrency: Number of concurrent requests
-            include_patterns: URL patterns to include (regex strings)
-            exclude_patterns: URL patterns to exclude (regex strings)
-            use_cache: Whether to use caching
+            include_patterns: URL patterns to include (regex strings or a compiled regex)
+            exclude_patterns: URL patterns to exclude (regex strings or a compiled regex)
         """
         self.validator = validator
         self.max_pages = max_pages
         self.max_depth = max_depth
         self.concurrency = concurrency
-        self.include_patterns = [re.compile(p) for p in include_patterns] if include_patterns else []
-        self.exclude_patterns = [re.compile(p) for p in exclude_patterns] if exclude_patterns else []
-        self.use_cache = use_cache
+        self.include_pattern = (include_patterns if isinstance(include_patterns, re.Pattern)
+                                else compile_url_patterns(include_patterns))
+        self.exclude_pattern = (exclude_patterns if isinstance(exclude_patterns, re.Pattern)
+                                else compile_url_patterns(exclude_patterns))
         
         self.logger = logging.getLogger(__name__)
         
-        # Initialize the parallel validator
-        self.parallel_validator = ParallelValidator(
-            max_workers=concurrency,
-            use_cache=use_cache,
-            conformance_level=validator.conformance_level
-        )
-        
         # Initialize crawl state
         self.visited_urls = set()
-        self.queue = queue.Queue()
+        self.seen_urls = set()
         self.results = {}
     
     def crawl(self, start_url: str) -> Dict[str, WCAGReporter]:
         """
         Crawl a website and validate all pages.
         
+        The site is crawled breadth-first, one depth level at a time. The
+        pages of a level are fetched concurrently (I/O-bound) and then
+        validated in a process pool (CPU-bound).
+        
         Args:
             start_url: URL to start crawling from
             
@@ -309,101 +676,84 @@ class WebsiteCrawler:
             Dictionary mapping URLs to WCAGReporter objects
         """
         self.visited_urls = set()
-        self.queue = queue.Queue()
+        self.seen_urls = set()
         self.results = {}
         
         # Parse the start URL to get the domain
+        start_url = normalize_url(start_url)
         parsed_url = urlparse(start_url)
         self.domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
-        # Add the start URL to the queue with depth 0
-        self.queue.put((start_url, 0))
-        
-        # Create worker threads
-        workers = []
-        for _ in range(self.concurrency):
-            t = threading.Thread(target=self._crawl_worker)
-            t.daemon = True
-            workers.append(t)
-            t.start()
-        
-        # Wait for the queue to be processed
-        self.queue.join()
-        
-        # Stop worker threads
-        for _ in range(self.concurrency):
-            self.queue.put((None, None))  # Signal threads to exit
+        self.seen_urls.add(start_url)
+        frontier = [start_url]
         
-        for t in workers:
-            t.join()
-        
-        return self.results
-    
-    def _crawl_worker(self) -> None:
-        """
-        Worker thread for crawling pages.
-        """
-        while True:
-            # Get a URL from the queue
-            url, depth = self.queue.get()
-            
-            # Check for exit signal
-            if url is None:
-                self.queue.task_done()
-                break
-            
-            try:
-                # Skip if we've already visited this URL or reached max pages
-                if url in self.visited_urls or len(self.visited_urls) >= self.max_pages:
-                    self.queue.task_done()
-                    continue
-                
-                # Mark as visited
-                self.visited_urls.add(url)
-                
-                # Fetch and validate the page
-                self.logger.info(f"Crawling {url} (depth {depth})")
+        with create_validator_process_pool(self.validator) as executor:
+            for depth in range(self.max_depth + 1):
+                # Only fetch as many pages as are left in the budget
+                frontier = frontier[:self.max_pages - len(self.visited_urls)]
+                if not frontier:
+                    break
                 
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                html_content = response.text
+                for url in frontier:
+                    self.logger.info(f"Crawling {url} (depth {depth})")
+                self.visited_urls.update(frontier)
                 
-                # Validate the page
-                reporter = self.validator.validate_html(html_content, url)
+                pages = fetch_pages(frontier, concurrency=self.concurrency * 4)
                 
-                # Store the result
-                with threading.Lock():
-                    self.results[url] = reporter
+                future_to_url = {}
+                next_frontier = []
+                for url in frontier:
+                    html_content = pages[url]
+                    if isinstance(html_content, Exception):
+                        self._add_error_result(url, html_content)
+                        continue
+                    
+                    future_to_url[executor.submit(_validate_html_in_process, html_content, url)] = url
+                    
+                    # If we haven't reached max depth, extract links for the next level
+                    if depth < self.max_depth:
+                        next_frontier.extend(self._extract_links(url, html_content))
                 
-                # If we haven't reached max depth, extract links and add to queue
-                if depth < self.max_depth:
-                    self._extract_links(url, html_content, depth + 1)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing {url}: {e}")
-                
-                # Create a reporter with the error
-                reporter = WCAGReporter()
-                reporter.url = url
-                reporter.add_error("N/A", str(e))
+                for future, url in future_to_url.items():
+                    try:
+                        self.results[url] = future.result()
+                    except Exception as e:
+                        self._add_error_result(url, e)
                 
-                with threading.Lock():
-                    self.results[url] = reporter
-            
-            finally:
-                self.queue.task_done()
+                frontier = next_frontier
+        
+        return self.results
     
-    def _extract_links(self, base_url: str, html_content: str, next_depth: int) -> None:
+    def _add_error_result(self, url: str, error: Exception) -> None:
         """
-        Extract links from a page and add them to the crawl queue.
+        Record a page that could not be fetched or validated.
+        
+        Args:
+            url: URL of the page
+            error: Exception that occurred
+        """
+        self.logger.error(f"Error processing {url}: {error}")
+        
+        # Create a reporter with the error
+        reporter = WCAGReporter()
+        reporter.url = url
+        reporter.add_error("N/A", str(error))
+        self.results[url] = reporter
+    
+    def _extract_links(self, base_url: str, html_content: str) -> List[str]:
+        """
+        Extract links from a page that have not been seen yet.
         
         Args:
             base_url: Base URL for resolving relative links
             html_content: HTML content to extract links from
-            next_depth: Depth for the extracted links
+            
+        Returns:
+            List of new URLs to crawl
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, self.validator.parser)
         links = soup.find_all('a', href=True)
+        new_urls = []
         
         for link in links:
             href = link['href']
@@ -412,8 +762,12 @@ class WebsiteCrawler:
             if not href or href.startswith('#') or href.startswith('javascript:') or href.startswith('mailto:'):
                 continue
             
-            # Resolve relative URLs
-            absolute_url = urljoin(base_url, href)
+            # Resolve relative URLs, skipping malformed ones (e.g. invalid ports)
+            try:
+                absolute_url = normalize_url(urljoin(base_url, href))
+            except ValueError as e:
+                self.logger.debug(f"Skipping malformed link {href!r} on {base_url}: {e}")
+                continue
             
             # Skip URLs from other domains
             parsed_url = urlparse(absolute_url)
@@ -421,19 +775,21 @@ class WebsiteCrawler:
                 continue
             
             # Skip URLs that don't match include patterns
-            if self.include_patterns and not any(pattern.search(absolute_url) for pattern in self.include_patterns):
+            if self.include_pattern and not self.include_pattern.search(absolute_url):
                 continue
             
             # Skip URLs that match exclude patterns
-            if self.exclude_patterns and any(pattern.search(absolute_url) for pattern in self.exclude_patterns):
+            if self.exclude_pattern and self.exclude_pattern.search(absolute_url):
                 continue
             
             # Skip URLs we've already visited or queued
-            if absolute_url in self.visited_urls:
+            if absolute_url in self.seen_urls:
                 continue
+            self.seen_urls.add(absolute_url)
             
-            # Add the URL to the queue
-            self.queue.put((absolute_url, next_depth))
+            new_urls.append(absolute_url)
+        
+        return new_urls
 
 
 class BatchProcessor:
@@ -506,16 +862,17 @@ class BatchProcessor:
             batch = file_paths[i:i + self.batch_size]
             self.logger.info(f"Processing batch {i // self.batch_size + 1}/{(total_files + self.batch_size - 1) // self.batch_size}")
             
-            # Load HTML content for all files in the batch
+            # Load HTML content for all files in the batch, reading them concurrently
             pages = []
-            for file_path in batch:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as readers:
+                read_futures = [readers.submit(read_html_file, file_path) for file_path in batch]
+            
+            for file_path, read_future in zip(batch, read_futures):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                        pages.append({
-                            'html': html_content,
-                            'url': f"file://{os.path.abspath(file_path)}"
-                        })
+                    pages.append({
+                        'html': read_future.result(),
+                        'url': f"file://{os.path.abspath(file_path)}"
+                    })
                 except Exception as e:
                     self.logger.error(f"Error reading file {file_path}: {e}")
                     # Create a reporter with the error
@@ -548,25 +905,8 @@ class BatchProcessor:
         aggregated = WCAGReporter()
         
         for url, reporter in results.items():
-            # Add all issues from this reporter
-            for issue in reporter.issues:
-                # Add a note about which file this came from
-                augmented_issue = ValidationIssue(
-                    criterion_id=issue.criterion_id,
-                    criterion_name=issue.criterion_name,
-                    level=issue.level,
-                    element_path=issue.element_path,
-                    element_html=issue.element_html,
-                    line_number=issue.line_number,
-                    column_number=issue.column_number,
-                    issue_type=issue.issue_type,
-                    description=f"[{url}] {issue.description}",
-                    impact=issue.impact,
-                    how_to_fix=issue.how_to_fix,
-                    code_solution=issue.code_solution,
-                    ref_url=issue.ref_url
-                )
-                aggregated.add_issue(augmented_issue)
+            # Add all issues from this reporter, noting which file they came from
+            aggregated.add_issues([dataclasses.replace(issue, source_url=url) for issue in reporter.issues])
             
             # Add all errors from this reporter
             for criterion_id, error_message in reporter.errors.items():
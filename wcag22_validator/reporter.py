@@ -2,14 +2,24 @@
 Reporter module for WCAG 2.2 validation results.
 """
 
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Union
+from dataclasses import dataclass, fields
 import json
+import sys
 from collections import defaultdict
 import html as html_escape_module  # Alias to avoid conflict
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, the json module is used instead
+    orjson = None
 
-@dataclass
+
+# Reports can hold tens of thousands of issues, so use __slots__ where supported
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationIssue:
     """
     Represents a WCAG validation issue.
@@ -18,15 +28,97 @@ class ValidationIssue:
     criterion_name: str  # e.g., 'Non-text Content'
     level: str  # 'A', 'AA', or 'AAA'
     element_path: str  # XPath or CSS selector to identify the element
-    element_html: str  # HTML snippet of the element
+    element_html: Union[str, Callable[[], str]]  # HTML snippet of the element, see _LazyText
     line_number: Optional[int] = None
     column_number: Optional[int] = None
     issue_type: str = "error"  # 'error', 'warning', or 'info'
     description: str = ""  # Description of the issue
     impact: str = "serious"  # 'critical', 'serious', 'moderate', or 'minor'
     how_to_fix: str = ""  # Guide on how to fix the issue
-    code_solution: str = ""  # Example code solution
+    code_solution: Union[str, Callable[[], str]] = ""  # Example code solution, see _LazyText
     ref_url: str = ""  # URL to WCAG reference
+    source_url: Optional[str] = None  # Page the issue was found on, for multi-page reports
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert issue to dictionary.
+        
+        Returns:
+            Dictionary mapping field names to values.
+        """
+        return {name: getattr(self, name) for name in _ISSUE_FIELD_NAMES}
+    
+    def build_text(self):
+        """Build the text of fields set to callables, see _LazyText."""
+        for name in _LAZY_FIELD_NAMES:
+            getattr(self, name)
+    
+    def __getstate__(self) -> Dict:
+        """Pickle and copy issues with lazy fields resolved to text."""
+        return self.to_dict()
+    
+    def __setstate__(self, state: Dict):
+        """Restore an issue from the state made by __getstate__."""
+        if isinstance(state, tuple):
+            # (__dict__, slots) state of issues pickled by earlier versions
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class _LazyText:
+    """
+    Descriptor for a text field that may be set to a callable instead.
+    
+    The callable is called when the field is first read and replaced by its
+    result, so text that is expensive to build (like element HTML and code
+    solutions) is only built for elements that have issues. Until then the
+    callable keeps its element, and so the whole parse tree, alive;
+    WCAGValidator.validate_html therefore builds all text before it returns.
+    Copying or pickling an issue builds all of its text as well.
+    """
+    
+    def __init__(self, name: str, slot=None):
+        """
+        Initialize the descriptor.
+        
+        Args:
+            name: Name of the field.
+            slot: Slot descriptor holding the value, or None if values are
+                kept in the instance __dict__.
+        """
+        self.name = name
+        self.slot = slot
+        
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner) if self.slot is not None else obj.__dict__[self.name]
+        if callable(value):
+            value = value()
+            self.__set__(obj, value)
+        return value
+    
+    def __set__(self, obj, value):
+        if self.slot is not None:
+            self.slot.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
+_ISSUE_FIELD_NAMES = tuple(field.name for field in fields(ValidationIssue))
+_LAZY_FIELD_NAMES = ('element_html', 'code_solution')
+
+# With __slots__ the class attribute is the slot descriptor, otherwise the default
+# if the field has one
+_element_html_slot = ValidationIssue.__dict__.get('element_html')
+ValidationIssue.element_html = _LazyText(
+    'element_html', _element_html_slot if hasattr(_element_html_slot, '__set__') else None
+)
+_code_solution_slot = ValidationIssue.__dict__['code_solution']
+ValidationIssue.code_solution = _LazyText(
+    'code_solution', _code_solution_slot if hasattr(_code_solution_slot, '__set__') else None
+)
 
 
 class WCAGReporter:
@@ -60,6 +152,15 @@ class WCAGReporter:
         """
         self.issues.append(issue)
         
+    def add_issues(self, issues: List[ValidationIssue]):
+        """
+        Add several validation issues at once.
+        
+        Args:
+            issues: The validation issues to add.
+        """
+        self.issues.extend(issues)
+        
     def add_error(self, criterion_id: str, error_message: str):
         """
         Add an error that occurred during validation.
@@ -70,6 +171,21 @@ class WCAGReporter:
         """
         self.errors[criterion_id] = error_message
         
+    def _group_issues(self, field: str) -> Dict[str, List[ValidationIssue]]:
+        """
+        Group the current issues by one of their fields.
+        
+        Args:
+            field: Name of the ValidationIssue field to group by.
+            
+        Returns:
+            Dictionary mapping field values to new lists of issues.
+        """
+        groups = defaultdict(list)
+        for issue in self.issues:
+            groups[getattr(issue, field)].append(issue)
+        return dict(groups)
+        
     def get_issues_by_impact(self) -> Dict[str, List[ValidationIssue]]:
         """
         Group issues by impact level.
@@ -77,10 +193,7 @@ class WCAGReporter:
         Returns:
             Dictionary mapping impact level to list of issues.
         """
-        result = defaultdict(list)
-        for issue in self.issues:
-            result[issue.impact].append(issue)
-        return dict(result)
+        return self._group_issues('impact')
         
     def get_issues_by_criterion(self) -> Dict[str, List[ValidationIssue]]:
         """
@@ -89,10 +202,7 @@ class WCAGReporter:
         Returns:
             Dictionary mapping criterion ID to list of issues.
         """
-        result = defaultdict(list)
-        for issue in self.issues:
-            result[issue.criterion_id].append(issue)
-        return dict(result)
+        return self._group_issues('criterion_id')
         
     def get_issues_by_level(self) -> Dict[str, List[ValidationIssue]]:
         """
@@ -101,10 +211,7 @@ class WCAGReporter:
         Returns:
             Dictionary mapping conformance level to list of issues.
         """
-        result = defaultdict(list)
-        for issue in self.issues:
-            result[issue.level].append(issue)
-        return dict(result)
+        return self._group_issues('level')
     
     @property
     def has_issues(self) -> bool:
@@ -147,16 +254,16 @@ class WCAGReporter:
             "url": self.url,
             "total_issues": self.total_issues,
             "issues_by_impact": {
-                impact: [issue.__dict__ for issue in issues]
-                for impact, issues in self.get_issues_by_impact().items()
+                impact: [issue.to_dict() for issue in issues]
+                for impact, issues in self._group_issues('impact').items()
             },
             "issues_by_criterion": {
-                criterion: [issue.__dict__ for issue in issues]
-                for criterion, issues in self.get_issues_by_criterion().items()
+                criterion: [issue.to_dict() for issue in issues]
+                for criterion, issues in self._group_issues('criterion_id').items()
             },
             "issues_by_level": {
-                level: [issue.__dict__ for issue in issues]
-                for level, issues in self.get_issues_by_level().items()
+                level: [issue.to_dict() for issue in issues]
+                for level, issues in self._group_issues('level').items()
             },
             "errors": self.errors,
             "execution_time": self.execution_time
@@ -166,10 +273,37 @@ class WCAGReporter:
         """
         Convert report to JSON.
         
+        Uses orjson when it is installed, the json module otherwise. Both
+        write non-ASCII characters as is rather than as escapes.
+        
         Returns:
             JSON string representation of the report.
         """
-        return json.dumps(self.to_dict(), indent=2)
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+    
+    def iter_json(self) -> Iterator[str]:
+        """
+        Convert report to JSON in chunks.
+        
+        Yields:
+            Consecutive parts of the JSON representation of the report.
+        """
+        yield from json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(self.to_dict())
+    
+    def iter_json_bytes(self) -> Iterator[bytes]:
+        """
+        Convert report to UTF-8 encoded JSON in chunks.
+        
+        Always uses the chunked json encoder, even when orjson is installed,
+        so the encoded report is never held in memory whole.
+        
+        Yields:
+            Consecutive parts of the JSON representation of the report.
+        """
+        for chunk in self.iter_json():
+            yield chunk.encode('utf-8')
         
     def to_html(self) -> str:
         """
@@ -178,7 +312,16 @@ class WCAGReporter:
         Returns:
             HTML string representation of the report.
         """
-        html = f"""
+        return "".join(self.iter_html())
+        
+    def iter_html(self) -> Iterator[str]:
+        """
+        Generate an HTML report in chunks.
+        
+        Yields:
+            Consecutive parts of the HTML report.
+        """
+        yield f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -244,30 +387,30 @@ class WCAGReporter:
         """
         
         if self.has_errors:
-            html += f"""
+            yield f"""
             <div class="errors">
                 <h2>Validation Errors</h2>
                 <p>The following errors occurred during validation:</p>
                 <ul>
             """
             for criterion_id, error_message in self.errors.items():
-                html += f"<li><strong>{criterion_id}:</strong> {html_escape_module.escape(error_message)}</li>"
-            html += "</ul></div>"
+                yield f"<li><strong>{criterion_id}:</strong> {html_escape_module.escape(error_message)}</li>"
+            yield "</ul></div>"
         
         # Group by impact
         impacts = ["critical", "serious", "moderate", "minor"]
-        issues_by_impact = self.get_issues_by_impact()
+        issues_by_impact = self._group_issues('impact')
         
-        html += '<div class="issues"><h2>Issues by Impact</h2>'
+        yield '<div class="issues"><h2>Issues by Impact</h2>'
         
         for i, impact in enumerate(impacts):
             if impact in issues_by_impact:
-                html += f'<h3>{impact.capitalize()} Impact ({len(issues_by_impact[impact])} issues)</h3>'
+                yield f'<h3>{impact.capitalize()} Impact ({len(issues_by_impact[impact])} issues)</h3>'
                 
                 for j, issue in enumerate(issues_by_impact[impact]):
                     issue_id = f"issue-{i}-{j}"
                     
-                    html += f"""
+                    yield f"""
                     <div class="issue {impact} issue-{issue_id}">
                         <h4>
                             <a href="{issue.ref_url}" target="_blank">
@@ -275,6 +418,12 @@ class WCAGReporter:
                             </a>
                         </h4>
                         <p><strong>Description:</strong> {html_escape_module.escape(issue.description)}</p>
+                    """
+                    
+                    if issue.source_url:
+                        yield f'<p><strong>Page:</strong> {html_escape_module.escape(issue.source_url)}</p>'
+                    
+                    yield f"""
                         
                         <div class="tabs">
                             <button class="tab active" onclick="openTab(event, '{issue_id}-element', '{issue_id}')">Element</button>
@@ -292,7 +441,7 @@ class WCAGReporter:
                     """
                     
                     if issue.how_to_fix:
-                        html += f"""
+                        yield f"""
                         <div class="how-to-fix">
                             <p><strong>How to Fix:</strong></p>
                             <p>{html_escape_module.escape(issue.how_to_fix)}</p>
@@ -300,72 +449,79 @@ class WCAGReporter:
                         """
                         
                     if issue.code_solution:
-                        html += f"""
+                        yield f"""
                         <div class="code-solution">
                             <p><strong>Code Solution:</strong></p>
                             <pre>{html_escape_module.escape(issue.code_solution)}</pre>
                         </div>
                         """
                         
-                    html += "</div></div>"
+                    yield "</div></div>"
         
-        html += """
+        yield """
             </div>
         </body>
         </html>
         """
         
-        return html
-        
     def to_markdown(self) -> str:
         """
         Generate a Markdown report.
-        
+            
         Returns:
             Markdown string representation of the report.
         """
-        md = f"# WCAG 2.2 Validation Report\n\n"
+        return "".join(self.iter_markdown())
+        
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        Generate a Markdown report in chunks.
+        
+        Yields:
+            Consecutive parts of the Markdown report.
+        """
+        yield f"# WCAG 2.2 Validation Report\n\n"
         
-        md += "## Summary\n\n"
-        md += f"- **URL:** {self.url or 'N/A'}\n"
-        md += f"- **Total Issues:** {self.total_issues}\n"
-        md += f"- **Execution Time:** {self.execution_time:.2f} seconds\n\n"
+        yield "## Summary\n\n"
+        yield f"- **URL:** {self.url or 'N/A'}\n"
+        yield f"- **Total Issues:** {self.total_issues}\n"
+        yield f"- **Execution Time:** {self.execution_time:.2f} seconds\n\n"
         
         if self.has_errors:
-            md += "## Validation Errors\n\n"
-            md += "The following errors occurred during validation:\n\n"
+            yield "## Validation Errors\n\n"
+            yield "The following errors occurred during validation:\n\n"
             for criterion_id, error_message in self.errors.items():
-                md += f"- **{criterion_id}:** {error_message}\n"
-            md += "\n"
+                yield f"- **{criterion_id}:** {error_message}\n"
+            yield "\n"
         
         # Group by impact
         impacts = ["critical", "serious", "moderate", "minor"]
-        issues_by_impact = self.get_issues_by_impact()
+        issues_by_impact = self._group_issues('impact')
         
-        md += "## Issues by Impact\n\n"
+        yield "## Issues by Impact\n\n"
         
         for impact in impacts:
             if impact in issues_by_impact:
-                md += f"### {impact.capitalize()} Impact ({len(issues_by_impact[impact])} issues)\n\n"
+                yield f"### {impact.capitalize()} Impact ({len(issues_by_impact[impact])} issues)\n\n"
                 
                 for i, issue in enumerate(issues_by_impact[impact], 1):
-                    md += f"#### {i}. {issue.criterion_id} {issue.criterion_name} (Level {issue.level})\n\n"
-                    md += f"- **Description:** {issue.description}\n"
-                    md += f"- **Element:** {issue.element_path}\n"
-                    md += f"- **HTML:** `{issue.element_html}`\n"
+                    yield f"#### {i}. {issue.criterion_id} {issue.criterion_name} (Level {issue.level})\n\n"
+                    yield f"- **Description:** {issue.description}\n"
+                    if issue.source_url:
+                        yield f"- **Page:** {issue.source_url}\n"
+                    yield f"- **Element:** {issue.element_path}\n"
+                    yield f"- **HTML:** `{issue.element_html}`\n"
                     
                     if issue.how_to_fix:
-                        md += f"- **How to Fix:** {issue.how_to_fix}\n"
+                        yield f"- **How to Fix:** {issue.how_to_fix}\n"
                         
                     if issue.code_solution:
-                        md += f"- **Code Solution:**\n\n```html\n{issue.code_solution}\n```\n"
+                        yield f"- **Code Solution:**\n\n```html\n{issue.code_solution}\n```\n"
                         
                     if issue.ref_url:
-                        md += f"- **Reference:** [{issue.criterion_id} {issue.criterion_name}]({issue.ref_url})\n"
+                        yield f"- **Reference:** [{issue.criterion_id} {issue.criterion_name}]({issue.ref_url})\n"
                         
-                    md += "\n"
-        
-        return md
+                    yield "\n"
     
     def summary(self) -> str:
         """
@@ -374,8 +530,8 @@ class WCAGReporter:
         Returns:
             String containing a summary of issues.
         """
-        issues_by_level = self.get_issues_by_level()
-        issues_by_impact = self.get_issues_by_impact()
+        issues_by_level = self._group_issues('level')
+        issues_by_impact = self._group_issues('impact')
         
         summary = "WCAG 2.2 Validation Summary\n"
         summary += "=========================\n\n"
@@ -3,16 +3,70 @@ Main validator module for WCAG 2.2 validation.
 """
 
 import logging
-from typing import Dict, List, Optional, Union, Set
+from typing import Dict, List, Optional, Union, Set, Tuple
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
 import importlib
 import os
 from pathlib import Path
 import re
 import inspect
+import threading
+
+try:
+    import xxhash
+except ImportError:  # Optional dependency, hashlib is used instead
+    xxhash = None
 
 from bs4 import BeautifulSoup
 from .reporter import WCAGReporter, ValidationIssue
-from .criteria import BaseCriterion
+from .criteria import BaseCriterion, document_cache
+
+
+# Number of characters encoded at a time when hashing HTML content
+HASH_CHUNK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def load_all_criteria() -> Tuple[BaseCriterion, ...]:
+    """
+    Import all criteria modules and create one instance of each criterion.
+    
+    Criteria are stateless, so the instances are created once per process
+    and shared by all validators.
+    
+    Returns:
+        Tuple of criterion instances.
+    """
+    logger = logging.getLogger(__name__)
+    criteria = []
+    
+    # Get the directory where criteria modules are located
+    criteria_dir = Path(__file__).parent / "criteria"
+    module_pattern = re.compile(r'criterion_(\d+)_(\d+)_(\d+)\.py$')
+    
+    for module_file in criteria_dir.glob("*.py"):
+        if not module_pattern.match(module_file.name):
+            continue
+        
+        # Import the module
+        module_name = f".criteria.{module_file.stem}"
+        try:
+            module = importlib.import_module(module_name, package="wcag22_validator")
+            
+            # Find and instantiate criterion classes
+            for name, obj in inspect.getmembers(module):
+                if (inspect.isclass(obj) and issubclass(obj, BaseCriterion) and
+                        obj.__name__ != 'BaseCriterion'):
+                    
+                    criteria.append(obj())
+                    
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Error loading criterion module {module_name}: {e}")
+    
+    return tuple(criteria)
 
 
 class WCAGValidator:
@@ -27,7 +81,9 @@ class WCAGValidator:
                  conformance_level: str = "AA", 
                  criteria_to_include: Optional[List[str]] = None,
                  criteria_to_exclude: Optional[List[str]] = None,
-                 log_level: int = logging.INFO):
+                 log_level: int = logging.INFO,
+                 cache_size: int = 0,
+                 parser: str = 'html.parser'):
         """
         Initialize the WCAG validator.
         
@@ -36,10 +92,21 @@ class WCAGValidator:
             criteria_to_include: List of specific criteria to include (e.g., ['1.1.1', '1.3.5']).
             criteria_to_exclude: List of specific criteria to exclude.
             log_level: Logging level.
+            cache_size: Number of results to keep in the in-memory cache keyed by
+                HTML content (0 disables caching). Results are copied into and
+                out of the cache, which builds the element HTML and code
+                solutions of all their issues up front.
+            parser: BeautifulSoup parser, 'html.parser' or 'lxml'. lxml is much faster,
+                but records no line numbers, so those of issues are estimated.
         """
         self.conformance_level = conformance_level.upper()
         self.criteria_to_include = criteria_to_include
         self.criteria_to_exclude = criteria_to_exclude
+        self.cache_size = cache_size
+        
+        # Content hash -> reporter, least recently used first
+        self._result_cache: "OrderedDict[str, WCAGReporter]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
         # Set up logging
         self.logger = logging.getLogger(__name__)
@@ -50,24 +117,37 @@ class WCAGValidator:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
         
+        # lxml is optional, fall back to the built-in parser when it is missing
+        self.parser = parser
+        if self.parser == 'lxml':
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                self.logger.error("lxml not installed. Please install lxml to use this parser.")
+                self.parser = 'html.parser'
+        
         # Initialize reporter
         self.reporter = WCAGReporter()
         
         # Load criteria
         self.criteria = self._load_criteria()
         
+        # Case-insensitive search for the opening tags each criterion needs
+        self._required_tag_patterns = {
+            criterion.id: re.compile("|".join(f"<{re.escape(tag)}" for tag in criterion.REQUIRED_TAGS),
+                                     re.IGNORECASE)
+            for criterion in self.criteria if criterion.REQUIRED_TAGS
+        }
+        
     def _load_criteria(self) -> List[BaseCriterion]:
         """
-        Load all criteria modules based on the specified conformance level.
+        Select the criteria to run for the specified conformance level.
         
         Returns:
             List of initialized criteria objects.
         """
         criteria = []
         
-        # Get the directory where criteria modules are located
-        criteria_dir = Path(__file__).parent / "criteria"
-        
         # Define which levels to include based on conformance level
         levels_to_include = []
         if self.conformance_level == "A":
@@ -80,46 +160,18 @@ class WCAGValidator:
             self.logger.warning(f"Invalid conformance level: {self.conformance_level}. Defaulting to AA.")
             levels_to_include = ["A", "AA"]
         
-        # Walk through criteria modules and import them
-        module_pattern = re.compile(r'criterion_(\d+)_(\d+)_(\d+)\.py$')
-        
-        for module_file in criteria_dir.glob("*.py"):
-            if module_file.name == "__init__.py" or module_file.name == "base.py":
-                continue
-                
-            # Extract criterion identifier (e.g., 1.1.1) from filename
-            match = module_pattern.match(module_file.name)
-            if not match:
-                continue
-                
-            criterion_id = f"{match.group(1)}.{match.group(2)}.{match.group(3)}"
-            
+        for criterion in load_all_criteria():
             # Check if we should include this criterion
-            if self.criteria_to_include and criterion_id not in self.criteria_to_include:
+            if self.criteria_to_include and criterion.id not in self.criteria_to_include:
                 continue
                 
-            if self.criteria_to_exclude and criterion_id in self.criteria_to_exclude:
+            if self.criteria_to_exclude and criterion.id in self.criteria_to_exclude:
                 continue
             
-            # Import the module
-            module_name = f".criteria.{module_file.stem}"
-            try:
-                module = importlib.import_module(module_name, package="wcag22_validator")
-                
-                # Find and instantiate criterion classes
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and issubclass(obj, BaseCriterion) and
-                            obj.__name__ != 'BaseCriterion'):
-                        
-                        criterion = obj()
-                        
-                        # Check if this criterion's level is included in our target conformance level
-                        if criterion.level in levels_to_include:
-                            criteria.append(criterion)
-                            self.logger.debug(f"Loaded criterion: {criterion.id} ({criterion.level})")
-                        
-            except (ImportError, AttributeError) as e:
-                self.logger.error(f"Error loading criterion module {module_name}: {e}")
+            # Check if this criterion's level is included in our target conformance level
+            if criterion.level in levels_to_include:
+                criteria.append(criterion)
+                self.logger.debug(f"Loaded criterion: {criterion.id} ({criterion.level})")
         
         self.logger.info(f"Loaded {len(criteria)} criteria for conformance level {self.conformance_level}")
         return criteria
@@ -135,26 +187,96 @@ class WCAGValidator:
         Returns:
             Reporter object containing validation results.
         """
-        self.reporter.clear()
-        self.reporter.url = page_url
+        # Pages with identical content (shared templates, reruns) are only validated once
+        cache_key = self._get_cache_key(html_content) if self.cache_size > 0 else None
+        if cache_key is not None:
+            with self._result_cache_lock:
+                cached_reporter = self._result_cache.get(cache_key)
+                if cached_reporter is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    
+            if cached_reporter is not None:
+                self.logger.debug(f"Using cached results for {page_url or 'HTML content'}")
+                reporter = self._copy_reporter(cached_reporter, page_url)
+                self.reporter = reporter
+                return reporter
         
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Use a fresh local reporter so results of earlier calls are not
+        # overwritten and concurrent calls from other threads don't mix
+        reporter = WCAGReporter()
+        reporter.url = page_url
         
-        # Run each criterion's validation
-        for criterion in self.criteria:
-            try:
-                self.logger.debug(f"Validating criterion {criterion.id}: {criterion.name}")
-                issues = criterion.validate(soup, html_content)
+        # Parse HTML, recording source line numbers for issue reporting
+        soup = BeautifulSoup(html_content, self.parser, store_line_numbers=True)
+        
+        # Run each criterion's validation, sharing per-document caches between them
+        with document_cache(soup):
+            for criterion in self.criteria:
+                # Skip criteria whose elements cannot occur in this page
+                required_tags = self._required_tag_patterns.get(criterion.id)
+                if required_tags is not None and not required_tags.search(html_content):
+                    self.logger.debug(f"Skipping criterion {criterion.id}: no relevant elements")
+                    continue
                 
-                for issue in issues:
-                    self.reporter.add_issue(issue)
-                    
-            except Exception as e:
-                self.logger.error(f"Error validating criterion {criterion.id}: {e}")
-                self.reporter.add_error(criterion.id, str(e))
+                try:
+                    self.logger.debug(f"Validating criterion {criterion.id}: {criterion.name}")
+                    reporter.add_issues(criterion.validate(soup, html_content))
+                        
+                except Exception as e:
+                    self.logger.error(f"Error validating criterion {criterion.id}: {e}")
+                    reporter.add_error(criterion.id, str(e))
+            
+            # Build lazy text while the document's memo is active, so the
+            # returned issues don't keep the parse tree alive
+            for issue in reporter.issues:
+                issue.build_text()
         
-        return self.reporter
+        if cache_key is not None:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = self._copy_reporter(reporter, page_url)
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > self.cache_size:
+                    self._result_cache.popitem(last=False)
+        
+        # Kept for callers reading the most recent result from the validator
+        self.reporter = reporter
+        return reporter
+    
+    @staticmethod
+    def _get_cache_key(html_content: str) -> str:
+        """
+        Hash HTML content for the result cache.
+        
+        Args:
+            html_content: HTML content to hash.
+            
+        Returns:
+            Hex digest of the content.
+        """
+        digest = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+        
+        # Encode in slices so large pages are never copied whole
+        for start in range(0, len(html_content), HASH_CHUNK_SIZE):
+            digest.update(html_content[start:start + HASH_CHUNK_SIZE].encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _copy_reporter(reporter: WCAGReporter, page_url: Optional[str]) -> WCAGReporter:
+        """
+        Copy a reporter so cached results cannot be changed through the copy.
+        
+        Args:
+            reporter: Reporter to copy.
+            page_url: URL to set on the copy.
+            
+        Returns:
+            New reporter with copies of the issues and errors.
+        """
+        result = WCAGReporter()
+        result.url = page_url
+        result.issues = [copy.copy(issue) for issue in reporter.issues]
+        result.errors = dict(reporter.errors)
+        return result
     
     def validate_file(self, file_path: str) -> WCAGReporter:
         """